@@ -0,0 +1,66 @@
+# Micro benchmarks
+import os
+import tracemalloc
+from timeit import Timer
+
+# Measurements taken so far, written out by `python -m benchmarks --json`
+results = list[dict]()
+
+# Largest container size (as a power of 10) used by the benchmarks
+MAX_EXPONENT = int(os.environ.get("BENCH_MAX_EXPONENT", 7))
+
+
+def measure(fn: callable, *args, repeat: int = 5, **kwargs) -> float:
+    """Best time per call in nanoseconds"""
+    timer = Timer(lambda: fn(*args, **kwargs))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number * 1e9
+
+
+def allocations(fn: callable, *args, **kwargs) -> int:
+    """Peak memory allocated by a single call, in bytes"""
+    tracemalloc.start()
+    try:
+        fn(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def failing(fn: callable) -> callable:
+    """Wraps fn such that failed checks are discarded (typeguard errors are not TypeErrors)"""
+
+    def call(*args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        except Exception:
+            return None
+
+    return call
+
+
+def record(case: str, target: str, ns: float, peak: int | None = None):
+    results.append(dict(case=case, target=target, ns=ns, ops=1e9 / ns, peak_bytes=peak))
+
+
+def report(title: str, baseline: float, **timings: float):
+    record(title, "baseline", baseline)
+    print(f"{title}: {baseline:8.0f} ns")
+    for name, t in timings.items():
+        record(title, name, t)
+        print(f"  {name:<30} {t:8.0f} ns  (+{t - baseline:.0f} ns, x{t / baseline:.1f})")
+
+
+def compare(case: str, **targets: "callable | None"):
+    """Ops/sec and peak allocations of each target, None marks a skipped target"""
+    print(case)
+    for name, fn in targets.items():
+        if fn is None:
+            print(f"  {name:<30} {'skipped':>14}")
+            continue
+        repeat = 5 if measure(fn, repeat=1) < 1e8 else 1  # Slower than 0.1s
+        ns = measure(fn, repeat=repeat)
+        peak = allocations(fn)
+        record(case, name, ns, peak)
+        print(f"  {name:<30} {1e9 / ns:14,.1f} ops/s {peak:14,d} B")
@@ -0,0 +1,55 @@
+import sys
+import json
+import platform
+from argparse import ArgumentParser
+from pathlib import Path
+from importlib import import_module
+
+from . import results
+
+parser = ArgumentParser("python -m benchmarks")
+parser.add_argument("names", nargs="*", help="benchmarks to run (default: all)")
+parser.add_argument("--json", type=Path, help="write results to this file")
+parser.add_argument("--compare", type=Path, help="compare against results of a previous --json run")
+parser.add_argument("--threshold", type=float, default=0.2, help="slowdown reported as regression (default: 0.2)")
+args = parser.parse_args()
+
+benchmarks: list[str] = []
+
+for bench in Path(__file__).parent.glob("*.py"):
+    if not bench.is_file() or bench.name.startswith("__"):
+        continue
+    if len(args.names) > 0 and bench.stem not in args.names:
+        continue
+    benchmarks.append(bench.stem)
+
+benchmarks.sort()
+
+for bench in benchmarks:
+    title = f" {bench} "
+    pad = "=" * (60 - len(title))
+    print(pad[: len(pad) // 2] + title + pad[len(pad) // 2 :])
+    start = len(results)
+    import_module(f".{bench}", package="benchmarks")
+    for result in results[start:]:
+        result["benchmark"] = bench
+
+if args.json is not None:
+    meta = dict(python=platform.python_version(), implementation=platform.python_implementation(), machine=platform.machine())
+    args.json.write_text(json.dumps(dict(meta=meta, results=results), indent=2))
+
+if args.compare is not None:
+    key = lambda r: (r["benchmark"], r["case"], r["target"])
+    baseline = {key(r): r for r in json.loads(args.compare.read_text())["results"]}
+    regressions = 0
+    print("=" * 22 + f" vs {args.compare.name} ".ljust(38, "="))
+    for result in results:
+        before = baseline.get(key(result), None)
+        if before is None:
+            continue
+        ratio = result["ns"] / before["ns"]
+        regressed = ratio > 1 + args.threshold
+        regressions += regressed
+        flag = "REGRESSION" if regressed else ""
+        print(f"{' / '.join(key(result)):<60} x{ratio:5.2f} {flag}")
+    sys.exit(1 if regressions > 0 else 0)
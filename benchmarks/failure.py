@@ -0,0 +1,13 @@
+# Cost of failed checks whose offending value is large
+from . import measure, report
+from type_check import compile
+
+payload = {"rows": list(range(100_000))}
+check = compile(dict[str, int])
+
+report(
+    "check(payload)",
+    measure(check, payload),
+    with_reason=measure(lambda: check(payload).reason),
+    retain_summary=measure(check, payload, retain="summary"),
+)
@@ -0,0 +1,65 @@
+# Per-call overhead of @type_guard versus an unguarded call
+from . import measure, report
+from type_check import type_guard
+
+
+def plain(x: int, y: float = 1.0, *rest: int, scale: float = 1.0) -> float:
+    return x * y
+
+
+guarded = type_guard(plain)
+
+
+def plain_list(items: list[int]) -> int:
+    return len(items)
+
+
+guarded_list = type_guard(plain_list)
+items = list(range(100))
+
+report(
+    "plain(1, 2.0)",
+    measure(plain, 1, 2.0),
+    guarded=measure(guarded, 1, 2.0),
+    guarded_with_varargs=measure(guarded, 1, 2.0, 3, 4, scale=2.0),
+)
+report(
+    "plain_list(list[int] of 100)",
+    measure(plain_list, items),
+    guarded=measure(guarded_list, items),
+)
+
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class Plain(Generic[T]):
+    x: T
+    y: int = 0
+
+
+@type_guard
+@dataclass
+class Guarded(Generic[T]):
+    x: T
+    y: int = 0
+
+
+report(
+    "Plain(x=1)",
+    measure(Plain, x=1),
+    guarded=measure(Guarded, x=1),
+)
+report(
+    "Plain[int](x=1)",
+    measure(lambda: Plain[int](x=1)),
+    guarded=measure(lambda: Guarded[int](x=1)),
+)
+report(
+    "Plain.y (class attribute)",
+    measure(lambda: Plain.y),
+    guarded=measure(lambda: Guarded.y),
+)
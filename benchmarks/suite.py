@@ -0,0 +1,107 @@
+# rttc versus typeguard across realistic shapes
+# Run with BENCH_MAX_EXPONENT=5 for a quicker pass
+from . import compare, failing, MAX_EXPONENT
+from type_check import type_check, type_assert, type_guard
+
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+try:  # typeguard is optional
+    from typeguard import check_type, typechecked, CollectionCheckStrategy
+
+    def typeguard_check(value, hint):
+        # typeguard checks only the first item of containers by default
+        return check_type(value, hint, collection_check_strategy=CollectionCheckStrategy.ALL_ITEMS)
+
+except ImportError:  # pragma: no cover
+    typeguard_check = typechecked = None
+
+# typeguard is skipped beyond this size, it checks roughly 1M items per second
+TYPEGUARD_MAX_SIZE = 10**5
+
+
+def targets(value, hint, fails: bool = False, typeguard: bool = True) -> dict:
+    wrap = failing if fails else (lambda fn: fn)
+    tg = typeguard and typeguard_check is not None
+    return {
+        "rttc.type_check": lambda: type_check(value, hint),
+        "rttc.type_assert": wrap(lambda: type_assert(value, hint)),
+        "typeguard.check_type": wrap(lambda: typeguard_check(value, hint)) if tg else None,
+    }
+
+
+# Flat containers of primitives
+for exponent in range(2, MAX_EXPONENT + 1):
+    items = list(range(10**exponent))
+    compare(f"list[int] of 10^{exponent}", **targets(items, list[int], typeguard=len(items) <= TYPEGUARD_MAX_SIZE))
+    del items
+
+# Nested containers
+table = {f"key{i}": [(float(j), str(j)) for j in range(100)] for i in range(100)}
+compare("dict[str, list[tuple[float, str]]] of 100x100", **targets(table, dict[str, list[tuple[float, str]]]))
+del table
+
+# Wide unions
+classes = [type(f"C{i}", (), {}) for i in range(16)]
+Wide = classes[0]
+for cls in classes[1:]:
+    Wide = Wide | cls
+values = [cls() for cls in classes] * 64
+compare("list[C0 | ... | C15] of 1024", **targets(values, list[Wide]))
+Mixed = int | str | float | bytes | None | list[int]
+values = [1, "1", 1.0, b"1", None, [1]] * 1000
+compare("list[int | str | float | bytes | None | list[int]] of 6000", **targets(values, list[Mixed]))
+
+# Deep generic dataclass hierarchies
+T = TypeVar("T")
+U = TypeVar("U")
+
+
+@dataclass
+class Base(Generic[T]):
+    a: T
+
+
+@dataclass
+class Middle(Base[T], Generic[T, U]):
+    b: U
+
+
+@dataclass
+class Upper(Middle[int, U], Generic[U]):
+    c: list[U]
+
+
+@dataclass
+class Leaf(Upper[str]):
+    d: dict[str, int]
+
+
+leaves = [Leaf(a=i, b=str(i), c=["x"] * 4, d={"k": i}) for i in range(1000)]
+# Note: typeguard only checks isinstance() on dataclass instances, not their fields
+compare("list[Leaf] (4 generic levels) of 1000", **targets(leaves, list[Leaf]))
+
+# Failure heavy inputs
+records = [dict(id=i, name=str(i)) for i in range(1000)]
+records[-1]["id"] = "last"
+compare("dict failing at the last of 1000", **targets(records, list[dict[str, int | str] | dict[str, int]], fails=True))
+invalid = [[i, str(i)] for i in range(1000)]
+compare("1000 type_check() of failing list[int]", **{
+    "rttc.type_check": lambda: [type_check(v, list[int]) for v in invalid],
+    "typeguard.check_type": failing(lambda: [failing(typeguard_check)(v, list[int]) for v in invalid]) if typeguard_check else None,
+})
+
+
+# Guarded functions
+def plain(x: int, y: list[float], z: str = "") -> float:
+    return x + sum(y)
+
+
+guarded = type_guard(plain)
+typeguarded = typechecked(plain) if typechecked is not None else None
+args = (1, [1.0, 2.0, 3.0])
+compare("guarded call (int, list[float])", **{
+    "plain": lambda: plain(*args),
+    "rttc.type_guard": lambda: guarded(*args),
+    "typeguard.typechecked": (lambda: typeguarded(*args)) if typeguarded else None,
+})
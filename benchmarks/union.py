@@ -0,0 +1,33 @@
+# Union checks where the value matches the last arm
+from . import measure, report
+from type_check import compile
+
+
+class A0: pass
+class A1: pass
+class A2: pass
+class A3: pass
+class A4: pass
+class A5: pass
+class A6: pass
+class A7: pass
+
+
+Wide = A0 | A1 | A2 | A3 | A4 | A5 | A6 | A7
+Mixed = int | str | list[int] | list[str]
+
+check_wide = compile(Wide).type_assert
+check_mixed = compile(Mixed).type_assert
+last = A7()
+words = ["a", "b", "c"]
+
+report(
+    "isinstance(A7(), A7)",
+    measure(isinstance, last, A7),
+    wide_union_last_arm=measure(check_wide, last),
+)
+report(
+    "isinstance(list, list)",
+    measure(isinstance, words, list),
+    mixed_union_last_arm=measure(check_mixed, words),
+)
@@ -21,5 +21,5 @@ setup(
         "Programming Language :: Python :: 3.13",
     ],
     keywords="type check safe",
-    packages=find_packages(exclude=["tests"]),
+    packages=find_packages(exclude=["tests", "benchmarks"]),
 )
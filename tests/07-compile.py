@@ -0,0 +1,29 @@
+from typing import Literal, Optional, Union
+from . import Test, type_check, type_assert
+from type_check import compile
+
+# Compiled checkers can be hoisted out of hot loops
+DataType = list[tuple[float, str]]
+check = compile(DataType)
+
+Test(type_check, [(1.0, "hello rttc")], check) >> True
+Test(type_check, [(1, 2), [3.0, "4"]], check) >> False
+Test(check.type_check, [(1.0, "hello rttc")]) >> True
+Test(check.type_check, [(1.0, "hello rttc"), (2.0, None)]) >> False
+Test(check.type_assert, [(1.0, "hello rttc")]) >> True
+Test(check.type_assert, [(1.0, 2.0)]) >> False
+
+# Compiled checkers are cached by type hint
+Test(type_check, compile(DataType) is check, Literal[True]) >> True
+Test(type_check, compile(check) is check, Literal[True]) >> True
+
+# Unhashable type hints bypass the cache
+Test(type_check, [1], Literal[[1], [2]]) >> True
+Test(type_check, [3], Literal[[1], [2]]) >> False
+
+# Equal hints written in another order keep their own failure messages
+type_check(1.5, int | str)
+Test(type_check, type_check(1.5, Union[str, int]).reason, Literal["float(1.5) is not str | int"]) >> True
+type_check([1], list[None | str])
+Test(type_check, type_check([1], list[Optional[str]]).reason, Literal["list[0] = int(1) is not str | NoneType"]) >> True
+Test(type_check, compile(Union[str, int]) is compile(Union[str, int]), Literal[True]) >> True
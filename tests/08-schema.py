@@ -0,0 +1,56 @@
+from . import Test, type_check
+
+from typing import TypeVar, Generic
+from dataclasses import dataclass
+
+T = TypeVar("T")
+P = TypeVar("P")
+V = TypeVar("V")
+
+
+@dataclass
+class B(Generic[T, P]):
+    x: T
+    y: P
+
+
+@dataclass
+class C(B[T, P], Generic[T, P, V]):
+    z: V
+
+
+# Class schemas are resolved once and reused across instances
+records = [C(x=i, y=str(i), z=bool(i % 2)) for i in range(4)]
+Test(type_check, records, list[C[int, str, bool]]) >> True
+records.append(C(x=4, y=None, z=False))
+Test(type_check, records, list[C[int, str, bool]]) >> False
+
+
+# Redefined classes get a fresh schema
+@dataclass
+class D:
+    x: int
+
+
+Test(type_check, D(x=1), D) >> True
+Test(type_check, D(x="1"), D) >> False
+
+
+@dataclass
+class D:
+    x: str
+
+
+Test(type_check, D(x=1), D) >> False
+Test(type_check, D(x="1"), D) >> True
+
+
+# Type variables nested in field hints
+@dataclass
+class E(Generic[T]):
+    items: list[T]
+    index: dict[str, T]
+
+
+Test(type_check, E(items=[1], index={"a": 1}), E[int]) >> True
+Test(type_check, E(items=[1], index={"a": "1"}), E[int]) >> False
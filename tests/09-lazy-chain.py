@@ -0,0 +1,48 @@
+from . import Test, type_check, type_assert
+from typing import Literal
+from dataclasses import dataclass
+import tracemalloc
+
+# Paths are rebuilt only when a check fails
+Test(type_check, [1, 2, "3", 4], list[int]) >> False
+Test(type_check, {"a": [1, 2], "b": [3, None]}, dict[str, list[int]]) >> False
+Test(type_check, [{1: "1"}, {2: "2", "3": "3"}], list[dict[int, str]]) >> False
+Test(type_check, ({1, 2}, {3, "4"}), tuple[set[int], set[int]]) >> False
+
+
+@dataclass
+class Point:
+    x: float
+    y: float
+
+
+Test(type_check, {"points": [Point(1.0, 2.0), Point(3.0, "4")]}, dict[str, list[Point]]) >> False
+
+
+# Custom type_check hooks keep receiving a chain to build on
+class Pair:
+    def __init__(self, first, second):
+        self.first, self.second = first, second
+
+    def __repr__(self):
+        return f"Pair({self.first!r}, {self.second!r})"
+
+    def __type_check__(self, typ=int, *, chain):
+        type_assert(self.first, typ, chain=chain(".first"))
+        type_assert(self.second, typ, chain=chain(".second"))
+
+
+Test(type_check, [Pair(1, 2), Pair(3, "4")], list[Pair]) >> False
+
+
+# A passing check allocates nothing per element
+def peak_allocation(obj, t):
+    tracemalloc.start()
+    type_check(obj, t)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak < 4096
+
+
+Test(type_check, peak_allocation(list(range(100_000)), list[int]), Literal[True]) >> True
+Test(type_check, peak_allocation(dict.fromkeys(range(100_000), "x"), dict[int, str]), Literal[True]) >> True
@@ -0,0 +1,35 @@
+from . import Test, type_check, type_assert
+from typing import Literal
+from type_check import check_policy, Full, First, Last, Stride, RandomK
+
+data = [0, 1, 2, 3, 4, 5, 6, 7, 8, "9"]
+
+# Per-call check policies
+Test(type_check, data, list[int], policy=Full()) >> False
+Test(type_check, data, list[int], policy=First(9)) >> True
+Test(type_check, data, list[int], policy=Last(1)) >> False
+Test(type_check, data, list[int], policy=Stride(2)) >> True
+Test(type_check, data, list[int], policy=Stride(3)) >> False
+Test(type_check, data, list[int], policy=RandomK(20)) >> False
+
+# Results tell whether every element was checked
+Test(type_check, type_check(data, list[int], policy=First(20)).exhaustive, Literal[True]) >> True
+Test(type_check, type_check(data, list[int], policy=First(5)).exhaustive, Literal[False]) >> True
+
+# Seeded random sampling is reproducible
+a = type_check(data, list[int], policy=RandomK(3, seed=42))
+b = type_check(data, list[int], policy=RandomK(3, seed=42))
+Test(type_check, a == bool(b), Literal[True]) >> True
+
+# Sets and dicts are sampled in iteration order
+records = {i: str(i) for i in range(10)}
+records[10] = 10
+Test(type_check, records, dict[int, str], policy=First(10)) >> True
+Test(type_check, records, dict[int, str], policy=Last(1)) >> False
+Test(type_check, set(range(10)) | {"10"}, set[int], policy=Stride(1)) >> False
+
+# Per-context check policies, nested containers are sampled as well
+with check_policy(First(1)):
+    Test(type_check, [[1, "2"], [None]], list[list[int]]) >> True
+    Test(type_check, [[1, "2"], [None]], list[list[int]], policy=None) >> False
+    Test(type_assert, [["1", 2]], list[list[int]]) >> False
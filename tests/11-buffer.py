@@ -0,0 +1,48 @@
+import subprocess
+import sys
+from . import Test, type_check
+from typing import Sequence, MutableSequence, Literal
+from array import array
+
+# Buffer protocol objects are checked from their format code
+Test(type_check, array("d", [1.0, 2.0, 3.0]), Sequence[float]) >> True
+Test(type_check, array("q", [1, 2, 3]), Sequence[float]) >> False
+Test(type_check, array("q", [1, 2, 3]), MutableSequence[int | float]) >> True
+Test(type_check, type_check(memoryview(array("f", [1.0])), Sequence[float]).passed, Literal[True]) >> True
+Test(type_check, b"rttc", Sequence[int]) >> True
+Test(type_check, bytearray(b"rttc"), MutableSequence[str]) >> False
+Test(type_check, array("u", "rttc"), Sequence[str]) >> True
+
+# Bounded values are checked without a Python level loop
+Test(type_check, array("b", [0, 1, 1, 0]), Sequence[Literal[0, 1]]) >> True
+Test(type_check, array("b", [0, 1, 2, 0]), Sequence[Literal[0, 1]]) >> False
+
+# NumPy is not imported by type_check, only used once imported elsewhere
+script = "import sys, type_check; print('numpy' in sys.modules)"
+imported = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True).stdout.strip()
+Test(type_check, imported, Literal["False"]) >> True
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Without NumPy, bounded values fall back to a set inclusion test
+from type_check import buffer_checks
+
+loaded_numpy = buffer_checks.loaded_numpy
+buffer_checks.loaded_numpy = lambda: None
+Test(type_check, array("b", [0, 1, 1, 0]), Sequence[Literal[0, 1]]) >> True
+Test(type_check, array("b", [0, 1, 2, 0]), Sequence[Literal[0, 1]]) >> False
+buffer_checks.loaded_numpy = loaded_numpy
+
+# Other sequences are checked element by element
+Test(type_check, [1, 2, 3], Sequence[int]) >> True
+Test(type_check, (1, 2, "3"), Sequence[int]) >> False
+
+if numpy is not None:
+    Matrix = numpy.ndarray[tuple[int, int], numpy.dtype[numpy.float64]]
+    Test(type_check, numpy.zeros((2, 3)), Matrix) >> True
+    Test(type_check, numpy.zeros(3), Matrix) >> False
+    Test(type_check, numpy.zeros((2, 3), dtype=numpy.int32), Matrix) >> False
+    Test(type_check, numpy.zeros((2, 3), dtype=numpy.int32), numpy.ndarray[tuple[int, ...], numpy.dtype[numpy.integer]]) >> True
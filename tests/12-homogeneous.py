@@ -0,0 +1,24 @@
+from . import Test, type_check
+
+# Containers of primitive element types are checked in bulk
+ints = list(range(20))
+Test(type_check, ints, list[int]) >> True
+Test(type_check, ints + [True], list[int]) >> True  # bool is a subclass of int
+Test(type_check, ints + [1.0], list[int]) >> False
+Test(type_check, [True] * 20 + [1], list[bool]) >> False
+Test(type_check, ints + [None, "20"], list[int | None]) >> False
+
+
+class Id(int):
+    pass
+
+
+Test(type_check, ints + [Id(20)], list[int]) >> True
+Test(type_check, [Id(i) for i in ints] + [20], list[Id]) >> False
+
+Test(type_check, set(ints), set[int]) >> True
+Test(type_check, set(ints) | {"20"}, set[int]) >> False
+
+Test(type_check, {str(i): float(i) for i in range(20)}, dict[str, float]) >> True
+Test(type_check, {str(i): float(i) for i in range(20)} | {"20": 20}, dict[str, float]) >> False
+Test(type_check, {str(i): float(i) for i in range(20)} | {20: 20.0}, dict[str, float]) >> False
@@ -0,0 +1,69 @@
+from . import Test, type_check, type_assert
+from typing import Literal
+from dataclasses import dataclass
+from type_check import memoize, Memo
+
+Config = tuple[tuple[str, int | float], ...]
+
+
+def stats(memo: Memo):
+    return (memo.stats.hits, memo.stats.misses, memo.stats.evictions, memo.stats.size)
+
+
+# Hashable immutables are memoized by value
+with memoize() as memo:
+    Test(type_check, ("a", 1), tuple[str, int]) >> True
+    Test(type_check, ("a", 1), tuple[str, int]) >> True
+    Test(type_check, ("a", "1"), tuple[str, int]) >> False
+    Test(type_check, ("a", "1"), tuple[str, int]) >> False
+    # Equal values of different types are memoized separately
+    Test(type_check, (1,), tuple[bool]) >> False
+    Test(type_check, (True,), tuple[bool]) >> True
+    Test(type_assert, ("a", 1), tuple[str, int]) >> True
+    Test(type_assert, ("a", "1"), tuple[str, int]) >> False
+Test(type_check, stats(memo) == (4, 4, 0, 4), Literal[True]) >> True
+
+
+# Frozen dataclasses are memoized by weak identity
+@dataclass(frozen=True)
+class Point:
+    x: float
+    y: float
+
+
+# Versioned objects are checked again after mutation
+class Counter:
+    __version__ = 0
+    count: int = 0
+
+    def __repr__(self):
+        return f"Counter(count={self.count!r})"
+
+    def set(self, count):
+        self.count = count
+        self.__version__ += 1
+
+
+memo = Memo(maxsize=2)
+point, counter = Point(1.0, 2.0), Counter()
+Test(type_check, point, Point, memo=memo) >> True
+Test(type_check, point, Point, memo=memo) >> True
+Test(type_check, counter, Counter, memo=memo) >> True
+counter.set("1")
+Test(type_check, counter, Counter, memo=memo) >> False
+Test(type_check, (1, 2.0), tuple[int, float], memo=memo) >> True
+Test(type_check, stats(memo) == (1, 4, 1, 2), Literal[True]) >> True
+
+
+# Frozen dataclasses holding mutable containers are checked every time
+@dataclass(frozen=True)
+class Samples:
+    values: list[int]
+
+
+samples = Samples([1])
+memo = Memo()
+Test(type_check, samples, Samples, memo=memo) >> True
+samples.values.append("2")
+Test(type_check, samples, Samples, memo=memo) >> False
+Test(type_check, memo.key(samples, Samples) is None and memo.key(Point(1.0, 2.0), Point) is not None, Literal[True]) >> True
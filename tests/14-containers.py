@@ -0,0 +1,39 @@
+from . import Test, type_check
+from type_check import CheckedList, CheckedDict, CheckedSet, check_policy, check_limits, First
+
+# Elements are validated upon insertion
+numbers = CheckedList[int]([1, 2, 3])
+Test(numbers.append, 4) >> True
+Test(numbers.append, "5") >> False
+Test(numbers.extend, [5, 6]) >> True
+Test(numbers.extend, [7, "8"]) >> False
+Test(numbers.insert, 0, None) >> False
+Test(numbers.__setitem__, slice(0, 2), [0, "1"]) >> False
+Test(CheckedList[int], [1, "2"]) >> False
+
+# Matching type hints are answered from the recorded element type
+Test(type_check, numbers, list[int]) >> True
+Test(type_check, numbers, list[int | str]) >> True
+Test(type_check, numbers, list[str]) >> False
+Test(type_check, [numbers], list[CheckedList[int]]) >> True
+list.append(numbers, "unchecked")  # Bypassing validation is not detected
+Test(type_check, numbers, list[int]) >> True
+
+scores = CheckedDict[str, float](alice=1.0)
+Test(scores.__setitem__, "bob", 2.0) >> True
+Test(scores.__setitem__, "eve", "3.0") >> False
+Test(scores.update, {4: 4.0}) >> False
+Test(type_check, scores, dict[str, float]) >> True
+
+tags = CheckedSet[str]({"a"})
+Test(tags.add, "b") >> True
+Test(tags.add, 3) >> False
+Test(tags.update, ["c"], [None]) >> False
+Test(type_check, tags, set[str]) >> True
+
+# Insertions are fully checked whatever the enclosing policy or limits
+with check_policy(First(1)):
+    Test(CheckedList[list[int]]().append, [1, "a"]) >> False
+with check_limits(max_elements=5):
+    Test(CheckedList[int], ["a"] * 100) >> False
+    Test(CheckedSet[int], [str(i) for i in range(100)]) >> False
@@ -0,0 +1,102 @@
+# Argument validation of type guarded functions
+from . import Test, type_guard, type_check, TypeCheckError
+from typing import Literal
+
+
+@type_guard
+def scale(x: list[float], factor: float = 1.0, *, mode: Literal["up", "down"] = "up") -> list[float]:
+    return [v * factor for v in x]
+
+
+Test(scale, [1.0, 2.0]) >> True
+Test(scale, [1.0, 2.0], 2.0) >> True
+Test(scale, [1.0, 2.0], factor=2.0, mode="down") >> True
+Test(scale, [1.0, "2.0"]) >> False
+Test(scale, [1.0], "2") >> False
+Test(scale, [1.0], factor="2") >> False
+Test(scale, [1.0], mode="sideways") >> False
+
+
+@type_guard
+def total(*values: int, **weights: float) -> float:
+    return sum(values) * sum(weights.values(), 1.0)
+
+
+Test(total, 1, 2, 3) >> True
+Test(total, 1, 2, w=0.5) >> True
+Test(total, 1, "2") >> False
+Test(total, 1, w="0.5") >> False
+
+
+# Unannotated parameters are not checked
+@type_guard
+def first(items, default: int = 0) -> int:
+    return items[0] if items else default
+
+
+Test(first, [1]) >> True
+Test(first, ["1"]) >> False
+Test(first, [], default=None) >> False
+
+
+# Unannotated parameters passed by keyword are not part of **kwargs
+@type_guard
+def tag(name, /, label, *, strict=False, **extra: int) -> str:
+    return name
+
+
+Test(tag, "a", label="s", strict="yes", n=1) >> True
+Test(tag, "a", label="s", n="1") >> False
+Test(tag, "a", "s", name="1") >> False  # Positional-only, name goes to **extra
+
+
+# Failures are located at the offending argument
+def reason(fn, *args, **kwargs):
+    try:
+        fn(*args, **kwargs)
+    except TypeCheckError as e:
+        return str(e)
+
+
+Test(type_check, reason(scale, [1.0, "2.0"]), Literal["scale(x)[1] = str('2.0') is not float"]) >> True
+Test(type_check, reason(total, 1, "2"), Literal["total(*values)[1] = str('2') is not int"]) >> True
+Test(type_check, reason(total, w="0.5"), Literal["total(**weights)['w'] = str('0.5') is not float"]) >> True
+
+
+# Defaults are checked once at decoration time
+def bad_default(x: int = "0") -> int:
+    return x
+
+
+Test(type_guard, bad_default) >> False
+
+
+# Forward references to the enclosing class are resolved on the first call
+class Node:
+    def __init__(self, parent: "Node | None" = None):
+        self.parent = parent
+
+    @type_guard
+    def child(self) -> "Node":
+        return Node(self)
+
+    @type_guard
+    def adopt(self, child: "Node") -> "Node":
+        return child
+
+    def __repr__(self):
+        return "Node()"
+
+
+Test(Node().child) >> True
+Test(Node().adopt, Node()) >> True
+Test(Node().adopt, "not a node") >> False
+
+
+# Names that are still undefined fail the call
+@type_guard
+def ghost(x: "Missing") -> int:  # noqa: F821
+    return 0
+
+
+Test(ghost, 1) >> False
@@ -0,0 +1,82 @@
+# Guarded classes remain plain classes
+from . import Test, type_guard, type_check
+from typing import Generic, NamedTuple, TypeVar, Literal
+from dataclasses import dataclass
+
+T = TypeVar("T")
+
+
+@type_guard
+@dataclass
+class Box(Generic[T]):
+    item: T
+    size: int = 1
+
+
+Test(Box[int], item=1) >> True
+Test(Box[int], item="1") >> False
+Test(Box[str], item="1", size="2") >> False
+Test(Box, item=None) >> True
+
+# Subscriptions are cached, isinstance() and class attributes are untouched
+Test(type_check, Box[int] is Box[int], Literal[True]) >> True
+Test(type_check, Box[int] == Box[int], Literal[True]) >> True
+Test(type_check, isinstance(Box[int](item=1), Box), Literal[True]) >> True
+Test(type_check, type(Box), type[type]) >> True
+Box.label = "box"
+Test(type_check, Box.__dict__.get("label"), Literal["box"]) >> True
+
+
+# Subclasses inherit the guard
+class Crate(Box[float]):
+    pass
+
+
+Test(Crate, item=1.0) >> True
+Test(Crate, item="1.0") >> False
+
+
+# Generic subclasses may be guarded too, subscriptions go through Box's guard
+@type_guard
+@dataclass
+class Pack(Box[T]):
+    count: int = 0
+
+
+Test(Pack[str], item="1", count=1) >> True
+Test(Pack[str], item=1) >> False
+Test(type_check, Pack[str] is Pack[str], Literal[True]) >> True
+
+
+# Classes built by __new__ alone are checked once built
+@type_guard
+class Point(NamedTuple):
+    x: int
+    y: str
+
+
+class Single(tuple):
+    first: int
+
+    def __new__(cls, first):
+        self = super().__new__(cls, (first,))
+        self.first = first
+        return self
+
+
+type_guard(Single)
+Test(Point, 1, "1") >> True
+Test(Point, 1, 1) >> False
+Test(Single, 1) >> True
+Test(Single, "1") >> False
+
+
+# Classes without __init__ or __new__ still reject arguments, e.g. when
+# @dataclass is applied after @type_guard and keeps the guarded __init__
+@dataclass
+@type_guard
+class Late:
+    x: int
+
+
+Test(Late, 1) >> False
@@ -0,0 +1,62 @@
+# Lazy validation of iterators and generators
+from . import Test, type_check, type_assert, type_guard
+from typing import Iterator, Iterable, Generator, Literal
+
+
+def numbers(*items):
+    yield from items
+
+
+def consume(items: list, hint):
+    """Stream items through type_assert() and consume the stream"""
+    return list(type_assert(numbers(*items), hint))
+
+
+# Items are checked as they are consumed
+Test(consume, [1, 2, 3], Iterator[int]) >> True
+Test(consume, [1, "2", 3], Iterator[int]) >> False
+Test(consume, [[1], [2.0]], Iterable[list[int]]) >> False
+Test(type_assert, [1, 2, None], Iterable[int]) >> False  # Containers are checked in place
+Test(type_check, isinstance(type_assert(numbers("1"), Iterator[int]), Iterator), Literal[True]) >> True  # Nothing consumed yet
+
+# Consumption is not buffered
+stream = type_assert(iter(range(10**9)), Iterator[int])
+Test(type_check, next(stream) + next(stream), Literal[1]) >> True
+
+
+# Send and return values of generators
+def echo() -> Generator[int, int, str]:
+    value = yield 0
+    while value is not None:
+        value = yield value
+    return "done"
+
+
+def run(hint, *values):
+    gen = type_assert(echo(), hint)
+    next(gen)
+    for value in values:
+        gen.send(value)
+    try:
+        next(gen)
+    except StopIteration as stop:
+        return stop.value
+
+
+Test(run, Generator[int, int, str], 1, 2) >> True
+Test(run, Generator[int, int, str], 1, "2") >> False
+Test(run, Generator[int, int, int], 1) >> False
+
+
+# Iterators returned by type guarded functions are wrapped
+@type_guard
+def parse(values: list) -> Iterator[int]:
+    return iter(values)
+
+
+def parsed(values: list):
+    return list(parse(values))
+
+
+Test(parsed, [1, 2]) >> True
+Test(parsed, [1, 2.0]) >> False
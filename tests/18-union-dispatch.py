@@ -0,0 +1,40 @@
+# Union arms are dispatched by the type of the object
+from . import Test, type_check
+from typing import Literal, Sequence
+from collections.abc import Sized
+
+
+class Base:
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+
+class Derived(Base):
+    pass
+
+
+class Impostor:
+    # isinstance() consults __class__ as well
+    __class__ = Derived
+
+    def __repr__(self):
+        return "Impostor()"
+
+
+Test(type_check, Derived(), int | Base) >> True
+Test(type_check, Impostor(), int | Base) >> True
+Test(type_check, Impostor(), int | str) >> False
+Test(type_check, True, str | int) >> True
+Test(type_check, 1, str | bool) >> False
+
+# Generic arms are only tried if their origin matches
+Mixed = int | str | list[int] | list[str]
+Test(type_check, ["a", "b"], Mixed) >> True
+Test(type_check, [1, "b"], Mixed) >> False
+Test(type_check, (1, 2), Mixed | tuple[int, int]) >> True
+Test(type_check, (1, 2), Mixed | Sequence[str]) >> False
+
+# Arms that depend on the value are always tried
+Test(type_check, "b", Literal["a"] | Literal["b"] | None) >> True
+Test(type_check, "c", Literal["a"] | Literal["b"] | None) >> False
+Test(type_check, [], int | Sized) >> True
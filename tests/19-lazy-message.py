@@ -0,0 +1,39 @@
+# Failures are rendered lazily, results may drop the checked value
+from . import Test, type_check, type_assert
+from type_check.primitives import REPR_BUDGET, Summary
+from typing import Literal
+
+payload = list(range(10**6)) + ["oops"]
+result = type_check([payload], list[list[int]])
+Test(type_check, result.reason, str) >> True
+Test(type_check, len(result.reason) < 2 * REPR_BUDGET, Literal[True]) >> True
+Test(type_check, result.reason.startswith("list[0][1000000] = str('oops')"), Literal[True]) >> True
+Test(type_check, len(str(result)) < 2 * REPR_BUDGET, Literal[True]) >> True
+
+# Long strings are truncated in the middle
+Test(type_assert, "x" * 10**6, int) >> False
+
+
+class Payload:
+    def __init__(self, size: int):
+        self.data = [None] * size
+
+    def __repr__(self):
+        return f"Payload({len(self.data)})"
+
+
+# Weak references are dropped along with the value
+obj = Payload(10)
+result = type_check(obj, int, retain="weak")
+Test(type_check, repr(result.value), Literal["Payload(10)"]) >> True
+Test(type_check, result.value.get() is obj, Literal[True]) >> True
+del obj
+Test(type_check, repr(result.value), Literal["<Payload (released)>"]) >> True
+Test(type_check, result.reason, Literal["Payload(Payload(10)) is not int"]) >> True
+
+# Values that cannot be weakly referenced are summarized
+result = type_check(payload, list[int], retain="weak")
+Test(type_check, result.value, Summary) >> True
+Test(type_check, result.value.get(), None) >> True
+Test(type_check, repr(result.value).endswith("...]"), Literal[True]) >> True
+Test(type_check, type_check(1, int, retain="summary").value, Summary) >> True
@@ -0,0 +1,53 @@
+# Opt-in instrumentation of type checks
+from dataclasses import dataclass
+from . import Test, type_check
+from type_check import instrument, instrumentation, memoize, config
+from typing import Literal
+
+with instrument() as stats:
+    type_check([1, 2, 3], list[int | str])
+    type_check([1, None], list[int | str])
+    with memoize():
+        type_check((1, "2"), tuple[int, str])
+        type_check((1, "2"), tuple[int, str])
+
+hints = stats.as_dict()["hints"]
+Test(type_check, hints["list[int | str]"]["calls"], Literal[2]) >> True
+Test(type_check, hints["list[int | str]"]["failures"], Literal[1]) >> True
+Test(type_check, hints["list[int | str]"]["elements"], Literal[2 + 5]) >> True
+Test(type_check, hints["int | str"]["calls"], Literal[5]) >> True
+Test(type_check, hints["tuple[int, str]"]["memo_hits"], Literal[1]) >> True
+Test(type_check, hints["tuple[int, str]"]["calls"], Literal[1]) >> True
+Test(type_check, stats.as_dict()["checkers"]["list: sequence_check"]["calls"], Literal[2]) >> True
+
+text = stats.prometheus()
+Test(type_check, 'rttc_checks_total{hint="list[int | str]"} 2' in text, Literal[True]) >> True
+Test(type_check, 'rttc_checker_failures_total{checker="list: sequence_check"} 1' in text, Literal[True]) >> True
+
+# Disabled outside of the context
+Test(type_check, instrumentation(), None) >> True
+type_check([1], list[int | str])
+Test(type_check, hints["list[int | str]"]["calls"], Literal[2]) >> True
+
+
+# Deep data is still checked iteratively, walks are counted as checks
+@dataclass(repr=False)
+class Node:
+    next: "Node | None"
+
+    def __repr__(self):
+        return "Node(...)"
+
+
+chain = None
+for _ in range(3000):
+    chain = Node(chain)
+with instrument():
+    Test(type_check, chain, Node) >> True
+
+counts = []
+for engine in ("recursive", "iterative"):
+    with instrument() as stats, config(engine=engine):
+        type_check([[1, 2], [3, "4"]], list[list[int]])
+    counts.append({hint: (s.calls, s.failures, s.elements) for hint, s in stats.hints.items()})
+Test(type_check, counts[0] == counts[1], Literal[True]) >> True
@@ -0,0 +1,52 @@
+# Cycles and shared sub-objects are checked once per type hint
+from . import Test, type_check
+from typing import Literal
+from dataclasses import dataclass, field
+
+
+@dataclass(repr=False)
+class Node:
+    value: int
+    children: list["Node"] = field(default_factory=list)
+
+    def __repr__(self):
+        return f"Node({self.value!r})"
+
+
+# Cycles pass instead of exhausting the recursion limit
+a, b = Node(1), Node(2)
+a.children.append(b)
+b.children.append(a)
+Test(type_check, a, Node) >> True
+loop = Node(0)
+loop.children.append(loop)
+Test(type_check, loop, Node) >> True
+
+# Failures within cycles are still located
+b.children.append(Node("3"))
+Test(type_check, a, Node) >> False
+
+
+# Shared sub-objects (DAG) are checked once
+class Counted:
+    checks = 0
+
+    def __type_check__(self, *, chain):
+        Counted.checks += 1
+
+    def __repr__(self):
+        return "Counted()"
+
+
+shared = Counted()
+rows = [[shared, shared], [shared]]
+Test(type_check, rows, list[list[Counted]]) >> True
+Test(type_check, Counted.checks, Literal[1]) >> True
+# ... once per check, not across checks
+Test(type_check, rows, list[list[Counted]]) >> True
+Test(type_check, Counted.checks, Literal[2]) >> True
+
+# A failing object is checked again by the next union arm
+bad = Node("1")
+Test(type_check, (bad, "x"), tuple[Node, int] | tuple[Node, str]) >> False
+Test(type_check, [bad, bad], list[Node] | list[Node | str]) >> False
@@ -0,0 +1,43 @@
+# Data nested deeper than the recursion limit
+import sys
+from . import Test, type_check
+from type_check import config
+from typing import Literal
+from dataclasses import dataclass, field
+
+DEPTH = sys.getrecursionlimit() * 2
+
+
+@dataclass(repr=False)
+class Link:
+    value: int
+    next: list["Link"] = field(default_factory=list)
+
+    def __repr__(self):
+        return f"Link({self.value!r})"
+
+
+def nest(leaf: Link) -> Link:
+    head = leaf
+    for i in range(DEPTH):
+        head = Link(i, [head])
+    return head
+
+
+def reason(obj, t) -> str | None:
+    return type_check(obj, t).reason
+
+
+Test(type_check, nest(Link(0)), Link) >> True
+# Same path as reported by the recursive engine (not printed, too long)
+path = "Link" + ".next[0]" * DEPTH + ".value = str('0') is not int"
+Test(type_check, reason(nest(Link("0")), Link) == path, Literal[True]) >> True
+
+# Engines agree on shallow data
+shallow = {"a": [Link(1), Link(2, [Link("3")])]}
+with config(engine="iterative"):
+    iterative = reason(shallow, dict[str, list[Link]])
+with config(engine="recursive"):
+    recursive = reason(shallow, dict[str, list[Link]])
+Test(type_check, iterative, str) >> True
+Test(type_check, iterative == recursive, Literal[True]) >> True
@@ -0,0 +1,88 @@
+# Context-scoped configuration and concurrent checks
+import asyncio
+from threading import Thread, Barrier
+from dataclasses import dataclass
+from . import Test, type_check
+from type_check import config, Memo, memoize, instrument, Instrumentation
+from typing import Literal, _type_repr as type_repr
+
+
+class Point:
+    x: int
+    y: int
+
+    def __init__(self, **kwargs):
+        vars(self).update(kwargs)
+
+    def __repr__(self):
+        return f"Point({vars(self)})"
+
+
+# Options apply within the context only
+half = Point(x=1)
+Test(type_check, half, Point) >> True
+with config(check_missing_attr=True):
+    Test(type_check, half, Point) >> False
+Test(type_check, half, Point) >> True
+
+# Objects that cannot be checked are skipped unless strict
+with config(strict=False):
+    Test(type_check, frozenset([1]), frozenset[int]) >> True
+
+
+# Each asyncio task keeps its own configuration
+async def check(missing: bool) -> bool:
+    with config(check_missing_attr=missing):
+        await asyncio.sleep(0)
+        return type_check(half, Point).passed
+
+
+async def tasks():
+    return await asyncio.gather(check(True), check(False), check(True))
+
+
+Test(type_check, asyncio.run(tasks()), Literal[[False, True, False]]) >> True
+
+
+# Stress: many threads checking (and compiling) concurrently
+@dataclass
+class Row:
+    id: int
+    tags: list[str]
+    parent: "Row | None" = None
+
+
+THREADS, ROUNDS = 16, 200
+barrier = Barrier(THREADS)
+errors = list[str]()
+memo = Memo(maxsize=64)
+stats = Instrumentation()
+
+
+def worker(n: int):
+    barrier.wait()
+    try:
+        # Threads start with a fresh context, collectors can be shared though
+        with config(check_missing_attr=n % 2 == 0), memoize(memo), instrument(stats):
+            for i in range(ROUNDS):
+                row = Row(i, [str(n)], Row(n, []))
+                hint = [list[Row], dict[int, Row], tuple[Row, Row]][i % 3]
+                data = [row] if i % 3 == 0 else {i: row} if i % 3 == 1 else (row, row)
+                if not type_check(data, hint) or type_check((n, i), tuple[int, str]):
+                    errors.append(f"thread {n}: wrong verdict at round {i}")
+                if type_check(half, Point).passed != (n % 2 == 1):
+                    errors.append(f"thread {n}: configuration leaked at round {i}")
+    except Exception as e:
+        errors.append(f"thread {n}: {e!r}")
+
+
+threads = [Thread(target=worker, args=(n,)) for n in range(THREADS)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+
+Test(type_check, errors, Literal[[]]) >> True
+# Counters of all threads are merged, none are lost
+Test(type_check, stats.hints[type_repr(Point)].calls, Literal[THREADS * ROUNDS]) >> True
+Test(type_check, memo.stats.hits + memo.stats.misses, Literal[THREADS * ROUNDS]) >> True
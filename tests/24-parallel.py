@@ -0,0 +1,41 @@
+# Parallel checks of huge containers, results match serial checks
+import pickle
+import subprocess
+import sys
+from . import Test, type_check
+from type_check import compile, parallel
+from typing import Literal
+
+# Pools are only imported when entering parallel(), multiprocessing is slow to import
+script = "import sys, type_check; print('multiprocessing' in sys.modules)"
+imported = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True).stdout.strip()
+Test(type_check, imported, Literal["False"]) >> True
+
+rows = [(i, str(i)) for i in range(5000)]
+bad = list(rows)
+bad[1234] = (1234, None)
+bad[4321] = ("4321", "4321")
+table = {i: [float(i)] for i in range(5000)}
+wrong = dict(table)
+wrong[3000] = [3000]
+
+
+def reason(obj, t) -> str | None:
+    return type_check(obj, t).reason
+
+
+serial = [reason(bad, list[tuple[int, str]]), reason(wrong, dict[int, list[float]])]
+
+# Compiled checkers are picklable, plans are recompiled from the hint
+checker = pickle.loads(pickle.dumps(compile(list[tuple[int, str]])))
+Test(type_check, rows, checker) >> True
+
+for executor in ("thread", "process"):
+    with parallel(workers=4, executor=executor, chunk_size=500):
+        Test(type_check, rows, list[tuple[int, str]]) >> True
+        Test(type_check, table, dict[int, list[float]]) >> True
+        # Lowest failing index, same path as serial checks
+        result = [reason(bad, list[tuple[int, str]]), reason(wrong, dict[int, list[float]])]
+        Test(type_check, result == serial, Literal[True]) >> True
+
+Test(type_check, serial, list[str]) >> True
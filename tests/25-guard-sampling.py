@@ -0,0 +1,59 @@
+# Sampled checks of type guarded functions
+from . import Test, type_guard, type_check, TypeCheckError
+from type_check import guard_stats
+from typing import Literal
+
+
+def calls(fn, *args, n: int = 1000) -> int:
+    """Number of calls that raised TypeCheckError"""
+    failed = 0
+    for _ in range(n):
+        try:
+            fn(*args)
+        except TypeCheckError:
+            failed += 1
+    return failed
+
+
+@type_guard(rate=10)
+def head(x: list[int]) -> int:
+    return x[0]
+
+
+head.__sampler__.random.seed(0)
+Test(head, [1]) >> True
+failed = calls(head, ["1"])
+Test(type_check, 50 < failed < 200, Literal[True]) >> True
+stats = guard_stats(head)
+Test(type_check, stats.checked + stats.skipped, Literal[1001]) >> True
+Test(type_check, stats.failed == failed, Literal[True]) >> True
+
+
+# Adaptive: back off after consecutive passes, every call again upon failure
+@type_guard(adaptive=10)
+def first(x: list[int]) -> int:
+    return x[0]
+
+
+first.__sampler__.random.seed(0)
+calls(first, [1])
+Test(type_check, first.__sampler__.interval > 1, Literal[True]) >> True
+Test(type_check, guard_stats(first).skipped > 500, Literal[True]) >> True
+while guard_stats(first).failed == 0:
+    calls(first, ["1"], n=1)
+Test(type_check, first.__sampler__.interval, Literal[1]) >> True
+Test(first, ["1"]) >> False
+
+
+# Budget: checks stop once they exceed the share of the function's time
+@type_guard(budget=0.0)
+def noop(x: list[int]) -> None:
+    pass
+
+
+calls(noop, ["1"], n=100)
+Test(type_check, guard_stats(noop).checked, Literal[1]) >> True
+Test(type_check, guard_stats(noop).skipped, Literal[99]) >> True
+
+# Unsampled guards keep checking every call, without bookkeeping
+Test(type_check, getattr(type_guard(noop.__wrapped__), "__sampler__", None), None) >> True
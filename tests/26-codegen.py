@@ -0,0 +1,73 @@
+# Checkers generated as Python source, same verdicts and paths as compiled ones
+import tempfile
+from pathlib import Path
+from dataclasses import dataclass
+from importlib.util import spec_from_file_location, module_from_spec
+from . import Test, type_check
+from type_check import compile
+from type_check.core import precompiled, __compile_cached__, __compile_variant__
+from type_check.codegen import RUNTIME, build, export
+from typing import Literal, Optional
+
+
+@dataclass
+class Point:
+    x: float
+    y: float
+
+
+class Names(list):
+    pass
+
+
+def reasons(t, *objs) -> list:
+    """Failure reasons of generated and compiled checkers, as pairs"""
+    generated = build(t)
+    pairs = []
+    for obj in objs:
+        with_generated = type_check(obj, generated)
+        with_compiled = type_check(obj, compile(t))
+        pairs.append((bool(with_generated), with_generated.reason, bool(with_compiled), with_compiled.reason))
+    return pairs
+
+
+def same(t, *objs) -> bool:
+    return all(a == c and b == d for a, b, c, d in reasons(t, *objs))
+
+
+rows = [(float(i), str(i)) for i in range(100)]
+Test(type_check, rows, build(list[tuple[float, str]])) >> True
+Test(type_check, rows + [(1.0, 1)], build(list[tuple[float, str]])) >> False
+Test(type_check, same(list[tuple[float, str]], rows, rows + [(1, "1")], [(1.0,)], [[1.0, "1"]], (1.0, "1")), Literal[True]) >> True
+Test(type_check, same(dict[str, int | list[int]], {"a": 1}, {"a": [1, "1"]}, {1: 1}, {"a": list(range(100))}), Literal[True]) >> True
+Test(type_check, same(Optional[tuple[int, str]], None, (1, "1"), (1, 1), 1), Literal[True]) >> True
+Test(type_check, same(set[Literal["a", "b"]], {"a"}, {"a", "c"}, ["a"]), Literal[True]) >> True
+# Limited checks walk the compiled checkers, with the same partial results
+limited = build(dict[str, list[int]])
+Test(type_check, str(type_check({"a": ["x"]}, limited, max_depth=2)), Literal[str(type_check({"a": ["x"]}, dict[str, list[int]], max_depth=2))]) >> True
+Test(type_check, type_check({"a": list(range(100)) + ["x"]}, limited, max_elements=5).partial, Literal[True]) >> True
+# Classes, and subclasses of builtin containers, fall back to compiled checkers
+Test(type_check, same(list[Point], [Point(1.0, 2.0)], [Point(1.0, "2")]), Literal[True]) >> True
+Test(type_check, same(list[str], Names(["a"]), Names([1])), Literal[True]) >> True
+
+# Exported modules install their checkers upon import
+with tempfile.TemporaryDirectory() as directory:
+    path = Path(directory) / "checkers.py"
+    export([list[Point], dict[str, list[tuple[float, str]]]], str(path))
+    spec = spec_from_file_location("checkers", path)
+    module = module_from_spec(spec)
+    # Nothing is compiled upon import, the checkers are ready to use
+    compiled = []
+    RUNTIME["compile"] = lambda hint: compiled.append(hint) or compile(hint)
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        RUNTIME["compile"] = compile
+    Test(type_check, len(compiled) == 0 and "compile(H" not in path.read_text(), Literal[True]) >> True
+    Test(type_check, compile(list[Point]) is module.CHECKERS[list[Point]], Literal[True]) >> True
+    Test(type_check, [Point(1.0, 2.0)], list[Point]) >> True
+    Test(type_check, {"a": [(1.0, 2)]}, dict[str, list[tuple[float, str]]]) >> False
+
+precompiled.clear()
+__compile_cached__.cache_clear()
+__compile_variant__.cache_clear()
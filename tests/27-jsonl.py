@@ -0,0 +1,33 @@
+# Streaming validation of JSON Lines files, in chunks checked by processes
+import json
+import tempfile
+from pathlib import Path
+from . import Test, type_check
+from type_check.jsonl import validate
+from typing import Literal
+
+Record = dict[str, int | str | list[float]]
+
+with tempfile.TemporaryDirectory() as directory:
+    path = str(Path(directory) / "records.jsonl")
+    with open(path, "w") as f:
+        for i in range(1000):
+            record = {"id": i, "name": str(i), "scores": [i / 2]}
+            if i in (10, 500, 501, 998):
+                record["scores"] = [str(i)]
+            f.write(json.dumps(record) + "\n")
+            if i == 700:
+                f.write("\n{not json}\n")
+
+    serial = validate(path, Record, workers=1)
+    Test(type_check, bool(serial), Literal[False]) >> True
+    Test(type_check, (serial.records, serial.failures), tuple[Literal[1001], Literal[5]]) >> True
+    Test(type_check, [line for line, _ in serial.errors] == [11, 501, 502, 703, 1001], Literal[True]) >> True
+    Test(type_check, serial.errors[0][1], Literal["dict['scores'] = list(['10']) is not int | str | list[float]"]) >> True
+    Test(type_check, serial.errors[3][1].startswith("invalid JSON"), Literal[True]) >> True
+
+    # Chunks of whole lines, the first 2 failures of each chunk are reported
+    chunked = validate(path, Record, workers=2, chunk_size=4096, errors=2)
+    Test(type_check, (chunked.records, chunked.failures), tuple[Literal[1001], Literal[5]]) >> True
+    Test(type_check, chunked.errors == serial.errors, Literal[True]) >> True
+    Test(type_check, len(validate(path, Record, workers=1, errors=2).errors), Literal[2]) >> True
@@ -0,0 +1,56 @@
+# Depth, element and time limits, checks cut short are marked partial
+from dataclasses import dataclass
+from . import Test, type_check, type_assert
+from type_check import check_limits
+from typing import Literal, Optional
+
+
+@dataclass
+class Item:
+    id: int
+    tags: list[str]
+
+
+payload = {"a": [Item(1, ["x"]), Item(2, [3])], "b": []}
+Payload = dict[str, list[Item]]
+
+
+def limits(obj, t, **kwargs) -> tuple:
+    result = type_check(obj, t, **kwargs)
+    return result.passed, result.limits
+
+
+Test(type_check, payload, Payload) >> False
+# Top two levels: the dict, its keys and lists, items are not checked
+Test(type_check, payload, Payload, max_depth=2) >> True
+Test(type_check, limits(payload, Payload, max_depth=2), tuple[Literal[True], tuple[Literal["depth"]]]) >> True
+Test(type_check, {"a": [1]}, Payload, max_depth=2) >> True
+Test(type_check, {"a": (1,)}, Payload, max_depth=2) >> False
+Test(type_check, {1: []}, Payload, max_depth=2) >> False
+# Unions at the last level check the type of each arm
+Test(type_check, [[1]], list[list[int] | str], max_depth=2) >> True
+Test(type_check, [(1,)], list[list[int] | str], max_depth=2) >> False
+Test(type_check, {"a": [1], "b": None}, dict[str, list[int] | None], max_depth=2) >> True
+Test(type_check, {"a": ["1"]}, dict[str, Optional[list[int]]], max_depth=2) >> True
+# Deep enough to reach the offending tag
+Test(type_check, payload, Payload, max_depth=4) >> True
+Test(type_check, payload, Payload, max_depth=5) >> False
+# Limits not reached, the check is complete
+Test(type_check, limits({"b": []}, Payload, max_depth=2), tuple[Literal[True], tuple[()]]) >> True
+Test(type_check, limits(payload, Payload, max_elements=100), tuple[Literal[False], tuple[()]]) >> True
+
+# Checks stop once out of budget, failures found until then are reported
+Test(type_check, payload, Payload, max_elements=3) >> True
+Test(type_check, limits(payload, Payload, max_elements=3), tuple[Literal[True], tuple[Literal["elements"]]]) >> True
+Test(type_check, {"a": 1, "b": [Item(1, [])] * 10}, Payload, max_elements=3) >> False
+Test(type_check, [[i] for i in range(10000)], list[list[int]], deadline=0) >> True
+Test(type_check, limits([[i] for i in range(10000)], list[list[int]], deadline=0), tuple[Literal[True], tuple[Literal["deadline"]]]) >> True
+Test(type_assert, payload, Payload, max_depth=3) >> True
+Test(type_assert, payload, Payload, max_depth=5) >> False
+
+# Budgets are shared within a context, each result names its own limits
+with check_limits(max_elements=5) as budget:
+    first = limits([1, 2], list[int])
+    second = limits([1, 2, 3, 4], list[int])
+Test(type_check, (first, second), tuple[tuple[Literal[True], tuple[()]], tuple[Literal[True], tuple[Literal["elements"]]]]) >> True
+Test(type_check, budget.reached(), tuple[Literal["elements"]]) >> True
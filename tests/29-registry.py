@@ -0,0 +1,166 @@
+# Checkers registered by class apply to subclasses and ABCs, through the MRO
+from collections import OrderedDict, defaultdict, deque
+from collections.abc import Iterator, Mapping, MutableSequence, Sequence
+from typing import TypeVar, Generic, Literal
+from . import Test, type_check
+from type_check import register_checker, Checker
+from type_check.core import resolve_checker
+from type_check.builtin_checks import dict_check
+from type_check.buffer_checks import buffer_check
+from type_check.primitives import Chain, Mismatch
+
+T = TypeVar("T")
+
+
+class Rows(list[T]):
+    pass
+
+
+# Subclasses of builtin containers use the builtin checkers
+Test(type_check, OrderedDict(a=1), OrderedDict[str, int]) >> True
+Test(type_check, OrderedDict(a="1"), OrderedDict[str, int]) >> False
+Test(type_check, defaultdict(list, a=[1, "2"]), defaultdict[str, list[int]]) >> False
+Test(type_check, Rows([1, 2]), Rows[int]) >> True
+Test(type_check, Rows([1, "2"]), Rows[int]) >> False
+Test(type_check, deque([1, "2"]), deque[int]) >> False
+# ABCs
+Test(type_check, {"a": 1}, Mapping[str, int]) >> True
+Test(type_check, {"a": "1"}, Mapping[str, int]) >> False
+Test(type_check, [1, "2"], MutableSequence[int]) >> False
+Test(type_check, resolve_checker(OrderedDict) is dict_check, Literal[True]) >> True
+
+
+class Grid(Generic[T]):
+    def __init__(self, *cells):
+        self.cells = cells
+
+    def __repr__(self):
+        return f"{type(self).__name__}{self.cells}"
+
+
+class Board(Grid[T]):
+    pass
+
+
+def grid_check(grid: Grid, cell: Checker, *, chain: Chain):
+    for i, item in enumerate(grid.cells):
+        failure = cell.__check__(item, chain)
+        if failure is not None:
+            return failure.within(Chain.Key(i))
+
+
+Test(type_check, Board(1, "2"), Board[int]) >> True  # No checker yet, nothing to check
+register_checker(Grid, grid_check)
+# Registration invalidates checkers compiled before
+Test(type_check, Board(1, "2"), Board[int]) >> False
+Test(type_check, Grid(1, 2), Grid[int]) >> True
+
+
+def board_check(board: Board, cell: Checker, *, chain: Chain):
+    return Mismatch(chain, [Board], board) if len(board.cells) > 2 else None
+
+
+register_checker(Board, board_check)
+Test(type_check, Board(1, "2", 3), Board[int]) >> False
+Test(type_check, Board("1"), Board[int]) >> True
+Test(type_check, Grid("1"), Grid[int]) >> False
+
+
+# Classes can be registered by qualified name, before they are met
+class Strip(Grid[T]):
+    pass
+
+
+def strip_check(strip: Strip, cell: Checker, *, chain: Chain):
+    return Mismatch(chain, [Strip], strip) if len(strip.cells) > 2 else None
+
+
+register_checker(f"{__name__}.Strip", strip_check)
+Test(type_check, Strip(1, 2, 3), Strip[int]) >> False
+Test(type_check, Strip("1"), Strip[int]) >> True
+
+
+# Classes implementing the methods of an ABC without deriving from it, or
+# being registered to it, are checked by their type hints
+class Cursor(Generic[T]):
+    rows: list[T]
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.rows.pop(0)
+
+    def __repr__(self):
+        return f"Cursor({self.rows})"
+
+
+class Bag(Generic[T]):
+    items: set[T]
+
+    def __init__(self, *items):
+        self.items = set(items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, item):
+        return item in self.items
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __repr__(self):
+        return f"Bag{tuple(sorted(self.items, key=str))}"
+
+
+class Pair(Generic[T]):
+    a: T
+    b: list[T]
+
+    def __init__(self, a, b):
+        self.a, self.b = a, b
+
+    def __iter__(self):
+        return iter((self.a, self.b))
+
+    def __repr__(self):
+        return f"Pair({self.a}, {self.b})"
+
+
+class Column(Generic[T]):
+    def __init__(self, *cells):
+        self.cells = cells
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __getitem__(self, i):
+        return self.cells[i]
+
+    def __repr__(self):
+        return f"Column{self.cells}"
+
+
+Sequence.register(Column)
+Test(type_check, Cursor(["x"]), Cursor[int]) >> False
+Test(type_check, Bag("x"), Bag[int]) >> False
+Test(type_check, Bag(1, 2), Bag[int]) >> True
+Test(type_check, Pair(1, ["x"]), Pair[int]) >> False
+Test(type_check, type_check(Pair(1, ["x"]), Pair[int]).reason, Literal["Pair.b[0] = str('x') is not int"]) >> True
+Test(type_check, resolve_checker(Cursor) is None and resolve_checker(Iterator) is not None, Literal[True]) >> True
+# Registered classes use the checker of the ABC
+Test(type_check, Column(1, "2"), Column[int]) >> False
+Test(type_check, resolve_checker(Column) is buffer_check, Literal[True]) >> True
+
+
+# Registered to unrelated ABCs with different checkers, neither applies
+class Ledger(Column[T]):
+    pass
+
+
+Mapping.register(Ledger)
+Test(type_check, resolve_checker(Ledger) is None and resolve_checker(deque) is buffer_check, Literal[True]) >> True
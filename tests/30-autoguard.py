@@ -0,0 +1,101 @@
+# Type guards installed on whole modules, upon import or by guard_module()
+import os
+import sys
+import tempfile
+from pathlib import Path
+from types import ModuleType
+from . import Test, type_check
+from type_check import guard_module, guard_imports, guard_report
+from typing import Literal
+
+SOURCE = '''
+from dataclasses import dataclass
+
+
+@dataclass
+class Item:
+    id: int
+    name: str
+
+    def rename(self, name: str) -> "Item":
+        return Item(self.id, name)
+
+
+def total(items: list[Item]) -> int:
+    return sum(item.id for item in items)
+
+
+def plain(x):
+    return x
+'''
+
+
+def module(name: str) -> ModuleType:
+    mod = ModuleType(name)
+    exec(SOURCE, vars(mod))
+    return mod
+
+
+def report(name: str) -> tuple:
+    entry = next(entry for entry in guard_report() if entry.module == name)
+    return entry.functions, entry.classes, entry.skipped
+
+
+# Disabled by the environment, modules are left untouched
+os.environ["RTTC_GUARD"] = "0"
+untouched = module("untouched")
+total, init = untouched.total, untouched.Item.__init__
+guard_module(untouched)
+Test(type_check, untouched.total is total and untouched.Item.__init__ is init, Literal[True]) >> True
+Test(type_check, guard_imports("untouched") is None, Literal[True]) >> True
+del os.environ["RTTC_GUARD"]
+
+guarded = guard_module(module("guarded"))
+Test(guarded.total, [guarded.Item(1, "a")]) >> True
+Test(guarded.total, [1]) >> False
+Test(guarded.Item, 1, 2) >> False
+Test(guarded.Item(1, "a").rename, 2) >> False
+Test(guarded.plain, "anything") >> True
+Test(type_check, report("guarded"), tuple[Literal[2], Literal[1], list[tuple[str, str]]]) >> True
+
+# Import hook, modules of selected packages are guarded once executed
+with tempfile.TemporaryDirectory() as directory:
+    package = Path(directory) / "guarded_app"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "models.py").write_text(SOURCE)
+    sys.path.insert(0, directory)
+    finder = guard_imports("guarded_app")
+    try:
+        from guarded_app import models
+    finally:
+        finder.remove()
+        sys.path.remove(directory)
+    Test(models.total, [1]) >> False
+    Test(models.Item, 1, "a") >> True
+    Test(type_check, report("guarded_app.models"), tuple[Literal[2], Literal[1], list[tuple[str, str]]]) >> True
+
+# Names only imported for type checkers cannot be resolved, such functions are skipped
+LAZY = '''
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from decimal import Decimal
+
+
+def cost(amount: Decimal) -> Decimal:
+    return amount
+
+
+def count(items: list[int]) -> int:
+    return len(items)
+'''
+lazy = ModuleType("lazy")
+exec(LAZY, vars(lazy))
+cost = lazy.cost
+guard_module(lazy)
+Test(type_check, lazy.cost is cost, Literal[True]) >> True
+Test(lazy.cost, "not a decimal") >> True
+Test(lazy.count, ["1"]) >> False
+Test(type_check, report("lazy"), tuple[Literal[1], Literal[0], list[tuple[Literal["cost"], str]]]) >> True
@@ -1,3 +1,13 @@
-from .core import type_check, type_assert, type_guard, TypeCheckError, TypeCheckResult
+from .core import type_check, type_assert, compile, register_checker, Checker, TypeCheckError, TypeCheckResult
+from .guard import type_guard, guard_stats, GuardStats
+from .autoguard import guard_module, guard_imports, guard_report, ModuleGuards
+from .settings import config, configure, Config
+from .policy import check_policy, Policy, Full, First, Last, Stride, RandomK
+from .limits import check_limits, Limits
+from .memo import memoize, Memo, MemoStats
+from .instrument import instrument, instrumentation, Instrumentation
+from .parallel_checks import parallel, Parallel
+from .containers import CheckedList, CheckedDict, CheckedSet
+from .streams import CheckedIterator, CheckedGenerator
 # Side effect of importing builtin_checks registers the hooks
-from . import builtin_checks
+from . import builtin_checks, buffer_checks, streams
@@ -0,0 +1,72 @@
+import re
+import sys
+import typing
+import argparse
+from importlib import import_module
+
+from .codegen import export
+from .jsonl import validate
+
+# Command line tools, run `python -m type_check --help`
+
+# `module:expression`, the module part must be a dotted name
+QUALIFIED = re.compile(r"^([A-Za-z_][\w.]*):(.+)$")
+
+
+def hint(text: str):
+    """Type hint given as `module:expression` (e.g. `app.models:list[Record]`), or a builtin expression"""
+    namespace = {name: getattr(typing, name) for name in typing.__all__}
+    match = QUALIFIED.match(text)
+    if match is not None:
+        module, text = match.groups()
+        namespace.update(vars(import_module(module)))
+    try:
+        return eval(text, namespace)
+    except Exception as e:
+        raise argparse.ArgumentTypeError(f"invalid type hint {text!r}: {e}")
+
+
+def export_command(args: argparse.Namespace) -> int:
+    export(args.hints, args.output)
+    print(f"Exported {len(args.hints)} type hint(s) to {args.output}")
+    return 0
+
+
+def validate_command(args: argparse.Namespace) -> int:
+    report = validate(args.path, args.hint, workers=args.workers, chunk_size=args.chunk_size, errors=args.errors)
+    print(report)
+    for line, reason in report.errors:
+        print(f"{args.path}:{line}: {reason}")
+    return 0 if report else 1
+
+
+def parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m type_check")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser("export", help="generate a module of precompiled checkers")
+    command.add_argument("hints", nargs="+", type=hint, metavar="HINT", help="module:expression, e.g. app.models:list[Record]")
+    command.add_argument("-o", "--output", required=True, help="path of the generated module")
+    command.set_defaults(run=export_command)
+
+    command = commands.add_parser("validate", help="type check each record of a JSON Lines file")
+    command.add_argument("hint", type=hint, metavar="HINT", help="type hint of each record, module:expression")
+    command.add_argument("path", help="JSON Lines file")
+    command.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    command.add_argument("--chunk-size", type=int, default=32 << 20, help="bytes per chunk (default: 32 MiB)")
+    command.add_argument("--errors", type=int, default=5, help="failures reported per chunk (default: 5)")
+    command.set_defaults(run=validate_command)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parser().parse_args(argv)
+    try:
+        return args.run(args)
+    except (ValueError, OSError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+import os
+import sys
+from dataclasses import dataclass, field, is_dataclass
+from importlib.abc import MetaPathFinder, Loader
+from time import perf_counter_ns
+from types import ModuleType, FunctionType
+
+from .guard import __guard_function__, __guard_class__
+
+# Type guards installed on whole modules, by guard_module() or upon import
+# Functions and dataclasses are guarded once, when their module is executed,
+# so checkers are compiled at import time. With RTTC_GUARD=0, modules are
+# left untouched and no import hook is installed: guarded code runs as is.
+
+# "0" disables guards, a comma separated list of packages guards them upon
+# import (once type_check is imported), e.g. RTTC_GUARD=app,lib
+ENV_VAR = "RTTC_GUARD"
+
+
+def enabled() -> bool:
+    return os.environ.get(ENV_VAR, "") != "0"
+
+
+@dataclass
+class ModuleGuards:
+    """Guards installed on one module, and what it cost at import time"""
+
+    module: str
+    functions: int = 0
+    classes: int = 0
+    # Qualified names of annotated objects that could not be guarded, with reasons
+    skipped: list[tuple[str, str]] = field(default_factory=list)
+    guard_ns: int = 0
+
+    def __str__(self) -> str:
+        skipped = f", {len(self.skipped)} skipped" if self.skipped else ""
+        return f"{self.module}: {self.functions} functions, {self.classes} classes{skipped} in {self.guard_ns / 1e6:.2f}ms"
+
+
+# Guarded modules by name, in order
+__report__ = dict[str, ModuleGuards]()
+
+
+def guard_report() -> list[ModuleGuards]:
+    """
+    ## Guards installed on each module, with their import-time cost
+
+    ### Usage:
+
+    ```
+    for entry in guard_report():
+        print(entry)  # app.models: 12 functions, 4 classes in 3.20ms
+    ```
+    """
+    return list(__report__.values())
+
+
+def guard_module(module: ModuleType) -> ModuleType:
+    """
+    ## Type guard every annotated function and dataclass of a module
+
+    Functions (including methods of classes defined in the module) with type
+    annotations are replaced by guarded ones, and dataclasses are guarded in
+    place, as with `@type_guard`. Objects imported from other modules, and
+    objects already guarded, are left as is. No-op if `RTTC_GUARD=0`.
+
+    ### Usage:
+
+    ```
+    import app.models
+    guard_module(app.models)
+    ```
+    """
+    if not enabled() or module.__name__ in __report__:
+        return module
+    start = perf_counter_ns()
+    report = __report__[module.__name__] = ModuleGuards(module.__name__)
+    namespace = vars(module)
+    for name, obj in list(namespace.items()):
+        if getattr(obj, "__module__", None) != module.__name__:
+            continue
+        if isinstance(obj, FunctionType):
+            guarded = __guard__(obj, report)
+            if guarded is not None:
+                namespace[name] = guarded
+        elif isinstance(obj, type):
+            __guard_members__(obj, report)
+    report.guard_ns = perf_counter_ns() - start
+    return module
+
+
+def __guard__(fn: FunctionType, report: ModuleGuards) -> FunctionType | None:
+    """Guarded form of fn, None if it has no annotations or is guarded already"""
+    if not getattr(fn, "__annotations__", None) or getattr(fn, "__guarded__", False):
+        return None
+    try:
+        guarded = __guard_function__(fn, lazy=False)
+    except Exception as e:  # e.g. unresolvable forward references
+        report.skipped.append((fn.__qualname__, str(e)))
+        return None
+    report.functions += 1
+    return guarded
+
+
+def __guard_members__(cls: type, report: ModuleGuards):
+    for name, member in list(vars(cls).items()):
+        # Special methods are left alone, dataclass __init__ is checked below
+        if name.startswith("__") and name.endswith("__"):
+            continue
+        if isinstance(member, (staticmethod, classmethod)):
+            guarded = __guard__(member.__func__, report)
+            if guarded is not None:
+                setattr(cls, name, type(member)(guarded))
+        elif isinstance(member, FunctionType):
+            guarded = __guard__(member, report)
+            if guarded is not None:
+                setattr(cls, name, guarded)
+    init = vars(cls).get("__init__", None)
+    if is_dataclass(cls) and not getattr(init, "__guarded__", False):
+        try:
+            __guard_class__(cls)
+        except Exception as e:
+            report.skipped.append((cls.__qualname__, str(e)))
+            return
+        report.classes += 1
+
+
+class GuardLoader(Loader):
+    """Executes modules with their original loader, then guards them"""
+
+    def __init__(self, loader: Loader):
+        self.loader = loader
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType):
+        self.loader.exec_module(module)
+        guard_module(module)
+
+    def __getattr__(self, name: str):
+        # e.g. get_resource_reader(), get_source() of the original loader
+        return getattr(self.loader, name)
+
+
+class GuardFinder(MetaPathFinder):
+    """Import hook guarding modules of selected packages, see `guard_imports()`"""
+
+    def __init__(self, packages: tuple[str, ...]):
+        self.packages = packages
+
+    def selected(self, name: str) -> bool:
+        return any(name == package or name.startswith(f"{package}.") for package in self.packages)
+
+    def find_spec(self, name: str, path=None, target=None):
+        if not self.selected(name):
+            return None
+        # Find the module with the remaining finders, then hook its loader
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = GuardLoader(spec.loader)
+                return spec
+        return None
+
+    def remove(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+
+def guard_imports(*packages: str) -> GuardFinder | None:
+    """
+    ## Type guard modules of selected packages upon import
+
+    Modules of `packages` (and their submodules) imported from now on are
+    guarded by `guard_module()` right after they are executed. Returns the
+    import hook, see `GuardFinder.remove()`. No hook is installed (and None
+    is returned) if `RTTC_GUARD=0`.
+
+    ### Usage:
+
+    ```
+    guard_imports("app", "lib.models")
+    import app.service  # Guarded
+    ```
+    """
+    if not enabled():
+        return None
+    finder = GuardFinder(packages)
+    sys.meta_path.insert(0, finder)
+    return finder
+
+
+# Packages selected by the environment, guarded from now on
+__packages__ = tuple(package.strip() for package in os.environ.get(ENV_VAR, "").split(",") if package.strip() not in ("", "0", "1"))
+if len(__packages__) > 0:
+    guard_imports(*__packages__)
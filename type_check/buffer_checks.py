@@ -0,0 +1,136 @@
+import sys
+
+from .primitives import Chain, Mismatch
+from .core import register_checker, Checker, Failure, compile
+from .builtin_checks import sequence_check
+
+# Checkers for buffer protocol objects (array.array, memoryview, bytes, ...)
+# Elements of a 1-D buffer share one format code, so element types can be
+# answered from the format code in O(1) without boxing every element.
+from typing import Literal, Union, Any, get_origin, get_args
+from types import UnionType
+from array import array
+from collections.abc import Sequence, MutableSequence
+
+INT_FORMATS = frozenset("bBhHiIlLqQnNP")
+FLOAT_FORMATS = frozenset("efd")
+# Format codes understood by numpy.asarray()
+NUMPY_FORMATS = frozenset("bBhHiIlLqQefd?")
+
+# Format codes whose elements pass isinstance() check against each type
+FORMATS: dict[type, frozenset[str]] = {
+    int: INT_FORMATS | {"?"},  # bool is a subclass of int
+    float: FLOAT_FORMATS,
+    bool: frozenset("?"),
+    bytes: frozenset("c"),
+    str: frozenset("uw"),  # array.array unicode type codes
+}
+
+
+def loaded_numpy():
+    """NumPy if imported already, it is optional and slow to import"""
+    return sys.modules.get("numpy", None)
+
+
+def buffer_format(buf) -> str | None:
+    """Format code shared by all elements of a 1-D buffer, None if unknown"""
+    if isinstance(buf, array):
+        return buf.typecode
+    if isinstance(buf, (bytes, bytearray)):
+        return "B"
+    if isinstance(buf, memoryview) and buf.ndim == 1:
+        return buf.format.lstrip("@=<>!")
+    return None
+
+
+def accepted_formats(checker: Checker) -> frozenset[str] | None:
+    """Format codes accepted by an element checker, None if not decidable"""
+    if checker.hint in FORMATS:
+        return FORMATS[checker.hint]
+    if checker.origin is Union or checker.origin is UnionType:
+        formats = frozenset()
+        for arg in get_args(checker.hint):
+            arm = accepted_formats(compile(arg))
+            if arm is None:
+                return None
+            formats |= arm
+        return formats
+    return None
+
+
+def buffer_check(seq: Sequence, *args: Checker, chain: Chain) -> None | Failure:
+    fmt = buffer_format(seq) if len(args) == 1 else None
+    if fmt is None or len(seq) == 0:
+        return sequence_check(seq, *args, chain=chain)
+    typ = args[0]
+    formats = accepted_formats(typ)
+    if formats is not None:
+        if fmt in formats:
+            return
+        # All elements share one type, the first one is the first failure
+        return locate(seq, typ, 0, chain)
+    if typ.origin is Literal:
+        return literal_check(seq, fmt, typ, chain)
+    return sequence_check(seq, *args, chain=chain)
+
+
+def literal_check(seq: Sequence, fmt: str, typ: Checker, chain: Chain) -> None | Failure:
+    values = typ.args
+    numeric = fmt in NUMPY_FORMATS and all(isinstance(v, (int, float)) for v in values)
+    numpy = loaded_numpy() if numeric else None
+    if numpy is not None:
+        # Vectorized membership test, zero-copy through buffer protocol
+        mask = numpy.isin(numpy.asarray(memoryview(seq)), values)
+        if mask.all():
+            return
+        return locate(seq, typ, int(mask.argmin()), chain)
+    try:
+        if frozenset(values).issuperset(seq):
+            return
+    except TypeError:  # Unhashable literal values
+        return sequence_check(seq, typ, chain=chain)
+    for i, el in enumerate(seq):
+        if el not in values:
+            return locate(seq, typ, i, chain)
+
+
+def locate(seq: Sequence, typ: Checker, i: int, chain: Chain) -> None | Failure:
+    failure = typ.__check__(seq[i], chain)
+    if failure is not None:
+        return failure.within(Chain.Key(i))
+
+
+register_checker(Sequence, buffer_check)
+register_checker(MutableSequence, buffer_check)
+
+
+def ndarray_check(arr, shape: Checker | None = None, dtype: Checker | None = None, *, chain: Chain) -> None | Failure:
+    """
+    Checks `numpy.ndarray[shape, numpy.dtype[scalar]]` from array metadata,
+    e.g. `numpy.ndarray[tuple[int, int], numpy.dtype[numpy.float64]]`.
+    """
+    if shape is not None and not shape_match(arr.shape, shape.hint):
+        return Mismatch(chain, [shape.hint], arr.shape).within(Chain.Attr("shape"))
+    if dtype is not None:
+        (scalar,) = get_args(dtype.hint) or (Any,)
+        scalar = get_origin(scalar) or scalar
+        if scalar is not Any and not loaded_numpy().issubdtype(arr.dtype, scalar):
+            return Mismatch(chain, [scalar], arr.dtype).within(Chain.Attr("dtype"))
+
+
+def shape_match(shape: tuple[int, ...], hint) -> bool:
+    if hint is Any or get_origin(hint) is not tuple:
+        return True
+    dims = get_args(hint)
+    if len(dims) == 2 and dims[1] is Ellipsis:
+        return True
+    if len(dims) != len(shape):
+        return False
+    for size, dim in zip(shape, dims):
+        if get_origin(dim) is Literal and size not in get_args(dim):
+            return False
+    return True
+
+
+# NumPy is not imported here, arrays can only be met once it is
+register_checker("numpy.ndarray", ndarray_check)
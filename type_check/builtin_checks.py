@@ -1,51 +1,169 @@
-from .primitives import Chain, TypeCheckError
-from .core import builtin_checks, type_assert
+from .primitives import Chain, Mismatch
+from .core import register_checker, Checker, Failure
+from .policy import __sampling__, pick
 
 # Checkers for builtin types
-from typing import Sequence, Any
+# Elements are checked against the container's own chain, the key of a failing
+# element is recorded on the failure (see Mismatch.within) only on failure.
+from typing import Sequence, Iterable, Generator, NoReturn
+from collections.abc import Set as AbstractSet, Mapping
 
+# Containers shorter than this are not worth a bulk scan
+BULK_SCAN_THRESHOLD = 16
 
-def sequence_check(seq: Sequence, *args: type, chain: Chain) -> bool:
+
+def homogeneous(items: Iterable, classes: tuple[type, ...]) -> bool:
+    """
+    Bulk scan for primitive element types, same result as checking
+    isinstance(item, classes) on each item, but without a Python level loop.
+    """
+    types = set(map(type, items))
+    if len(types) == 1:
+        return issubclass(types.pop(), classes)
+    return all(issubclass(t, classes) for t in types)
+
+
+def bulk_check(items: Iterable, typ: Checker) -> bool:
+    """True if all items are known to pass typ, False if undecided"""
+    if typ.classes is None or len(items) < BULK_SCAN_THRESHOLD:
+        return False
+    return homogeneous(items, typ.classes)
+
+
+def sequence_check(seq: Sequence, *args: Checker, chain: Chain) -> None | Failure:
     if len(args) == 0:
         # No type hint, anything is allowed
         pass
     elif len(args) == 1:
         # Single type hint, all elements must be of this type
         typ = args[0]
-        for i, el in enumerate(seq):
-            type_assert(el, typ, chain=chain(Chain.Key(i)))
+        check = typ.__check__
+        sampling = __sampling__.get()
+        if sampling is not None:
+            for i in sampling.select(len(seq)):
+                failure = check(seq[i], chain)
+                if failure is not None:
+                    return failure.within(Chain.Key(i))
+            return
+        if bulk_check(seq, typ):
+            return
+        # Slow path, also locates the first offending element
+        for el in seq:
+            failure = check(el, chain)
+            if failure is not None:
+                return failure.within(Chain.Key(index_of(seq, el)))
     elif len(args) == len(seq):
         # Type check each item with corresponding type hint
         for i, (el, typ) in enumerate(zip(seq, args)):
-            type_assert(el, typ, chain=chain(Chain.Key(i)))
+            failure = typ.__check__(el, chain)
+            if failure is not None:
+                return failure.within(Chain.Key(i))
     else:
         # Number of items mismatches with number of type hints
-        raise TypeCheckError(chain, [type(seq)[args]], seq)
+        hints = tuple(typ.hint for typ in args)
+        return Mismatch(chain, [type(seq)[hints]], seq)
+
+
+def index_of(seq: Sequence, el) -> int:
+    # Checks are deterministic, so the first occurrence of a failing element is
+    # also the first failure - no need to count indices on the success path
+    for i, item in enumerate(seq):
+        if item is el:
+            return i
+
+
+def sequence_walk(seq: Sequence, *args: Checker, chain: Chain) -> Generator:
+    # Generator form of sequence_check(), for elements that nest further
+    if len(args) == 0:
+        return
+    elif len(args) == 1:
+        typ = args[0]
+        sampling = __sampling__.get()
+        indices = range(len(seq)) if sampling is None else sampling.select(len(seq))
+        for i in indices:
+            failure = yield seq[i], typ, chain
+            if failure is not None:
+                return failure.within(Chain.Key(i))
+    elif len(args) == len(seq):
+        for i, (el, typ) in enumerate(zip(seq, args)):
+            failure = yield el, typ, chain
+            if failure is not None:
+                return failure.within(Chain.Key(i))
+    else:
+        return sequence_check(seq, *args, chain=chain)
 
 
-builtin_checks[list] = sequence_check
-builtin_checks[tuple] = sequence_check
-builtin_checks[Sequence] = sequence_check
+register_checker(list, sequence_check, sequence_walk)
+register_checker(tuple, sequence_check, sequence_walk)
 
-def set_check(s: set, typ: type, *, chain: Chain) -> bool:
+def set_check(s: set, typ: Checker, *, chain: Chain) -> None | Failure:
+    check = typ.__check__
+    sampling = __sampling__.get()
+    if sampling is not None:
+        s = pick(s, sampling.select(len(s)))
+    elif bulk_check(s, typ):
+        return
     for el in s:
-        type_assert(el, typ, chain=chain("[?]"))
+        failure = check(el, chain)
+        if failure is not None:
+            return failure.within("[?]")
+
+
+def set_walk(s: set, typ: Checker, *, chain: Chain) -> Generator:
+    sampling = __sampling__.get()
+    if sampling is not None:
+        s = pick(s, sampling.select(len(s)))
+    for el in s:
+        failure = yield el, typ, chain
+        if failure is not None:
+            return failure.within("[?]")
+
+
+register_checker(set, set_check, set_walk)
+register_checker(AbstractSet, set_check, set_walk)
+
+
+def dict_check(d: dict, key_type: Checker, value_type: Checker | None = None, *, chain: Chain) -> None | Failure:
+    check_key = key_type.__check__
+    check_value = value_type.__check__ if value_type is not None else None
+    items = d.items()
+    sampling = __sampling__.get()
+    if sampling is not None:
+        items = pick(items, sampling.select(len(d)))
+    elif bulk_check(d.keys(), key_type):
+        if value_type is None or bulk_check(d.values(), value_type):
+            return
+    for key, val in items:
+        failure = check_key(key, chain)
+        if failure is not None:
+            return failure.within("<key>")
+        if check_value is not None:
+            failure = check_value(val, chain)
+            if failure is not None:
+                return failure.within(Chain.Key(key))
 
-builtin_checks[set] = set_check
 
+def dict_walk(d: dict, key_type: Checker, value_type: Checker | None = None, *, chain: Chain) -> Generator:
+    items = d.items()
+    sampling = __sampling__.get()
+    if sampling is not None:
+        items = pick(items, sampling.select(len(d)))
+    for key, val in items:
+        failure = yield key, key_type, chain
+        if failure is not None:
+            return failure.within("<key>")
+        if value_type is not None:
+            failure = yield val, value_type, chain
+            if failure is not None:
+                return failure.within(Chain.Key(key))
 
-def dict_check(d: dict, key_type: type, value_type: type=Any, *, chain: Chain) -> bool:
-    for key, val in d.items():
-        type_assert(key, key_type, chain=chain("<key>"))
-        type_assert(val, value_type, chain=chain(Chain.Key(key)))
 
-builtin_checks[dict] = dict_check
+register_checker(dict, dict_check, dict_walk)
+register_checker(Mapping, dict_check, dict_walk)
 
 
-def no_check(item, *args: type, chain: Chain) -> bool:
+def no_check(item, *args: Checker, chain: Chain) -> NoReturn:
     raise TypeError(f"Type check on {repr(item)} is potentially destructive")
 
 
-from typing import Iterable
-builtin_checks[Iterable] = no_check
-builtin_checks[frozenset] = no_check
+register_checker(frozenset, no_check)
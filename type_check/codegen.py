@@ -0,0 +1,337 @@
+import builtins
+import importlib
+from types import UnionType, NoneType
+from typing import Union, Literal, Callable, Iterable, get_args, get_origin, _type_repr as type_repr
+
+from .primitives import Chain, Mismatch
+from .core import resolve_checker, compile, Checker, __compile__, __compile_cached__, __compile_variant__, precompiled
+from .builtin_checks import sequence_check, set_check, dict_check, homogeneous, BULK_SCAN_THRESHOLD
+from .policy import __sampling__
+
+# Source code generation backend
+# Hints are translated into specialized Python functions, e.g. list[tuple[float, str]]
+# becomes a loop with inlined `type(x) is float` tests. Containers of exact
+# builtin types get generated loops, anything else (classes, hooks, buffers,
+# sampled checks, subclasses of builtins) falls back to compiled checkers, so
+# that verdicts and failure paths are the same as with compile().
+
+# Builtin containers with a generated loop, and the checker their loop replicates
+LOOPS = {list: sequence_check, tuple: sequence_check, set: set_check, dict: dict_check}
+
+HEADER = "# Generated by `python -m type_check export`, do not edit"
+
+
+class Lazy:
+    """Check compiled upon first use, keeps imports of generated modules cheap"""
+
+    __slots__ = ("hint", "compiler", "checker")
+
+    def __init__(self, hint, compiler):
+        self.hint = hint
+        self.compiler = compiler
+        self.checker: Checker | None = None
+
+    def __call__(self, obj, chain: Chain):
+        if self.checker is None:
+            self.checker = self.compiler(self.hint)
+        return self.checker.__check__(obj, chain)
+
+    def walk(self, obj, chain: Chain):
+        """Walk of the compiled check, for limits and the iterative engine"""
+        if self.checker is None:
+            self.checker = self.compiler(self.hint)
+        if self.checker.__walk__ is None:
+            return self.checker.__check__(obj, chain)
+        return (yield from self.checker.__walk__(obj, chain))
+
+
+# Names available to generated code
+RUNTIME = dict(
+    Checker=Checker,
+    Mismatch=Mismatch,
+    Key=Chain.Key,
+    Lazy=Lazy,
+    compile=compile,
+    fallback=__compile__,
+    get_args=get_args,
+    get_origin=get_origin,
+    homogeneous=homogeneous,
+    BULK_SCAN_THRESHOLD=BULK_SCAN_THRESHOLD,
+    __sampling__=__sampling__,
+)
+
+
+class Source:
+    """Generated source of the checkers of some type hints"""
+
+    def __init__(self):
+        # Type hints referred to by generated code, as H0, H1, ...
+        self.hints = list()
+        # Constants derived from hints, as (name, expression) pairs, and
+        # generated functions. Constants without an expression are values
+        # computed at generation time, e.g. the classes accepted by a hint
+        self.constants = list[tuple[str, str | None]]()
+        self.values = dict[str, object]()
+        self.defined = set[str]()
+        self.functions = list[str]()
+        # Name of the check function of each hint index
+        self.names = dict[int, str]()
+
+    def index(self, hint) -> int:
+        for i, h in enumerate(self.hints):
+            if h is hint or (type(h) is type(hint) and h == hint):
+                return i
+        self.hints.append(hint)
+        k = len(self.hints) - 1
+        self.constant(f"H{k}", f"HINTS[{k}]")
+        return k
+
+    def constant(self, name: str, expression: str):
+        if name not in self.defined:
+            self.defined.add(name)
+            self.constants.append((name, expression))
+
+    def value(self, name: str, value):
+        if name not in self.defined:
+            self.defined.add(name)
+            self.values[name] = value
+            self.constants.append((name, None))
+
+    def check(self, hint) -> str:
+        """Name of a function checking hint, generated upon first request"""
+        k = self.index(hint)
+        if k in self.names:
+            return self.names[k]
+        checker = compile(hint)
+        origin, args = get_origin(hint), get_args(hint)
+        if checker.classes is not None or origin is Literal:
+            name = self.names[k] = f"check_{k}"
+            self.define(name, hint, self.test("obj", hint, ""))
+        elif origin is Union or origin is UnionType:
+            name = self.names[k] = f"check_{k}"
+            self.union(name, k, args)
+        elif self.loop(origin or hint, args):
+            name = self.names[k] = f"check_{k}"
+            self.container(name, k, origin, args)
+        else:
+            # Delegated to the compiled checker
+            name = self.names[k] = f"D{k}"
+            self.constant(name, f"Lazy(H{k}, compile)")
+        return name
+
+    def loop(self, origin, args: tuple) -> bool:
+        if LOOPS.get(origin, None) is not resolve_checker(origin):
+            return False
+        if origin is tuple:
+            return len(args) > 0 and args != ((),) and Ellipsis not in args
+        if origin is dict:
+            return len(args) == 2
+        return len(args) == 1
+
+    def condition(self, var: str, hint) -> str | None:
+        """Inline expression, true if var passes hint, None if hint needs a function"""
+        checker = compile(hint)
+        k = self.index(hint)
+        origin = get_origin(hint)
+        if checker.classes is not None:
+            union = origin is Union or origin is UnionType
+            self.value(f"C{k}", checker.classes)
+            self.constant(f"E{k}", f"get_args(H{k})" if union else f"[H{k}]")
+            if len(checker.classes) == 1:
+                return f"type({var}) is C{k}[0] or isinstance({var}, C{k})"
+            return f"type({var}) in C{k} or isinstance({var}, C{k})"
+        if origin is Literal:
+            self.constant(f"A{k}", f"get_args(H{k})")
+            self.constant(f"E{k}", f"[H{k}]")
+            return f"{var} in A{k}"
+        return None
+
+    def test(self, var: str, hint, within: str) -> list[str]:
+        """Lines checking var against hint, failures return with within appended"""
+        condition = self.condition(var, hint)
+        if condition is not None:
+            k = self.index(hint)
+            return [f"if not ({condition}):", f"    return Mismatch(chain, E{k}, {var}){within}"]
+        name = self.check(hint)
+        lines = [f"failure = {name}({var}, chain)", "if failure is not None:"]
+        return lines + [f"    return failure{within}" if within else "    return failure"]
+
+    def define(self, name: str, hint, body: list[str]):
+        lines = [f"def {name}(obj, chain):", f"    # {type_repr(hint)}"]
+        lines.extend(f"    {line}" for line in body)
+        self.functions.append("\n".join(lines))
+
+    def union(self, name: str, k: int, args: tuple):
+        body = list[str]()
+        for arm in args:
+            # Each arm passes or falls through to the next one
+            condition = self.condition("obj", arm)
+            if condition is None:
+                condition = f"{self.check(arm)}(obj, chain) is None"
+            body += [f"if {condition}:", "    return"]
+        self.constant(f"E{k}", f"get_args(H{k})")
+        body.append(f"return Mismatch(chain, E{k}, obj)")
+        self.define(name, self.hints[k], body)
+
+    def container(self, name: str, k: int, origin: type, args: tuple):
+        self.constant(f"F{k}", f"Lazy(H{k}, fallback)")
+        body = [
+            f"if type(obj) is not {origin.__name__} or __sampling__.get() is not None:",
+            f"    return F{k}(obj, chain)",
+        ]
+        leaf = [compile(arg).classes for arg in args]
+        if origin is tuple and len(args) > 1:
+            self.constant(f"E{k}", f"[H{k}]")
+            body += [f"if len(obj) != {len(args)}:", f"    return Mismatch(chain, E{k}, obj)"]
+            for i, arg in enumerate(args):
+                body.append(f"x{i} = obj[{i}]")
+                body += self.test(f"x{i}", arg, f".within(Key({i}))")
+        elif origin is dict:
+            if all(classes is not None for classes in leaf):
+                body += self.bulk(["obj.keys()", "obj.values()"], args)
+            body.append("for key, value in obj.items():")
+            body += [f"    {line}" for line in self.test("key", args[0], '.within("<key>")')]
+            body += [f"    {line}" for line in self.test("value", args[1], ".within(Key(key))")]
+        else:
+            if leaf[0] is not None:
+                body += self.bulk(["obj"], args)
+            if origin is set:
+                body.append("for x in obj:")
+                body += [f"    {line}" for line in self.test("x", args[0], '.within("[?]")')]
+            else:
+                body.append("for i, x in enumerate(obj):")
+                body += [f"    {line}" for line in self.test("x", args[0], ".within(Key(i))")]
+        self.define(name, self.hints[k], body)
+
+    def bulk(self, items: list[str], args: tuple) -> list[str]:
+        # Same bulk scan as builtin_checks.bulk_check()
+        for arg in args:
+            self.condition("x", arg)  # Defines C{k}
+        scans = [f"homogeneous({items}, C{self.index(arg)})" for items, arg in zip(items, args)]
+        return [f"if len(obj) >= BULK_SCAN_THRESHOLD and {' and '.join(scans)}:", "    return"]
+
+    def body(self, roots: list[int], literal: Callable[[object], str] | None = None) -> str:
+        """Module source, literal renders values (VALUES[name] by default), nothing is compiled upon import"""
+        constants = list[str]()
+        for name, expression in self.constants:
+            if expression is None:
+                expression = f"VALUES[{repr(name)}]" if literal is None else literal(self.values[name])
+            constants.append(f"{name} = {expression}")
+        # Generated checks run to completion, limited checks walk compiled ones
+        walks = {k: "None" if f"C{k}" in self.values else f"W{k}.walk" for k in roots}
+        for k in roots:
+            if walks[k] != "None":
+                constants.append(f"W{k} = Lazy(H{k}, fallback)")
+        classes = {k: f"C{k}" if f"C{k}" in self.values else "None" for k in roots}
+        table = ", ".join(f"H{k}: Checker(H{k}, get_origin(H{k}) or H{k}, get_args(H{k}), {self.names[k]}, {classes[k]}, {walks[k]})" for k in roots)
+        return "\n".join(constants) + "\n\n\n" + "\n\n\n".join(self.functions) + f"\n\n\nCHECKERS = {{{table}}}\n"
+
+
+def __generate__(hints: Iterable) -> tuple[Source, list[int]]:
+    source = Source()
+    roots = list[int]()
+    for hint in hints:
+        if source.check(hint).startswith("check_"):
+            roots.append(source.index(hint))
+    return source, roots
+
+
+def build(hint) -> Checker:
+    """
+    ## Compile a type hint through generated source code
+
+    Same verdicts and failure paths as `compile()`, hints that do not benefit
+    from generated code are compiled as usual.
+    """
+    source, roots = __generate__([hint])
+    if len(roots) == 0:
+        return compile(hint)
+    namespace = dict(RUNTIME, HINTS=source.hints, VALUES=source.values)
+    exec(builtins.compile(source.body(roots), f"<type_check {type_repr(hint)}>", "exec"), namespace)
+    return namespace["CHECKERS"][source.hints[roots[0]]]
+
+
+def generate(hints: Iterable) -> str:
+    """Source of an importable module holding the checkers of hints, see `export()`"""
+    source, roots = __generate__(hints)
+    modules = dict[str, str]()
+    expressions = [__source__(hint, modules) for hint in source.hints]
+
+    def literal(classes: tuple) -> str:
+        items = ", ".join(__source__(cls, modules) for cls in classes)
+        return f"({items},)" if len(classes) == 1 else f"({items})"
+
+    body = source.body(roots, literal)
+    values = [(source.values[name], literal(source.values[name])) for name in source.values]
+    namespace = {alias: importlib.import_module(module) for module, alias in modules.items()}
+    for hint, expression in zip(source.hints, expressions):
+        if eval(expression, namespace) != hint:
+            raise ValueError(f"Type hint {type_repr(hint)} cannot be exported")
+    for value, expression in values:
+        if eval(expression, namespace) != value:
+            raise ValueError(f"Classes {value} cannot be exported")
+    lines = [HEADER, "import importlib", "from type_check.codegen import RUNTIME, install", ""]
+    lines += [f'{alias} = importlib.import_module("{module}")' for module, alias in modules.items()]
+    lines += ["globals().update(RUNTIME)", "", "HINTS = ["]
+    lines += [f"    {expression}," for expression in expressions]
+    lines += ["]", "", body, "install(CHECKERS)", ""]
+    return "\n".join(lines)
+
+
+def export(hints: Iterable, path: str):
+    """
+    ## Write the checkers of hints to an importable module
+
+    Importing the module installs its checkers: `compile()` (and thus
+    `type_check()`, `type_assert()` and `@type_guard`) returns them for
+    these hints without interpreting the hints again.
+
+    ### Usage:
+
+    ```
+    export([list[tuple[float, str]], dict[str, Record]], "checkers.py")
+    import checkers  # Warm start
+    ```
+    """
+    with open(path, "w") as f:
+        f.write(generate(hints))
+
+
+def install(checkers: dict[type, Checker]):
+    """Use precompiled checkers for their hints from now on"""
+    precompiled.update(checkers)
+    __compile_cached__.cache_clear()
+    __compile_variant__.cache_clear()
+
+
+def __source__(hint, modules: dict[str, str]) -> str:
+    """Python expression evaluating to hint, modules maps imports to aliases"""
+
+    def module(name: str) -> str:
+        if name not in modules:
+            modules[name] = f"_m{len(modules)}"
+        return modules[name]
+
+    if hint is None:
+        return "None"
+    if hint is NoneType:
+        return "type(None)"
+    if hint is Ellipsis:
+        return "..."
+    origin, args = get_origin(hint), get_args(hint)
+    if origin is Literal:
+        return f"{module('typing')}.Literal[{', '.join(map(repr, args))}]"
+    if origin is Union or origin is UnionType:
+        return f"{module('typing')}.Union[{', '.join(__source__(arg, modules) for arg in args)}]"
+    if origin is not None:
+        items = ", ".join(__source__(arg, modules) for arg in args) if len(args) > 0 else "()"
+        return f"{__source__(origin, modules)}[{items}]"
+    if isinstance(hint, type):
+        if hint.__module__ == "builtins":
+            return hint.__qualname__
+        if hint.__module__ == "__main__" or "<locals>" in hint.__qualname__:
+            raise ValueError(f"{type_repr(hint)} cannot be imported by generated code")
+        return f"{module(hint.__module__)}.{hint.__qualname__}"
+    if getattr(hint, "__module__", None) == "typing":
+        return f"{module('typing')}.{repr(hint).removeprefix('typing.')}"
+    raise ValueError(f"Type hint {type_repr(hint)} cannot be exported")
@@ -0,0 +1,211 @@
+from contextlib import contextmanager
+from typing import Iterable, _type_repr as type_repr
+
+from .primitives import Chain
+from .core import resolve_checker, compile, type_assert, Checker
+from .policy import __sampling__
+from .limits import __limits__
+from .__private__ import Nothing
+
+# Type-enforcing containers, elements are validated once upon insertion.
+# Checking them against a matching hint (e.g. list[int]) is answered in O(1)
+# through the __type_check__ hook, without scanning the elements again.
+
+
+class Checked:
+    # Type arguments of a specialized container, e.g. (int,) for CheckedList[int]
+    __hint__: tuple = Nothing
+    # Compiled checkers for each type argument
+    __checkers__: tuple[Checker, ...] = tuple()
+    # Cached specializations, keyed by (base class, type arguments)
+    __specializations__ = dict[tuple[type, tuple], type]()
+
+    def __class_getitem__(cls, params):
+        if cls.__hint__ is not Nothing:
+            raise TypeError(f"{type_repr(cls)} is already specialized")
+        if not isinstance(params, tuple):
+            params = (params,)
+        key = (cls, params)
+        if key not in Checked.__specializations__:
+            name = f"{cls.__name__}[{', '.join(map(type_repr, params))}]"
+            namespace = dict(
+                __hint__=params,
+                __checkers__=tuple(map(compile, params)),
+                __qualname__=name,
+                __module__=cls.__module__,
+            )
+            Checked.__specializations__[key] = type(cls.__name__, (cls,), namespace)
+        return Checked.__specializations__[key]
+
+    def __new__(cls, *args, **kwargs):
+        if cls.__hint__ is Nothing:
+            raise TypeError(f"{cls.__name__} must be specialized before use, e.g. {cls.__name__}[int]()")
+        return super().__new__(cls, *args, **kwargs)
+
+    def __repr__(self):
+        return f"{type(self).__qualname__}({repr(self.__base_type__(self))})"
+
+    def __reduce__(self):
+        # Specializations are created on the fly, rebuild them upon unpickling
+        base = type(self).__mro__[1]
+        return (__rebuild__, (base, self.__hint__, self.__base_type__(self)))
+
+    def __type_check__(self, *args, chain: Chain):
+        if len(args) == 0 or args == self.__hint__:
+            return
+        if all(map(covers, map(compile, args), self.__checkers__)):
+            return
+        # Hint does not match recorded element types, check elements again
+        return resolve_checker(self.__base_type__)(self, *map(compile, args), chain=chain)
+
+    def __validate__(self, item, typ: Checker, key):
+        with __exhaustive__():
+            type_assert(item, typ, chain=Chain(type(self).__name__)(key), policy=None)
+
+
+@contextmanager
+def __exhaustive__():
+    """
+    Insertion checks ignore the enclosing `check_policy()` and `check_limits()`,
+    later checks trust the recorded element types without scanning them
+    """
+    sampling, limits = __sampling__.set(None), __limits__.set(None)
+    try:
+        yield
+    finally:
+        __limits__.reset(limits)
+        __sampling__.reset(sampling)
+
+
+def __rebuild__(base: type[Checked], hint: tuple, data):
+    return base[hint](data)
+
+
+def covers(outer: Checker, inner: Checker) -> bool:
+    """True if every value passing inner is known to pass outer"""
+    if outer is inner or outer.hint == inner.hint:
+        return True
+    if outer.classes is None or inner.classes is None:
+        return False
+    return all(issubclass(cls, outer.classes) for cls in inner.classes)
+
+
+class CheckedList(Checked, list):
+    """
+    List that validates elements upon insertion, e.g. `CheckedList[int]([1, 2])`.
+    `type_check(obj, list[int])` is then answered in O(1).
+    """
+
+    __base_type__ = list
+
+    def __init__(self, iterable: Iterable = tuple()):
+        super().__init__()
+        self.extend(iterable)
+
+    def __validate_items__(self, items: list, start: int):
+        (typ,) = self.__checkers__
+        with __exhaustive__():
+            if compile(list[typ.hint]).type_check(items, policy=None, memo=None, retain="value"):
+                return
+        # Locate the offending item
+        for i, item in enumerate(items):
+            self.__validate__(item, typ, Chain.Key(start + i))
+
+    def append(self, item):
+        self.__validate__(item, self.__checkers__[0], Chain.Key(len(self)))
+        super().append(item)
+
+    def insert(self, index: int, item):
+        self.__validate__(item, self.__checkers__[0], Chain.Key(index))
+        super().insert(index, item)
+
+    def extend(self, iterable: Iterable):
+        items = list(iterable)
+        self.__validate_items__(items, len(self))
+        super().extend(items)
+
+    def __iadd__(self, iterable: Iterable):
+        self.extend(iterable)
+        return self
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            self.__validate_items__(value, index.indices(len(self))[0])
+        else:
+            self.__validate__(value, self.__checkers__[0], Chain.Key(index))
+        super().__setitem__(index, value)
+
+
+class CheckedDict(Checked, dict):
+    """
+    Dict that validates keys and values upon insertion, e.g.
+    `CheckedDict[str, int](a=1)`. `type_check(obj, dict[str, int])` is then
+    answered in O(1).
+    """
+
+    __base_type__ = dict
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, key, value):
+        key_type, value_type = self.__checkers__
+        self.__validate__(key, key_type, "<key>")
+        self.__validate__(value, value_type, Chain.Key(key))
+        super().__setitem__(key, value)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+
+class CheckedSet(Checked, set):
+    """
+    Set that validates elements upon insertion, e.g. `CheckedSet[int]({1, 2})`.
+    `type_check(obj, set[int])` is then answered in O(1).
+    """
+
+    __base_type__ = set
+
+    def __init__(self, iterable: Iterable = tuple()):
+        super().__init__()
+        self.update(iterable)
+
+    def add(self, item):
+        self.__validate__(item, self.__checkers__[0], "[?]")
+        super().add(item)
+
+    def update(self, *iterables: Iterable):
+        for iterable in iterables:
+            items = set(iterable)
+            with __exhaustive__():
+                passed = compile(set[self.__hint__[0]]).type_check(items, policy=None, memo=None, retain="value")
+            if not passed:
+                for item in items:
+                    self.__validate__(item, self.__checkers__[0], "[?]")
+            super().update(items)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def symmetric_difference_update(self, other: Iterable):
+        other = list(other)
+        for item in other:
+            self.__validate__(item, self.__checkers__[0], "[?]")
+        super().symmetric_difference_update(other)
+
+    def __ixor__(self, other):
+        self.symmetric_difference_update(other)
+        return self
@@ -1,25 +1,204 @@
-from typing import Union, Callable, NoReturn, Literal, TypeVar, _type_repr as type_repr
+from typing import Union, Callable, Generator, NoReturn, Literal, TypeVar, Generic, _GenericAlias, _type_repr as type_repr
 from typing import get_args, get_origin, get_type_hints
 from typing_extensions import Unpack
 from types import UnionType
-from functools import wraps
-
-from .primitives import Chain, TypeCheckError, TypeCheckResult
+from abc import ABCMeta
+from functools import lru_cache
+from contextvars import ContextVar
+from weakref import finalize
+
+from .primitives import Chain, Mismatch, Retain, TypeCheckError, TypeCheckResult
+from .policy import Policy, Sampling, check_policy, __sampling__
+from .limits import Limits, check_limits, __limits__
+from .memo import Memo, __memo__
+from .instrument import Instrumentation, __instrumentation__
+from .settings import current
 from .__private__ import Nothing
 
-# By default, raise TypeError (not TypeCheckError) upon encountering objects that
-# do not support type check (i.e. with no __type_check__ method and no type hints)
-# Otherwise, type check will skip type check on items that do not support type_check
-STRICT = True
+# Options such as strict mode and the checking engine are carried by context
+# variables, see settings.config()
+
+# Maximum number of compiled type hints kept in cache (least recently used
+# entries are evicted first). Takes effect at import time.
+COMPILE_CACHE_SIZE = 1024
 
-# If True, type check will raise TypeCheckError upon missing attribute
-# i.e. an attribute declared in type hint but not present in object
-CHECK_MISSING_ATTR = False
+# Maximum number of object types remembered by each union dispatch table
+UNION_DISPATCH_SIZE = 256
 
-# Returns None on success, raises TypeError or TypeCheckError on failure
-TypeChecker = Callable[[object, Unpack[list[type]]], None | NoReturn]
+# Returns None on success, returns a Mismatch (or raises TypeCheckError) on failure
+# Raises TypeError if the object cannot be checked
+# Builtin checkers receive one compiled Checker per type argument
+# Registered by class, see register_checker()
+Failure = Mismatch | TypeCheckError
+TypeChecker = Callable[[object, Unpack[list["Checker"]]], None | Failure]
 builtin_checks = dict[type, TypeChecker]()
 
+# Checker of each class resolved through its MRO (None if none applies),
+# filled upon first use and cleared upon registration
+__resolved__ = dict[type, TypeChecker | None]()
+
+# Checkers registered by qualified class name (e.g. "numpy.ndarray"), moved
+# to builtin_checks once the class is met, so its module is never imported
+__deferred__ = dict[str, TypeChecker]()
+
+# Objects that can only be checked lazily (e.g. iterators) are wrapped upon
+# type_assert(), keyed by origin: (obj, checker, chain) -> wrapped obj
+Wrapper = Callable[[object, "Checker", Chain], object]
+wrappers = dict[type, Wrapper]()
+
+# Compiled form of a type hint, returns None on success or a Failure, never
+# raises TypeCheckError (raising is left to the public boundary)
+Plan = Callable[[object, Chain], None | Failure]
+
+# Generator form of a plan for the iterative engine: yields (obj, checker, chain)
+# for each nested check, receives its outcome and returns its own outcome
+Walk = Callable[[object, Chain], Generator[tuple[object, "Checker", Chain], None | Failure, None | Failure]]
+
+# Generator forms of builtin checkers (same arguments), keyed by the checker
+builtin_walks = dict[TypeChecker, Callable[..., Generator]]()
+
+# Objects checked (or being checked) during the current top-level check, keyed
+# by (id(obj), id of the check). Each unique object/hint pair is checked once:
+# shared sub-objects are not checked again, and cycles back to an object being
+# checked pass. Values keep the objects alive, so that ids are not reused.
+Visited = dict[tuple[int, int], object]
+__visited__ = ContextVar[Visited | None]("visited", default=None)
+
+# Pool checking huge top-level containers in chunks, see parallel_checks.parallel()
+__parallel__ = ContextVar["Parallel | None"]("parallel", default=None)
+
+
+class Checker:
+    """
+    Reusable type checker compiled from a type hint, see `compile()`.
+    """
+
+    __slots__ = ("hint", "origin", "args", "classes", "__check__", "__walk__")
+
+    def __init__(
+        self,
+        hint: type,
+        origin: type,
+        args: tuple,
+        plan: Plan,
+        classes: tuple[type, ...] | None = None,
+        walk: Walk | None = None,
+    ):
+        self.hint = hint
+        self.origin = origin
+        self.args = args
+        # If not None, this check is exactly isinstance(obj, classes)
+        self.classes = classes
+        # Internal entry point, skips the bookkeeping done by type_assert()
+        self.__check__ = plan
+        # Same check for the iterative engine, None if it does not nest
+        self.__walk__ = walk
+
+    def type_check(self, obj, **kwargs) -> TypeCheckResult:
+        return type_check(obj, self, **kwargs)
+
+    def type_assert(self, obj, **kwargs):
+        return type_assert(obj, self, **kwargs)
+
+    def __type_assert__(self, obj, chain: Chain) -> None | NoReturn:
+        """Raising form of __check__(), for use in custom __type_check__ hooks"""
+        failure = self.__check__(obj, chain)
+        if failure is not None:
+            raise failure.error()
+
+    __call__ = type_check
+
+    def __reduce__(self):
+        # Plans are closures, checkers are recompiled from their hint instead
+        return (compile, (self.hint,))
+
+    def __repr__(self) -> str:
+        return f"Checker({type_repr(self.hint)})"
+
+
+def register_checker(cls: type | str, check: TypeChecker, walk: Callable[..., Generator] | None = None) -> TypeChecker:
+    """
+    ## Register a checker for a class and its subclasses
+
+    `check(obj, *checkers, chain=chain)` receives one compiled `Checker` per
+    type argument of the hint (e.g. `MyList[int]`) and returns None on
+    success or a `Mismatch`. Parameterized hints of subclasses, and of
+    classes registered to an ABC (e.g. `Mapping.register(C)`), use the
+    checker registered for the nearest class in their MRO, as with
+    `functools.singledispatch`. Classes merely implementing the methods of an
+    ABC (e.g. `__iter__` for `Iterable`) are checked by their type hints.
+    An optional `walk` is its generator form, for the iterative engine.
+    Classes of optional dependencies can be given by qualified name, e.g.
+    `"numpy.ndarray"`, the checker applies once the module is imported.
+
+    ### Usage:
+
+    ```
+    def grid_check(grid, cell: Checker, *, chain: Chain):
+        for i, cell in enumerate(grid.cells()):
+            ...
+
+    register_checker(Grid, grid_check)
+    type_check(grid, Grid[int])
+    ```
+    """
+    if isinstance(cls, str):
+        __deferred__[cls] = check
+    else:
+        builtin_checks[cls] = check
+    if walk is not None:
+        builtin_walks[check] = walk
+    # Plans captured the checkers resolved at compile time
+    __resolved__.clear()
+    __compile_cached__.cache_clear()
+    __compile_variant__.cache_clear()
+    __instrumented__.clear()
+    return check
+
+
+def resolve_checker(cls: type) -> TypeChecker | None:
+    """Checker registered for cls or its nearest base class (or ABC), if any"""
+    try:
+        return __resolved__[cls]
+    except KeyError:
+        pass
+    if len(__deferred__) > 0 and isinstance(cls, type):
+        __bind__(cls)
+    check = builtin_checks.get(cls, None)
+    if check is None and isinstance(cls, type):
+        check = __nearest__(cls)
+    __resolved__[cls] = check
+    return check
+
+
+def __nearest__(cls: type) -> TypeChecker | None:
+    """Checker of the nearest class in the MRO of cls, else of the most specific ABC it was registered to"""
+    for base in cls.__mro__:
+        check = builtin_checks.get(base, None)
+        if check is not None:
+            return check
+    abcs = [key for key in builtin_checks if __registered__(cls, key)]
+    nearest = {builtin_checks[abc] for abc in abcs if not any(other is not abc and issubclass(other, abc) for other in abcs)}
+    # None if ambiguous, e.g. registered to unrelated ABCs
+    return nearest.pop() if len(nearest) == 1 else None
+
+
+def __bind__(cls: type):
+    """Moves checkers registered by the name of cls or of its bases to builtin_checks"""
+    for base in cls.__mro__:
+        check = __deferred__.pop(f"{base.__module__}.{base.__qualname__}", None)
+        if check is not None:
+            builtin_checks[base] = check
+
+
+def __registered__(cls: type, abc) -> bool:
+    """
+    Whether cls was register()ed to abc (or to one of its subclasses). ABCs
+    matched by their methods alone (e.g. Iterable by __iter__) define their
+    own __subclasshook__, they only apply to classes deriving from them.
+    """
+    return isinstance(abc, ABCMeta) and "__subclasshook__" not in vars(abc) and issubclass(cls, abc)
+
 
 def __extract_hint__(obj):
     if hasattr(obj, "__orig_class__"):
@@ -28,183 +207,757 @@ def __extract_hint__(obj):
         raise ValueError(f"Type hint cannot be omitted for {type_repr(obj)}")
 
 
-def type_check(obj, t: type = Nothing) -> bool:
+def __hint_of__(t):
+    return t.hint if isinstance(t, Checker) else t
+
+
+def type_check(
+    obj,
+    t: type = Nothing,
+    *,
+    policy: Policy | None = Nothing,
+    memo: Memo | None = Nothing,
+    retain: Retain = Nothing,
+    max_depth: int | None = None,
+    max_elements: int | None = None,
+    deadline: float | None = None,
+) -> TypeCheckResult:
+    if max_depth is not None or max_elements is not None or deadline is not None:
+        with check_limits(max_depth, max_elements, deadline):
+            return type_check(obj, t, policy=policy, memo=memo, retain=retain)
     if t is Nothing:
         t = __extract_hint__(obj)
+    if retain is Nothing:
+        retain = current().retain
+    if memo is Nothing:
+        memo = __memo__.get()
+    if memo is not None:
+        return __memo_check__(obj, t, policy, memo).retain(retain)
+    return __policy_check__(obj, t, policy).retain(retain)
+
+
+def __policy_check__(obj, t: type, policy: Policy | None) -> TypeCheckResult:
+    if policy is Nothing:
+        # Inherit policy from the enclosing check_policy() context, if any
+        sampling = __sampling__.get()
+        if sampling is None:
+            return __type_check__(obj, t, None)
+        policy = sampling.policy
+    with check_policy(policy) as sampling:
+        return __type_check__(obj, t, sampling)
+
+
+def __type_check__(obj, t: type, sampling: Sampling | None) -> TypeCheckResult:
+    chain = Chain(type(obj).__name__)
+    limits = __limits__.get()
+    if limits is not None:
+        # Limits hit by this check alone
+        hit, limits.hit = limits.hit, set[str]()
     try:
-        type_assert(obj, t)
-        return TypeCheckResult(obj, t, passed=True, reason=None)
-    except TypeCheckError as e:
-        return e.result
+        failure = __run__(compile(t), obj, chain)
     except TypeError as e:
         type_error = e.with_traceback(None)
         raise type_error
+    finally:
+        if limits is not None:
+            reached = limits.reached()
+            limits.hit |= hit
+    if failure is None:
+        result = TypeCheckResult(obj, __hint_of__(t), passed=True, reason=None)
+    else:
+        result = __failure__(failure.error(), obj, __hint_of__(t), chain).result
+    if sampling is not None:
+        result.exhaustive = sampling.exhaustive
+    if limits is not None and len(reached) > 0:
+        result.limits = reached
+        result.exhaustive = False
+    return result
+
+
+def __memo_check__(obj, t: type, policy: Policy | None, memo: Memo) -> TypeCheckResult:
+    hint = __hint_of__(t)
+    key = memo.key(obj, hint)
+    if key is None:
+        return __policy_check__(obj, t, policy)
+    verdict = memo.lookup(key, obj)
+    __memo_event__(hint, verdict is not None)
+    if verdict is not None:
+        passed, reason = verdict
+        return TypeCheckResult(obj, hint, passed, reason)
+    result = __policy_check__(obj, t, policy)
+    if result.exhaustive:  # Sampled verdicts are not reused
+        memo.store(key, obj, (result.passed, result.reason))
+    return result
+
+
+def __memo_event__(hint: type, hit: bool):
+    instrumentation = __instrumentation__.get()
+    if instrumentation is not None:
+        instrumentation.memo(type_repr(hint), hit)
 
 
 T = TypeVar("T")
 
 
-def type_assert(obj, t: type[T] = Nothing, *, chain: Chain | None = None) -> T:
+def type_assert(
+    obj,
+    t: type[T] = Nothing,
+    *,
+    chain: Chain | None = None,
+    policy: Policy | None = Nothing,
+    memo: Memo | None = Nothing,
+    max_depth: int | None = None,
+    max_elements: int | None = None,
+    deadline: float | None = None,
+) -> T:
+    if max_depth is not None or max_elements is not None or deadline is not None:
+        with check_limits(max_depth, max_elements, deadline):
+            return type_assert(obj, t, chain=chain, policy=policy, memo=memo)
+    if policy is not Nothing:
+        with check_policy(policy):
+            return type_assert(obj, t, chain=chain, memo=memo)
     if t is Nothing:
         t = __extract_hint__(obj)
+    if memo is Nothing:
+        memo = __memo__.get()
+    if memo is not None:
+        key = memo.key(obj, __hint_of__(t))
+        if key is not None:
+            verdict = memo.lookup(key, obj)
+            __memo_event__(__hint_of__(t), verdict is not None)
+            if verdict == PASSED:
+                return obj
+            # Failures are checked again to raise a detailed TypeCheckError
+            type_assert(obj, t, chain=chain, memo=None)
+            if __sampling__.get() is None and __limits__.get() is None:
+                memo.store(key, obj, PASSED)
+            return obj
     if chain is None:
         chain = Chain(type(obj).__name__)
+    checker = compile(t)
     try:
-        __type_assert__(obj, t, chain=chain)
-    except TypeCheckError as e:
-        # Attach the original object to exception
-        setattr(e, "value", obj)
-        setattr(e, "type_to_check", t)
-        # Clear traceback to avoid confusion
-        type_check_error = e.with_traceback(None)
-        raise type_check_error
+        failure = __run__(checker, obj, chain)
     except TypeError as e:
         type_error = e.with_traceback(None)
         raise type_error
-    return obj
+    if failure is not None:
+        raise __failure__(failure.error(), obj, __hint_of__(t), chain)
+    return __wrap__(obj, checker, chain)
+
+
+def __run__(checker: Checker, obj, chain: Chain) -> None | Failure:
+    """Runs a top-level check with the configured engine"""
+    limits = __limits__.get()
+    if limits is not None:
+        return __bounded__(checker, obj, chain, limits)
+    parallel = __parallel__.get()
+    if parallel is not None:
+        failure = parallel.run(checker, obj, chain)
+        if failure is not NotImplemented:
+            return failure
+    engine = current().engine
+    if engine == "iterative":
+        return __iterate__(checker, obj, chain)
+    if engine == "recursive":
+        return checker.__check__(obj, chain)
+    try:
+        return checker.__check__(obj, chain)
+    except RecursionError:
+        return __iterate__(checker, obj, chain)
+
+
+def __iterate__(checker: Checker, obj, chain: Chain) -> None | Failure:
+    """
+    Iterative engine: runs the walks of nested checks from an explicit stack
+    instead of the Python call stack, checks without a walk run recursively.
+    """
+    if checker.__walk__ is None:
+        return checker.__check__(obj, chain)
+    visited = __visited__.get()
+    token = __visited__.set(Visited()) if visited is None else None
+    try:
+        stack = [checker.__walk__(obj, chain)]
+        outcome = None
+        while stack:
+            try:
+                obj, checker, chain = stack[-1].send(outcome)
+            except StopIteration as stop:
+                stack.pop()
+                outcome = stop.value
+                continue
+            if checker.__walk__ is None:
+                outcome = checker.__check__(obj, chain)
+            else:
+                stack.append(checker.__walk__(obj, chain))
+                outcome = None
+        return outcome
+    finally:
+        if token is not None:
+            __visited__.reset(token)
+
+
+def __bounded__(checker: Checker, obj, chain: Chain, limits: Limits) -> None | Failure:
+    """
+    Iterative engine counting levels, visited elements and time against
+    limits. Objects beyond max_depth pass unchecked, and the whole check stops
+    (passing unless a failure was found) once out of budget or time.
+    """
+    visited = __visited__.get()
+    token = __visited__.set(Visited()) if visited is None else None
+    max_depth = limits.max_depth
+    try:
+        # Frames: (walk, object it walks, level of that object)
+        stack = [(__root__(obj, checker, chain), Nothing, 0)]
+        outcome = None
+        while stack:
+            walk, parent, level = stack[-1]
+            try:
+                obj, checker, chain = walk.send(outcome)
+            except StopIteration as stop:
+                stack.pop()
+                outcome = stop.value
+                continue
+            outcome = None
+            # Union arms and base classes check the same object at the same level
+            if obj is not parent:
+                level += 1
+                if max_depth is not None and level > max_depth:
+                    limits.hit.add("depth")
+                    continue
+                # Plain isinstance() checks were counted with their container
+                if checker.classes is None and limits.exceeded(__size__(obj) or 1):
+                    return
+            if checker.classes is None and level == max_depth and isinstance(checker.origin, type) and checker.origin is not UnionType:
+                # Elements of obj would be beyond max_depth, only its type is checked (by each arm of unions)
+                if not isinstance(obj, checker.origin):
+                    outcome = Mismatch(chain, [checker.origin], obj)
+                elif __size__(obj) != 0:
+                    limits.hit.add("depth")
+            elif checker.__walk__ is not None:
+                stack.append((checker.__walk__(obj, chain), obj, level))
+            else:
+                outcome = checker.__check__(obj, chain)
+        return outcome
+    finally:
+        if token is not None:
+            __visited__.reset(token)
+
+
+def __root__(obj, checker: Checker, chain: Chain) -> Generator:
+    return (yield obj, checker, chain)
+
+
+def __size__(obj) -> int | None:
+    try:
+        return len(obj)
+    except TypeError:
+        return None
+
+
+def __wrap__(obj, checker: Checker, chain: Chain):
+    wrap = wrappers.get(checker.origin, None)
+    return obj if wrap is None else wrap(obj, checker, chain)
+
+
+def __failure__(e: TypeCheckError, obj, t: type, chain: Chain) -> TypeCheckError:
+    # Rebuild the path recorded while unwinding
+    e.__locate__(chain)
+    # Attach the original object to exception
+    setattr(e, "value", obj)
+    setattr(e, "type_to_check", t)
+    # Clear traceback to avoid confusion
+    return e.with_traceback(None)
+
+
+# Memoized verdict of a passing check: (passed, reason)
+PASSED = (True, None)
+
+
+def compile(t: type) -> Checker:
+    """
+    ## Compile a type hint into a reusable `Checker`
+
+    Type hints are interpreted once, compiled checkers are kept in a bounded
+    cache keyed by the type hint (as written, `Union[str, int]` and
+    `int | str` have their own checkers). `type_check()`, `type_assert()`
+    and `@type_guard` all go through this cache.
+
+    ### Usage:
+
+    ```
+    check = compile(list[tuple[float, str]])
+    for item in items:
+        check(item)  # Same as type_check(item, list[tuple[float, str]])
+    ```
+    """
+    instrumentation = __instrumentation__.get()
+    if instrumentation is not None:
+        return __compile_instrumented__(__hint_of__(t), instrumentation)
+    if isinstance(t, Checker):
+        return t
+    try:
+        checker, unordered = __compile_cached__(t, type(t))
+        # Equal hints may differ in the order of union arms, e.g. Union[str, int]
+        # and int | str, which failure messages show
+        if not unordered or checker.hint is t or __same__(t, checker.hint):
+            return checker
+        return __compile_variant__(t, __structure__(t))
+    except TypeError:
+        # Unhashable type hints bypass the cache
+        return __compile__(t)
+
+
+# Checkers compiled ahead of time, keyed by type hint, see codegen.install()
+precompiled = dict[type, Checker]()
 
 
-def __type_assert__(obj, t: type, *, chain: Chain) -> None | NoReturn:
+@lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def __compile_cached__(t: type, kind: type) -> tuple[Checker, bool]:
+    """Checker of t, and whether equal hints may be written otherwise"""
+    checker = precompiled.get(t, None)
+    if checker is None:
+        checker = __compile__(t)
+    return checker, __unordered__(checker.hint)
+
+
+@lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def __compile_variant__(t: type, structure: tuple) -> Checker:
+    checker = precompiled.get(t, None)
+    return __compile__(t) if checker is None or __structure__(checker.hint) != structure else checker
+
+
+def __unordered__(t) -> bool:
+    """Whether t holds unions or literals, whose equality ignores the order of arguments"""
+    args = getattr(t, "__args__", None)
+    if not isinstance(args, tuple):
+        return False
+    return isinstance(t, (UnionType, _GenericAlias)) or any(map(__unordered__, args))
+
+
+def __same__(a, b) -> bool:
+    """Whether equal hints a and b are written alike, arguments in the same order"""
+    if type(a) is not type(b):
+        return False
+    try:
+        args, others = a.__args__, b.__args__
+    except AttributeError:
+        return True
+    if len(args) != len(others):
+        return False
+    for x, y in zip(args, others):
+        if x is not y and not (x == y and __same__(x, y)):
+            return False
+    return True
+
+
+def __structure__(t):
+    """Hint as nested tuples of flavors, origins and arguments, in order"""
+    args = getattr(t, "__args__", None)
+    if not isinstance(args, tuple):
+        return t
+    return (type(t), getattr(t, "__origin__", None), *map(__structure__, args))
+
+
+# Checkers compiled while instrumentation is enabled, kept apart from the
+# regular cache so that disabled instrumentation costs nothing
+__instrumented__ = dict[tuple[type, object], Checker]()
+
+
+def __compile_instrumented__(t: type, instrumentation: Instrumentation) -> Checker:
+    try:
+        key = (t, __structure__(t))
+        checker = __instrumented__.get(key, None)
+        hashable = True
+    except TypeError:  # Unhashable type hint
+        checker, hashable = None, False
+    instrumentation.compiled(hit=checker is not None)
+    if checker is None:
+        checker = __compile__(t)
+        checker.__check__ = __instrument__(checker.__check__, type_repr(t), "hints")
+        if checker.__walk__ is not None:  # Deep data is still checked iteratively
+            checker.__walk__ = __instrument_walk__(checker.__walk__, type_repr(t), "hints")
+        if hashable:
+            if len(__instrumented__) >= COMPILE_CACHE_SIZE:
+                __instrumented__.clear()
+            __instrumented__[key] = checker
+    return checker
+
+
+def __instrument__(fn: Callable, key: str, table: str) -> Callable:
+    def instrumented(*args, **kwargs):
+        instrumentation = __instrumentation__.get()
+        if instrumentation is None:  # Used after leaving instrument()
+            return fn(*args, **kwargs)
+        return instrumentation.run(table, key, fn, *args, **kwargs)
+
+    return instrumented
+
+
+def __instrument_walk__(walk: Callable[..., Generator], key: str, table: str) -> Callable[..., Generator]:
+    def instrumented(*args, **kwargs):
+        instrumentation = __instrumentation__.get()
+        if instrumentation is None:
+            return (yield from walk(*args, **kwargs))
+        return (yield from instrumentation.walk(table, key, walk, *args, **kwargs))
+
+    return instrumented
+
+
+def __compile__(t: type) -> Checker:
     origin, args = get_origin(t), get_args(t)
+    bases: tuple[Checker, ...] = tuple()
     if origin is None:
         # t is not a generic type, fallback to direct type check
-        if not isinstance(obj, t):
-            raise TypeCheckError(chain, [t], obj)
         # Check for python primitive types (int, str, float, etc.)
         if t in (int, str, float, bool, None, type(None)):
-            return
+            classes = (type(None),) if t is None else (t,)
+            return Checker(t, t, args, __compile_instance__(t, classes), classes)
         # Python classes
         if type(t) is type:
             if hasattr(t, "__orig_bases__"):
-                # Try to retrieve the inheritance chain
-                for orig in t.__orig_bases__:
-                    __type_assert__(obj, orig, chain=chain)
+                # Try to retrieve the inheritance chain, bases with type
+                # variables left (e.g. Box[T]) are not fully parameterized,
+                # and NamedTuple or TypedDict bases are functions
+                bases = tuple(
+                    compile(orig)
+                    for orig in t.__orig_bases__
+                    if isinstance(get_origin(orig) or orig, type) and len(getattr(orig, "__parameters__", tuple())) == 0
+                )
         origin = t
 
     if origin is UnionType or origin is Union:
-        # Union type, check if any of the types match
-        for arg in args:
-            try:
-                return __type_assert__(obj, arg, chain=chain)
-            except TypeCheckError:
-                continue
-        raise TypeCheckError(chain, args, obj)
+        arms = tuple(map(compile, args))
+        classes = None
+        if all(arm.classes is not None for arm in arms):
+            classes = sum((arm.classes for arm in arms), tuple())
+            return Checker(t, origin, args, __compile_union__(arms, args), classes)
+        return Checker(t, origin, args, __compile_union__(arms, args), walk=__walk_union__(arms, args))
 
     if origin is Literal:
-        # Literal type, check if obj is one of the literals
-        if obj not in args:
-            raise TypeCheckError(chain, [t], obj)
-        return
+        return Checker(t, origin, args, __compile_literal__(t, args))
+
+    plan, walk = __compile_class__(t, origin, args, bases)
+    return Checker(t, origin, args, plan, walk=walk)
+
+
+def __compile_instance__(t: type, classes: tuple[type, ...]) -> Plan:
+    def plan(obj, chain: Chain):
+        if not isinstance(obj, classes):
+            return Mismatch(chain, [t], obj)
+
+    return plan
+
+
+def __compile_union__(arms: tuple[Checker, ...], args: tuple) -> Plan:
+    plans = tuple(arm.__check__ for arm in arms)
+    # Object type -> plans of the arms that may accept it, None if an arm is
+    # known to accept it (a plain isinstance check). Filled upon first sight.
+    dispatch = dict[type, tuple[Plan, ...] | None]()
+
+    def candidates(cls: type) -> tuple[Plan, ...] | None:
+        found = list[Plan]()
+        for arm in arms:
+            accepts = __accepts__(arm, cls)
+            if accepts is True:
+                return None
+            if accepts is None:
+                found.append(arm.__check__)
+        return tuple(found)
+
+    def plan(obj, chain: Chain):
+        cls = type(obj)
+        if obj.__class__ is not cls:  # isinstance() would also consult __class__
+            matches = plans
+        else:
+            try:
+                matches = dispatch[cls]
+            except KeyError:
+                if len(dispatch) >= UNION_DISPATCH_SIZE:
+                    dispatch.clear()
+                matches = dispatch[cls] = candidates(cls)
+            if matches is None:
+                return
+        for arm in matches:
+            if arm(obj, chain) is None:
+                return
+        return Mismatch(chain, args, obj)
 
-    if not isinstance(obj, origin):
-        # Origin type mismatch
-        raise TypeCheckError(chain, [origin], obj)
+    return plan
 
+
+def __walk_union__(arms: tuple[Checker, ...], args: tuple) -> Walk:
+    def walk(obj, chain: Chain):
+        for arm in arms:
+            if (yield obj, arm, chain) is None:
+                return
+        return Mismatch(chain, args, obj)
+
+    return walk
+
+
+def __accepts__(arm: Checker, cls: type) -> bool | None:
+    """Whether arm accepts all instances of cls, None if it depends on the instance"""
     try:
-        # Use custom type checker whenever possible
-        if hasattr(origin, "__type_check__"):
-            return origin.__type_check__(obj, *args, chain=chain)
-        if hasattr(obj, "__type_check__"):
-            return obj.__type_check__(*args, chain=chain)
-    except TypeError:
-        bad_checker = repr(origin.__type_check__)
-        raise TypeError(f"Type checker {bad_checker} not implemented correctly")
+        if arm.classes is not None:
+            return issubclass(cls, arm.classes)
+        if isinstance(arm.origin, type) and arm.origin is not UnionType:
+            # Class plans start with isinstance(obj, origin)
+            return None if issubclass(cls, arm.origin) else False
+    except TypeError:  # e.g. protocols with data members
+        pass
+    return None
 
-    # No custom type checker, try match with builtin type checkers
-    if origin in builtin_checks:
-        return builtin_checks[origin](obj, *args, chain=chain)
 
-    # Try to fallback to type hints
+def __compile_literal__(t: type, args: tuple) -> Plan:
+    def plan(obj, chain: Chain):
+        # Literal type, check if obj is one of the literals
+        if obj not in args:
+            return Mismatch(chain, [t], obj)
+
+    return plan
+
+
+def __compile_class__(t: type, origin: type, args: tuple, bases: tuple[Checker, ...]) -> tuple[Plan, Walk]:
+    base_checkers = bases
+    bases = tuple(base.__check__ for base in bases)
+    custom_check = getattr(origin, "__type_check__", None)
+    # Unparameterized hints of subclasses (e.g. named tuples) are checked by
+    # their own type hints, there are no element types to check against
+    builtin_check = resolve_checker(origin) if len(args) > 0 else builtin_checks.get(origin, None)
+    builtin_walk = None
+    if builtin_check is not None:
+        checkers = tuple(map(compile, args))
+        # Elements checked by isinstance() only cannot lead back to obj
+        leaf = all(checker.classes is not None for checker in checkers)
+        if not leaf:
+            builtin_walk = builtin_walks.get(builtin_check, None)
+        if __instrumentation__.get() is not None:
+            key = f"{type_repr(origin)}: {builtin_check.__name__}"
+            builtin_check = __instrument__(builtin_check, key, "checkers")
+            if builtin_walk is not None:
+                builtin_walk = __instrument_walk__(builtin_walk, key, "checkers")
     parameters = getattr(origin, "__parameters__", tuple())
-    if len(parameters) == len(args):  # Fully parameterized
+    templates = __templates__(origin, args)
+    # Per class schemas resolved from type hints, keyed by id(cls)
+    schemas = dict[int, Schema | None]()
+
+    def plan(obj, chain: Chain):
+        if not isinstance(obj, origin):
+            # Origin type mismatch
+            return Mismatch(chain, [origin], obj)
+
+        for base in bases:
+            failure = base(obj, chain)
+            if failure is not None:
+                return failure
+
         try:
-            cls = getattr(obj, "__class__", obj)
-            hints: dict[str, TypeVar | type] = get_type_hints(cls)
-        except:  # No type hints available in user defined class
+            # Use custom type checker whenever possible
+            if custom_check is not None:
+                return __visit__(obj, plan, __hook__, custom_check, obj, *args, chain=chain)
+            if hasattr(obj, "__type_check__"):
+                return __visit__(obj, plan, __hook__, obj.__type_check__, *args, chain=chain)
+        except TypeError:
+            bad_checker = repr(origin.__type_check__)
+            raise TypeError(f"Type checker {bad_checker} not implemented correctly")
+
+        # No custom type checker, try match with builtin type checkers
+        if builtin_check is not None:
+            try:
+                if not leaf:
+                    return __visit__(obj, plan, builtin_check, obj, *checkers, chain=chain)
+                return builtin_check(obj, *checkers, chain=chain)
+            except TypeCheckError as e:
+                return e
+            except TypeError:
+                if current().strict:
+                    raise
+                return  # Objects that cannot be checked are skipped
+
+        # Try to fallback to type hints
+        if len(parameters) == len(args):  # Fully parameterized
+            return __check_hints__(obj, t, schemas, templates, chain)
+        else:  # Partially parameterized, wait for full parameterization
             return
-        templates = dict(zip(parameters, args))
-        for attr, hint in hints.items():
-            if not hasattr(obj, attr):
-                if CHECK_MISSING_ATTR:
-                    raise TypeCheckError(chain, [t], obj)
-                else:
-                    continue
-            else:
-                item = getattr(obj, attr)
-            if isinstance(hint, TypeVar):
-                if hint in templates:
-                    hint = templates[hint]
-                else:
-                    raise TypeError(f"Type variable {hint} not instantiated")
-            __type_assert__(item, hint, chain=chain(Chain.Attr(attr)))
-        return
-    else:  # Partially parameterized, wait for full parameterization
-        return
 
+    # Hooks and builtin checkers without a generator form run recursively
+    recursive = custom_check is not None or (builtin_check is not None and builtin_walk is None)
 
-def type_guard(t: type):
-    """
-    ## Decorate classes or functions to enforce type checking
+    def walk(obj, chain: Chain):
+        if recursive or hasattr(obj, "__type_check__"):
+            return plan(obj, chain)
+        if not isinstance(obj, origin):
+            return Mismatch(chain, [origin], obj)
+        for base in base_checkers:
+            failure = yield obj, base, chain
+            if failure is not None:
+                return failure
+        if builtin_walk is not None:
+            return (yield from __visit_walk__(obj, plan, builtin_walk(obj, *checkers, chain=chain)))
+        if len(parameters) == len(args):
+            return (yield from __walk_hints__(obj, t, schemas, templates, chain))
 
-    ### Usage:
+    return plan, walk
 
-    1. Decorating classes - do not use parentheses
-    ```
-    @type_guard
-    class C(list[int]):
-        pass
-    ```
 
-    2. Decorating functions - use type annotation pass type hint
-    ```
-    @type_guard
-    def f(x) -> list[int]:
-        return x
-    ```
-
-    3. Decorating functions - (alterative) use parenthesis to pass type hint
-    ```
-    @type_guard(list[int])
-    def f(x):
-        return x
-    ```
-    """
-    if isinstance(t, type):  # class decorator
+def __hook__(hook: Callable, *args, chain: Chain) -> Failure | None:
+    return __hook_failure__(hook(*args, chain=chain))
 
-        from .proxy import TransparentProxy
 
-        class TypeGuard(TransparentProxy):
-            def __call__(self, *args, **kwargs):
-                result = super().__call__(*args, **kwargs)
-                type_assert(result, t)
-                if hasattr(result, "__orig_class__"):
-                    type_assert(result, result.__orig_class__)
-                return result
+def __hook_failure__(result) -> Failure | None:
+    # Hooks return a failure, or anything else (usually None) on success
+    return result if isinstance(result, (Mismatch, TypeCheckError)) else None
 
-            def __repr__(self):
-                return f"TypeGuard({t.__repr__(self)})"
 
-        return TypeGuard(t)
+def __visit_walk__(obj, owner: object, walk: Generator) -> Generator:
+    """Generator form of __visit__(), within the scope set by the engine"""
+    visited = __visited__.get()
+    key = (id(obj), id(owner))
+    if key in visited:
+        return
+    mark = len(visited)
+    visited[key] = obj
+    try:
+        failure = yield from walk
+    except TypeCheckError as e:
+        failure = e
+    if failure is not None:
+        while len(visited) > mark:
+            visited.popitem()
+    return failure
+
+
+def __visit__(obj, owner: object, check: Callable, *args, **kwargs) -> Failure | None:
+    """Runs check(*args, **kwargs) unless obj was already checked by owner"""
+    visited = __visited__.get()
+    if visited is None:  # Top-level check, the visited set lives as long
+        token = __visited__.set(Visited())
+        try:
+            return __visit__(obj, owner, check, *args, **kwargs)
+        finally:
+            __visited__.reset(token)
+    key = (id(obj), id(owner))
+    if key in visited:  # Already passed, or a cycle back to obj
+        return
+    mark = len(visited)
+    visited[key] = obj
+    try:
+        failure = check(*args, **kwargs)
+    except TypeCheckError as e:
+        # Checks may raise instead of returning a failure
+        failure = e
+    if failure is not None:
+        # Forget obj and everything checked below it, as their verdicts may
+        # rely on obj passing (e.g. when another union arm is tried next)
+        while len(visited) > mark:
+            visited.popitem()
+    return failure
+
+
+def __templates__(cls: type, args: tuple) -> dict[TypeVar, type]:
+    """Type variables bound by args, or by parameterized bases (e.g. `class C(Box[int])`)"""
+    templates = dict(zip(getattr(cls, "__parameters__", tuple()), args))
+    for base in getattr(cls, "__orig_bases__", tuple()):
+        origin = get_origin(base)
+        if origin is None or origin is Generic:
+            continue
+        base_args = tuple(templates.get(arg, arg) if isinstance(arg, TypeVar) else arg for arg in get_args(base))
+        for var, arg in __templates__(origin, base_args).items():
+            if not isinstance(arg, TypeVar):
+                templates.setdefault(var, arg)
+    return templates
+
+
+# Resolved type hints of a class: (attribute name, compiled checker) pairs, and
+# whether all attributes are checked by isinstance() only
+Schema = tuple[tuple[tuple[str, Checker], ...], bool]
+
+
+def __schema__(obj, schemas: dict[int, Schema | None], templates: dict) -> Schema | None:
+    cls = getattr(obj, "__class__", obj)
+    try:
+        return schemas[id(cls)]
+    except KeyError:
+        schema = schemas[id(cls)] = __compile_schema__(cls, templates)
+        # Drop the cached schema once the class is gone (e.g. redefined)
+        finalize(cls, schemas.pop, id(cls), None)
+        return schema
 
-    elif callable(t):  # annotated function
-        import inspect
 
-        spec = inspect.getfullargspec(t)
-        if not "return" in spec.annotations:
-            raise TypeError("Type guarded function missing return type hint")
+def __check_hints__(obj, t: type, schemas: dict[int, Schema | None], templates: dict, chain: Chain) -> None | Failure:
+    schema = __schema__(obj, schemas, templates)
+    if schema is None:  # No type hints available in user defined class
+        return
+    attrs, leaf = schema
+    if leaf:
+        return __check_attrs__(obj, t, attrs, chain)
+    return __visit__(obj, schemas, __check_attrs__, obj, t, attrs, chain)
+
+
+def __check_attrs__(obj, t: type, attrs: tuple[tuple[str, Checker], ...], chain: Chain) -> None | Failure:
+    for attr, checker in attrs:
+        item = getattr(obj, attr, Nothing)
+        if item is Nothing:
+            if current().check_missing_attr:
+                return Mismatch(chain, [t], obj)
+            else:
+                continue
+        failure = checker.__check__(item, chain)
+        if failure is not None:
+            return failure.within(Chain.Attr(attr))
 
-        return_type = spec.annotations["return"]
 
-        def wrapper(*args, **kwargs):
-            result = t(*args, **kwargs)
-            try:
-                type_assert(result, return_type)
-            except TypeCheckError as e:
-                type_check_error = e.with_traceback(None)
-                raise type_check_error
-            return result
+def __walk_hints__(obj, t: type, schemas: dict[int, Schema | None], templates: dict, chain: Chain) -> Generator:
+    """Generator form of __check_hints__()"""
+    schema = __schema__(obj, schemas, templates)
+    if schema is None:
+        return
+    attrs, leaf = schema
+    if leaf:
+        return __check_attrs__(obj, t, attrs, chain)
+    return (yield from __visit_walk__(obj, schemas, __walk_attrs__(obj, t, attrs, chain)))
+
+
+def __walk_attrs__(obj, t: type, attrs: tuple[tuple[str, Checker], ...], chain: Chain) -> Generator:
+    for attr, checker in attrs:
+        item = getattr(obj, attr, Nothing)
+        if item is Nothing:
+            if current().check_missing_attr:
+                return Mismatch(chain, [t], obj)
+            else:
+                continue
+        failure = yield item, checker, chain
+        if failure is not None:
+            return failure.within(Chain.Attr(attr))
 
-        return wraps(t)(wrapper)
 
-    else:
-        raise TypeError(f"{repr(t)} is neither a class nor a function")
+def __compile_schema__(cls: type, templates: dict) -> Schema | None:
+    try:
+        hints: dict[str, TypeVar | type] = get_type_hints(cls)
+    except:  # No type hints available in user defined class
+        return None
+    attrs = list[tuple[str, Checker]]()
+    leaf = True
+    for attr, hint in hints.items():
+        # Type variables, either bare (T) or nested (list[T])
+        variables = (hint,) if isinstance(hint, TypeVar) else getattr(hint, "__parameters__", tuple())
+        missing = [var for var in variables if var not in templates]
+        if len(missing) > 0:
+            error = __compile_error__(f"Type variable {missing[0]} not instantiated")
+            attrs.append((attr, Checker(hint, None, tuple(), error)))
+            continue
+        if isinstance(hint, TypeVar):
+            hint = templates[hint]
+        elif len(variables) > 0:
+            hint = hint[tuple(templates[var] for var in variables)]
+        checker = compile(hint)
+        leaf = leaf and checker.classes is not None
+        attrs.append((attr, checker))
+    return tuple(attrs), leaf
+
+
+def __compile_error__(message: str) -> Plan:
+    def plan(obj, chain: Chain):
+        raise TypeError(message)
+
+    return plan
@@ -0,0 +1,356 @@
+from typing import NoReturn, get_type_hints, _GenericAlias
+from inspect import signature, Parameter
+from functools import wraps
+from dataclasses import dataclass
+from random import Random
+from time import perf_counter_ns
+
+from .primitives import Chain, TypeCheckError
+from .core import compile, type_assert, Checker, Failure, __failure__, __wrap__
+from .__private__ import Nothing
+
+# Adaptive sampling never checks less than 1 in MAX_INTERVAL calls
+MAX_INTERVAL = 1024
+
+
+def type_guard(t: type = Nothing, *, rate: int = 1, adaptive: int | None = None, budget: float | None = None):
+    """
+    ## Decorate classes or functions to enforce type checking
+
+    ### Usage:
+
+    1. Decorating classes - do not use parentheses
+    ```
+    @type_guard
+    class C(list[int]):
+        pass
+    ```
+
+    2. Decorating functions - use type annotations to pass type hints,
+       annotated arguments (including defaults, `*args` and `**kwargs`)
+       and return values are checked
+    ```
+    @type_guard
+    def f(x: list[int]) -> list[int]:
+        return x
+    ```
+
+    3. Decorating functions - (alterative) use parenthesis to pass type hint
+    ```
+    @type_guard(list[int])
+    def f(x):
+        return x
+    ```
+
+    4. Sampling calls of hot functions - checks are skipped on some calls
+    ```
+    @type_guard(rate=100)      # 1 in 100 calls on average
+    @type_guard(adaptive=50)   # 1 in 2 after 50 passed checks in a row, then
+                               # 1 in 4, ... back to every call upon failure
+    @type_guard(budget=0.05)   # checks take at most 5% of the function's time
+    def f(x: list[int]) -> int:
+        ...
+    guard_stats(f)  # GuardStats(checked=..., skipped=..., failed=..., ...)
+    ```
+    """
+    if t is Nothing:  # Sampling options only
+        return lambda fn: __guard_function__(fn, Sampler(rate, adaptive, budget))
+    if rate != 1 or adaptive is not None or budget is not None:
+        raise TypeError("Sampling options only apply to functions, e.g. @type_guard(rate=100)")
+
+    if isinstance(t, type):  # class decorator
+        return __guard_class__(t)
+
+    elif callable(t):  # annotated function
+        return __guard_function__(t)
+
+    else:
+        raise TypeError(f"{repr(t)} is neither a class nor a function")
+
+
+class GuardedAlias(_GenericAlias, _root=True):
+    """
+    Subscripted form of a guarded class, e.g. `C[int]`. Instances are checked
+    against the full alias once `__orig_class__` has been assigned.
+    """
+
+    def __init__(self, origin: type, args: tuple, **kwargs):
+        super().__init__(origin, args, **kwargs)
+        self.__checker__ = compile(self)
+
+    def __call__(self, *args, **kwargs):
+        result = super().__call__(*args, **kwargs)
+        type_assert(result, self.__checker__)
+        return result
+
+
+# Cached subscriptions of guarded classes, keyed by the original alias
+__aliases__ = dict[_GenericAlias, GuardedAlias]()
+
+
+def __guard_class__(cls: type) -> type:
+    # Guard the class in place, attribute access and isinstance() are unaffected
+    checker = compile(cls)
+    init = cls.__init__
+    # Instances built by __new__ alone (e.g. named tuples) have no __init__
+    # arguments, other classes pass them on so that object.__init__ rejects them
+    built = init is object.__init__ and cls.__new__ is not object.__new__
+
+    @wraps(init)
+    def __init__(self, *args, **kwargs):
+        if built:
+            init(self)
+        else:
+            init(self, *args, **kwargs)
+        # Instances of subclasses are checked against their own hints
+        type_assert(self, checker if type(self) is cls else type(self))
+
+    __init__.__guarded__ = True
+    cls.__init__ = __init__
+
+    if len(getattr(cls, "__parameters__", tuple())) > 0:  # Generic class
+        # Own implementation if any, the inherited one is looked up through
+        # super() as it may be a builtin method (Generic on Python 3.12+)
+        class_getitem = cls.__dict__.get("__class_getitem__", None)
+        if class_getitem is not None:
+            class_getitem = class_getitem.__func__
+
+        def __class_getitem__(owner, params):
+            if class_getitem is None:
+                alias = super(cls, owner).__class_getitem__(params)
+            else:
+                alias = class_getitem(owner, params)
+            if not isinstance(alias, _GenericAlias):
+                return alias
+            try:
+                return __aliases__[alias]
+            except KeyError:
+                guarded = __aliases__[alias] = GuardedAlias(alias.__origin__, alias.__args__)
+                return guarded
+            except TypeError:  # Unhashable type arguments
+                return GuardedAlias(alias.__origin__, alias.__args__)
+
+        cls.__class_getitem__ = classmethod(__class_getitem__)
+
+    return cls
+
+
+# Precompiled check of one parameter: (position or name, checker, chain)
+ParamCheck = tuple[int | str, Checker, Chain]
+
+
+def __check_arg__(obj, checker: Checker, chain: Chain):
+    failure = checker.__check__(obj, chain)
+    if failure is not None:
+        __raise__(failure, obj, checker, chain)
+
+
+def __raise__(failure: Failure, obj, checker: Checker, chain: Chain, key: Chain.Key | None = None) -> NoReturn:
+    if key is not None:  # Element of *args or **kwargs
+        failure = failure.within(key)
+    raise __failure__(failure.error(), obj, checker.hint, chain)
+
+
+@dataclass
+class GuardStats:
+    # Calls whose arguments and return value were checked, or skipped
+    checked: int = 0
+    skipped: int = 0
+    failed: int = 0
+    # Time spent in checks, and in the function itself if a budget is set
+    check_ns: int = 0
+    run_ns: int = 0
+
+
+class Sampler:
+    """Decides which calls of a guarded function are checked, see `type_guard()`"""
+
+    def __init__(self, rate: int = 1, adaptive: int | None = None, budget: float | None = None):
+        if rate < 1:
+            raise ValueError(f"Sampling rate must be at least 1, got {rate}")
+        self.rate = rate
+        self.adaptive = adaptive
+        self.budget = budget
+        # Average number of calls per check
+        self.interval = rate
+        # Passed checks in a row, used by adaptive sampling
+        self.streak = 0
+        self.random = Random()
+        self.stats = GuardStats()
+
+    def sample(self) -> bool:
+        stats = self.stats
+        if self.budget is not None and stats.check_ns > self.budget * stats.run_ns:
+            return False
+        # Random rather than every n-th call, to avoid aliasing call patterns
+        return self.interval == 1 or self.random.random() * self.interval < 1
+
+    def record(self, passed: bool, check_ns: int):
+        stats = self.stats
+        stats.checked += 1
+        stats.check_ns += check_ns
+        if not passed:
+            stats.failed += 1
+            self.streak = 0
+            self.interval = self.rate
+        elif self.adaptive is not None:
+            self.streak += 1
+            if self.streak >= self.adaptive:
+                self.streak = 0
+                self.interval = min(self.interval * 2, max(MAX_INTERVAL, self.rate))
+
+
+def guard_stats(fn) -> GuardStats:
+    """Checked, skipped and failed calls of a function guarded with sampling"""
+    sampler = getattr(fn, "__sampler__", None)
+    if sampler is None:
+        raise TypeError(f"{repr(fn)} is not type guarded with sampling")
+    return sampler.stats
+
+
+def __guard_function__(fn, sampler: Sampler | None = None, lazy: bool = True):
+    try:
+        hints = __hints__(fn)
+    except TypeError as e:
+        # Forward references to names defined later, e.g. "Node" in methods of
+        # class Node, are resolved on the first call
+        if not lazy or not isinstance(e.__cause__, NameError):
+            raise
+        hints = None
+    if hints is not None and len(hints) == 0:
+        raise TypeError("Type guarded function missing type hints")
+    check_args, check_result = (None, None) if hints is None else __plan__(fn, hints)
+
+    def resolve():
+        nonlocal check_args, check_result
+        check_args, check_result = __plan__(fn, __hints__(fn))
+
+    def wrapper(*args, **kwargs):
+        if check_args is None:
+            resolve()
+        check_args(args, kwargs)
+        return check_result(fn(*args, **kwargs))
+
+    if sampler is None:
+        wrapper = wraps(fn)(wrapper)
+        wrapper.__guarded__ = True
+        return wrapper
+
+    stats = sampler.stats
+    timed = sampler.budget is not None
+
+    def sampled(*args, **kwargs):
+        if not sampler.sample():
+            stats.skipped += 1
+            if not timed:
+                return fn(*args, **kwargs)
+            start = perf_counter_ns()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                stats.run_ns += perf_counter_ns() - start
+        if check_args is None:
+            resolve()
+        start = perf_counter_ns()
+        try:
+            check_args(args, kwargs)
+        except TypeCheckError:
+            sampler.record(False, perf_counter_ns() - start)
+            raise
+        checked = perf_counter_ns()
+        try:
+            result = fn(*args, **kwargs)
+        finally:
+            ran = perf_counter_ns()
+            if timed:
+                stats.run_ns += ran - checked
+        try:
+            result = check_result(result)
+        except TypeCheckError:
+            sampler.record(False, checked - start + perf_counter_ns() - ran)
+            raise
+        sampler.record(True, checked - start + perf_counter_ns() - ran)
+        return result
+
+    sampled = wraps(fn)(sampled)
+    sampled.__sampler__ = sampler
+    sampled.__guarded__ = True
+    return sampled
+
+
+def __hints__(fn) -> dict:
+    try:
+        return get_type_hints(fn)
+    except Exception as e:  # Unresolvable forward references, checking their strings would be wrong
+        raise TypeError(f"Type hints of {fn.__qualname__} cannot be resolved: {e}") from e
+
+
+def __plan__(fn, hints: dict):
+    """Checks of the arguments and of the result of fn, through a binding plan built once"""
+    positional = list[ParamCheck]()
+    keywords = dict[str, ParamCheck]()
+    var_args: ParamCheck | None = None
+    var_kwargs: ParamCheck | None = None
+    # Parameters that may be passed by keyword, annotated or not, **kwargs gets the others
+    named = set[str]()
+    for i, param in enumerate(signature(fn).parameters.values()):
+        if param.kind in (Parameter.POSITIONAL_OR_KEYWORD, Parameter.KEYWORD_ONLY):
+            named.add(param.name)
+        if param.name not in hints:
+            continue
+        checker = compile(hints[param.name])
+        if param.kind is Parameter.VAR_POSITIONAL:
+            var_args = (i, checker, Chain(fn.__name__)(Chain.Arg(f"*{param.name}")))
+            continue
+        if param.kind is Parameter.VAR_KEYWORD:
+            var_kwargs = (param.name, checker, Chain(fn.__name__)(Chain.Arg(f"**{param.name}")))
+            continue
+        check = (i, checker, Chain(fn.__name__)(Chain.Arg(param.name)))
+        if param.kind is not Parameter.KEYWORD_ONLY:
+            positional.append(check)
+        if param.kind is not Parameter.POSITIONAL_ONLY:
+            keywords[param.name] = check
+        if param.default is not Parameter.empty:
+            # Defaults are evaluated once, so they are checked only once
+            __check_arg__(param.default, checker, check[2])
+    positional = tuple(positional)
+    return_type = compile(hints["return"]) if "return" in hints else None
+
+    def check_args(args: tuple, kwargs: dict):
+        # Direct plan calls, nothing is allocated unless a check fails
+        n = len(args)
+        for i, checker, chain in positional:
+            if i >= n:
+                break
+            failure = checker.__check__(args[i], chain)
+            if failure is not None:
+                __raise__(failure, args[i], checker, chain)
+        if var_args is not None and n > var_args[0]:
+            start, checker, chain = var_args
+            for i, arg in enumerate(args[start:]):
+                failure = checker.__check__(arg, chain)
+                if failure is not None:
+                    __raise__(failure, arg, checker, chain, Chain.Key(i))
+        if kwargs:
+            for key, value in kwargs.items():
+                check = keywords.get(key, None)
+                if check is not None:
+                    _, checker, chain = check
+                    failure = checker.__check__(value, chain)
+                    if failure is not None:
+                        __raise__(failure, value, checker, chain)
+                elif var_kwargs is not None and key not in named:
+                    _, checker, chain = var_kwargs
+                    failure = checker.__check__(value, chain)
+                    if failure is not None:
+                        __raise__(failure, value, checker, chain, Chain.Key(key))
+
+    def check_result(result):
+        if return_type is not None:
+            chain = Chain(type(result).__name__)
+            __check_arg__(result, return_type, chain)
+            # Returned iterators are checked lazily as they are consumed
+            return __wrap__(result, return_type, chain)
+        return result
+
+    return check_args, check_result
@@ -0,0 +1,214 @@
+import os
+import threading
+from collections import defaultdict
+from contextvars import ContextVar
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from time import perf_counter_ns
+
+# Set RTTC_INSTRUMENT=1 to instrument all checks of the process from import
+# time on, the collected data is available through instrumentation()
+ENV_VAR = "RTTC_INSTRUMENT"
+
+
+@dataclass
+class Stats:
+    calls: int = 0
+    failures: int = 0
+    # Inclusive wall time spent in the check, including nested checks
+    time_ns: int = 0
+    # Number of objects visited by the check and its nested checks
+    elements: int = 0
+    # Lookups of memoized verdicts (see memoize())
+    memo_hits: int = 0
+    memo_misses: int = 0
+
+    def merge(self, other: "Stats"):
+        for field, value in vars(other).items():
+            setattr(self, field, getattr(self, field) + value)
+
+
+class Counters:
+    """Counters of one thread, merged upon reading"""
+
+    def __init__(self):
+        self.hints = defaultdict[str, Stats](Stats)
+        self.checkers = defaultdict[str, Stats](Stats)
+        # Running count of visited objects, used to attribute elements
+        self.visited = 0
+        self.compile_hits = 0
+        self.compile_misses = 0
+
+
+class Instrumentation:
+    """
+    Per hint and per builtin checker counters, collected by checks compiled
+    while instrumentation is enabled (see `instrument()`). Each thread counts
+    on its own, so that concurrent checks neither contend nor lose updates.
+    """
+
+    def __init__(self):
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.threads = list[Counters]()
+
+    @property
+    def counters(self) -> Counters:
+        try:
+            return self.local.counters
+        except AttributeError:  # First use in this thread
+            counters = self.local.counters = Counters()
+            with self.lock:
+                self.threads.append(counters)
+            return counters
+
+    def run(self, table: str, key: str, plan, *args, **kwargs):
+        """Runs plan (or a builtin checker, which does not count as a visit)"""
+        counters = self.counters
+        stats = getattr(counters, table)[key]
+        visited = counters.visited
+        counters.visited += table == "hints"
+        start = perf_counter_ns()
+        try:
+            failure = plan(*args, **kwargs)
+        finally:
+            stats.time_ns += perf_counter_ns() - start
+            stats.calls += 1
+            stats.elements += counters.visited - visited
+        if failure is not None:
+            stats.failures += 1
+        return failure
+
+    def walk(self, table: str, key: str, walk, *args, **kwargs):
+        """Generator form of run(), for walks of the iterative engine"""
+        counters = self.counters
+        stats = getattr(counters, table)[key]
+        visited = counters.visited
+        counters.visited += table == "hints"
+        start = perf_counter_ns()
+        try:
+            # Nested checks run between resumptions, time is inclusive as with run()
+            failure = yield from walk(*args, **kwargs)
+        finally:
+            stats.time_ns += perf_counter_ns() - start
+            stats.calls += 1
+            stats.elements += counters.visited - visited
+        if failure is not None:
+            stats.failures += 1
+        return failure
+
+    def memo(self, key: str, hit: bool):
+        stats = self.counters.hints[key]
+        if hit:
+            stats.memo_hits += 1
+        else:
+            stats.memo_misses += 1
+
+    def compiled(self, hit: bool):
+        counters = self.counters
+        if hit:
+            counters.compile_hits += 1
+        else:
+            counters.compile_misses += 1
+
+    @property
+    def hints(self) -> dict[str, Stats]:
+        return self.merged("hints")
+
+    @property
+    def checkers(self) -> dict[str, Stats]:
+        return self.merged("checkers")
+
+    @property
+    def compile_hits(self) -> int:
+        with self.lock:
+            return sum(counters.compile_hits for counters in self.threads)
+
+    @property
+    def compile_misses(self) -> int:
+        with self.lock:
+            return sum(counters.compile_misses for counters in self.threads)
+
+    def merged(self, table: str) -> dict[str, Stats]:
+        merged = defaultdict[str, Stats](Stats)
+        with self.lock:
+            threads = list(self.threads)
+        for counters in threads:
+            for key, stats in list(getattr(counters, table).items()):
+                merged[key].merge(stats)
+        return dict(merged)
+
+    def as_dict(self) -> dict:
+        return dict(
+            hints={key: asdict(stats) for key, stats in self.hints.items()},
+            checkers={key: asdict(stats) for key, stats in self.checkers.items()},
+            compile_cache=dict(hits=self.compile_hits, misses=self.compile_misses),
+        )
+
+    def prometheus(self, prefix: str = "rttc") -> str:
+        """Counters in Prometheus text exposition format"""
+        lines = list[str]()
+        hints, checkers = self.hints, self.checkers
+
+        def counter(name: str, help: str, label: str, table: dict[str, Stats], field: str, scale: float = 1):
+            lines.append(f"# HELP {prefix}_{name} {help}")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for key, stats in table.items():
+                lines.append(f'{prefix}_{name}{{{label}="{escape(key)}"}} {getattr(stats, field) * scale:g}')
+
+        counter("checks_total", "Checks per type hint", "hint", hints, "calls")
+        counter("check_failures_total", "Failed checks per type hint", "hint", hints, "failures")
+        counter("check_seconds_total", "Time spent per type hint", "hint", hints, "time_ns", 1e-9)
+        counter("check_elements_total", "Objects visited per type hint", "hint", hints, "elements")
+        counter("memo_hits_total", "Memoized verdicts reused per type hint", "hint", hints, "memo_hits")
+        counter("memo_misses_total", "Memoized verdicts missed per type hint", "hint", hints, "memo_misses")
+        counter("checker_calls_total", "Calls per builtin checker", "checker", checkers, "calls")
+        counter("checker_failures_total", "Failed calls per builtin checker", "checker", checkers, "failures")
+        counter("checker_seconds_total", "Time spent per builtin checker", "checker", checkers, "time_ns", 1e-9)
+        for name, value in (("hits", self.compile_hits), ("misses", self.compile_misses)):
+            lines.append(f"# HELP {prefix}_compile_cache_{name}_total Compile cache {name}")
+            lines.append(f"# TYPE {prefix}_compile_cache_{name}_total counter")
+            lines.append(f"{prefix}_compile_cache_{name}_total {value}")
+        return "\n".join(lines) + "\n"
+
+
+def escape(label: str) -> str:
+    return label.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# Instrumentation in effect for the current context, None means disabled
+__instrumentation__ = ContextVar[Instrumentation | None](
+    "instrumentation",
+    default=Instrumentation() if os.environ.get(ENV_VAR, "0") not in ("", "0") else None,
+)
+
+
+def instrumentation() -> Instrumentation | None:
+    """Instrumentation in effect for the current context, if any"""
+    return __instrumentation__.get()
+
+
+@contextmanager
+def instrument(collector: Instrumentation | None = None):
+    """
+    ## Instrument type checks within the context
+
+    Checks compiled within the context record call counts, time, visited
+    elements, failures and memo hits per type hint and per builtin checker.
+
+    ### Usage:
+
+    ```
+    with instrument() as stats:
+        type_check(rows, list[Record])
+    stats.as_dict()      # {"hints": {"list[Record]": {"calls": 1, ...}}, ...}
+    stats.prometheus()   # 'rttc_checks_total{hint="list[Record]"} 1 ...'
+    ```
+    """
+    if collector is None:
+        collector = Instrumentation()
+    token = __instrumentation__.set(collector)
+    try:
+        yield collector
+    finally:
+        __instrumentation__.reset(token)
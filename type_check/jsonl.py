@@ -0,0 +1,151 @@
+import os
+import json
+import mmap
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from .primitives import Chain
+from .core import type_check, compile, Checker, __parallel__, __run__
+from .settings import Config, current, __config__
+
+# Streaming validation of JSON Lines files
+# The file is memory mapped and split into chunks of whole lines, checked by a
+# pool of processes. Each worker maps the file again and only sends back its
+# counters and the first few failure reasons, so memory use is bounded by the
+# chunk size whatever the size of the file.
+
+
+@dataclass
+class ChunkReport:
+    start: int  # Byte offset of the chunk
+    lines: int = 0
+    records: int = 0
+    failures: int = 0
+    # (line within the chunk, reason) of the first failures
+    errors: list[tuple[int, str]] = field(default_factory=list)
+
+
+@dataclass
+class ValidationReport:
+    path: str
+    hint: object
+    size: int  # Bytes
+    records: int = 0
+    failures: int = 0
+    seconds: float = 0.0
+    # (line number, reason) of the first failures of each chunk
+    errors: list[tuple[int, str]] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return self.failures == 0
+
+    @property
+    def records_per_second(self) -> float:
+        return self.records / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.size / self.seconds if self.seconds > 0 else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.path}: {self.records} records, {self.failures} failing, "
+            f"{self.size / 1e6:.1f} MB in {self.seconds:.2f}s "
+            f"({self.records_per_second:.0f} records/s, {self.bytes_per_second / 1e6:.1f} MB/s)"
+        )
+
+
+def __boundaries__(path: str, chunk_size: int) -> list[tuple[int, int]]:
+    """(start, stop) byte offsets of chunks, each ends right after a newline or at EOF"""
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    chunks = list[tuple[int, int]]()
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        start = 0
+        while start < size:
+            newline = data.find(b"\n", min(start + chunk_size, size) - 1)
+            stop = size if newline < 0 else newline + 1
+            chunks.append((start, stop))
+            start = stop
+    return chunks
+
+
+def __validate_chunk__(path: str, start: int, stop: int, checker: Checker, errors: int, config: Config) -> ChunkReport:
+    # Runs in workers
+    __config__.set(config)
+    __parallel__.set(None)
+    report = ChunkReport(start)
+    decode = json.JSONDecoder().decode
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        position = start
+        while position < stop:
+            newline = data.find(b"\n", position, stop)
+            end = stop if newline < 0 else newline + 1
+            line = data[position:end]
+            position = end
+            report.lines += 1
+            if line.isspace() or len(line) == 0:
+                continue
+            report.records += 1
+            try:
+                record = decode(line.decode())
+            except ValueError as e:  # Including UnicodeDecodeError
+                reason = f"invalid JSON: {e}"
+            else:
+                if __run__(checker, record, Chain(type(record).__name__)) is None:
+                    continue
+                # Checked again for the reason, failures are the rare case
+                reason = type_check(record, checker).reason
+            report.failures += 1
+            if len(report.errors) < errors:
+                report.errors.append((report.lines, reason))
+    return report
+
+
+def validate(
+    path: str,
+    t: type,
+    *,
+    workers: int | None = None,
+    chunk_size: int = 32 << 20,
+    errors: int = 5,
+) -> ValidationReport:
+    """
+    ## Type check each record of a JSON Lines file
+
+    Records are streamed from a memory mapped file, in chunks of about
+    `chunk_size` bytes checked by a pool of `workers` processes (default:
+    one per CPU, `workers=1` checks in the calling process). Blank lines are
+    skipped, lines that are not valid JSON count as failures. The report
+    keeps the first `errors` failure reasons of each chunk.
+
+    ### Usage:
+
+    ```
+    report = validate("dump.jsonl", dict[str, int | str | None])
+    print(report)         # dump.jsonl: 1000000 records, 2 failing, 96.4 MB in ...
+    report.errors         # [(1234, "dict['id'] = str('1234') is not int"), ...]
+    ```
+    """
+    began = time.perf_counter()
+    checker = compile(t)
+    report = ValidationReport(path, checker.hint, os.path.getsize(path))
+    chunks = __boundaries__(path, chunk_size)
+    config = current()
+    workers = workers or os.cpu_count()
+    if workers == 1 or len(chunks) <= 1:
+        reports = [__validate_chunk__(path, start, stop, checker, errors, config) for start, stop in chunks]
+    else:
+        with ProcessPoolExecutor(min(workers, len(chunks))) as executor:
+            tasks = [executor.submit(__validate_chunk__, path, start, stop, checker, errors, config) for start, stop in chunks]
+            reports = [task.result() for task in tasks]
+    lines = 0
+    for chunk in reports:
+        report.records += chunk.records
+        report.failures += chunk.failures
+        report.errors.extend((lines + line, reason) for line, reason in chunk.errors)
+        lines += chunk.lines
+    report.seconds = time.perf_counter() - began
+    return report
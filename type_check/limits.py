@@ -0,0 +1,90 @@
+import time
+from contextvars import ContextVar
+from contextlib import contextmanager
+
+# Limits that may cut a check short, in reporting order
+LIMITS = ("depth", "elements", "deadline")
+
+# Elements checked between two reads of the clock
+CLOCK_INTERVAL = 64
+
+
+class Limits:
+    """
+    Bounds on the cost of the checks within a `check_limits()` context, and
+    the limits hit so far. Levels are counted from the checked object (level
+    1), its elements, items or attributes are at level 2, and so on.
+    """
+
+    __slots__ = ("max_depth", "max_elements", "deadline", "elements", "clock", "stopped", "hit")
+
+    def __init__(self, max_depth: int | None = None, max_elements: int | None = None, deadline: float | None = None):
+        if max_depth is not None and max_depth < 1:
+            raise ValueError(f"max_depth must be at least 1, got {max_depth}")
+        if max_elements is not None and max_elements < 1:
+            raise ValueError(f"max_elements must be at least 1, got {max_elements}")
+        self.max_depth = max_depth
+        self.max_elements = max_elements
+        # Absolute time (perf_counter) after which checks stop
+        self.deadline = None if deadline is None else time.perf_counter() + deadline
+        # Elements visited so far, and count at which the clock is read next
+        self.elements = 0
+        self.clock = 0
+        # Limit that stopped all checks ("elements" or "deadline"), if any
+        self.stopped: str | None = None
+        self.hit = set[str]()
+
+    def exceeded(self, size: int) -> bool:
+        """Counts size more elements, True once the budget or the deadline is exceeded"""
+        if self.stopped is not None:
+            self.hit.add(self.stopped)
+            return True
+        self.elements += size
+        if self.max_elements is not None and self.elements > self.max_elements:
+            self.stop("elements")
+            return True
+        if self.deadline is not None and self.elements >= self.clock:
+            self.clock = self.elements + CLOCK_INTERVAL
+            if time.perf_counter() > self.deadline:
+                self.stop("deadline")
+                return True
+        return False
+
+    def stop(self, limit: str):
+        self.stopped = limit
+        self.hit.add(limit)
+
+    def reached(self) -> tuple[str, ...]:
+        return tuple(limit for limit in LIMITS if limit in self.hit)
+
+
+# None means checks are not limited
+__limits__ = ContextVar[Limits | None]("limits", default=None)
+
+
+@contextmanager
+def check_limits(max_depth: int | None = None, max_elements: int | None = None, deadline: float | None = None):
+    """
+    ## Bound the cost of all type checks within the context
+
+    - `max_depth`: levels checked, objects nested deeper pass unchecked
+    - `max_elements`: elements visited, checks stop once exceeded
+    - `deadline`: seconds from entering the context, checks stop afterwards
+
+    Checks cut short pass unless a failure was found before, their results
+    are marked partial and name the limits hit. Budgets are shared by all
+    checks within the context.
+
+    ### Usage:
+
+    ```
+    with check_limits(max_elements=10_000, deadline=0.005) as limits:
+        type_assert(payload, dict[str, list[Record]])
+    limits.reached()  # ("elements",) if the payload was not fully checked
+    ```
+    """
+    token = __limits__.set(Limits(max_depth, max_elements, deadline))
+    try:
+        yield __limits__.get()
+    finally:
+        __limits__.reset(token)
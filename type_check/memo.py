@@ -0,0 +1,149 @@
+import threading
+from collections import OrderedDict
+from contextvars import ContextVar
+from contextlib import contextmanager
+from dataclasses import dataclass, fields, is_dataclass
+from enum import Enum
+from typing import Hashable
+from weakref import ref
+
+# Exact types whose instances are immutable and compare by value
+IMMUTABLE_TYPES = frozenset((int, float, complex, str, bytes, bool, type(None)))
+
+# Objects exposing this attribute are memoized by identity, and re-checked
+# whenever the counter changes (i.e. the object was mutated)
+VERSION_ATTR = "__version__"
+
+
+@dataclass
+class MemoStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+
+class Memo:
+    """
+    Bounded LRU cache of type check verdicts.
+
+    - Hashable immutables (scalars, tuples and frozensets of them) are keyed
+      by value, tagged with their types so that `1`, `1.0` and `True` differ.
+    - Frozen dataclasses (whose fields are immutable too) and objects exposing
+      a version counter are keyed by weak identity, the latter are re-checked
+      once the version changes.
+
+    A memo may be shared by threads, each lookup or store holds its lock.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.entries = OrderedDict[Hashable, tuple]()
+        self.stats = MemoStats()
+        self.lock = threading.Lock()
+
+    def key(self, obj, hint) -> Hashable | None:
+        """Cache key for (obj, hint), None if obj cannot be memoized"""
+        key = immutable_key(obj)
+        if key is not None:
+            key = (key, hint)
+        elif is_frozen_dataclass(obj) or hasattr(obj, VERSION_ATTR):
+            key = (id(obj), hint)
+        else:
+            return None
+        try:
+            hash(key)
+        except TypeError:  # Unhashable type hint
+            return None
+        return key
+
+    def lookup(self, key: Hashable, obj):
+        """Cached verdict for key, None on cache miss"""
+        # Read the version first, getattr() may run arbitrary code
+        version = getattr(obj, VERSION_ATTR, None)
+        with self.lock:
+            entry = self.entries.get(key, None)
+            if entry is not None:
+                weak, stored, verdict = entry
+                if weak is None or weak() is obj and stored == version:
+                    self.entries.move_to_end(key)
+                    self.stats.hits += 1
+                    return verdict
+            self.stats.misses += 1
+            return None
+
+    def store(self, key: Hashable, obj, verdict):
+        if immutable_key(obj) is not None:
+            entry = (None, None, verdict)
+        else:
+            try:
+                entry = (ref(obj), getattr(obj, VERSION_ATTR, None), verdict)
+            except TypeError:  # Not weak referenceable
+                return
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.stats.evictions += 1
+            self.stats.size = len(self.entries)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.stats = MemoStats()
+
+
+def immutable_key(obj) -> Hashable | None:
+    cls = type(obj)
+    if cls in IMMUTABLE_TYPES or isinstance(obj, Enum):
+        return (cls, obj)
+    if cls is tuple or cls is frozenset:
+        items = list[Hashable]()
+        for item in obj:
+            key = immutable_key(item)
+            if key is None:
+                return None
+            items.append(key)
+        return (cls, cls(items))
+    return None
+
+
+def is_frozen_dataclass(obj) -> bool:
+    """Frozen dataclass whose fields hold immutables or such dataclasses only"""
+    params = getattr(type(obj), "__dataclass_params__", None)
+    if params is None or not params.frozen or not is_dataclass(obj):
+        return False
+    # Frozen fields may still hold mutable containers, e.g. F(xs=[1])
+    for field in fields(obj):
+        value = getattr(obj, field.name)
+        if immutable_key(value) is None and not is_frozen_dataclass(value):
+            return False
+    return True
+
+
+# Memo in effect for the current context, None means no memoization
+__memo__ = ContextVar[Memo | None]("memo", default=None)
+
+
+@contextmanager
+def memoize(memo: Memo | None = None):
+    """
+    ## Memoize type check verdicts within the context
+
+    ### Usage:
+
+    ```
+    with memoize(Memo(maxsize=1024)) as memo:
+        type_check(config, Config)
+        type_check(config, Config)  # Cache hit
+    memo.stats  # MemoStats(hits=1, misses=1, evictions=0, size=1)
+    ```
+    """
+    if memo is None:
+        memo = Memo()
+    token = __memo__.set(memo)
+    try:
+        yield memo
+    finally:
+        __memo__.reset(token)
@@ -0,0 +1,153 @@
+from .primitives import Chain
+from .core import resolve_checker, compile, Checker, Failure, __parallel__
+from .builtin_checks import sequence_check, dict_check
+from .policy import __sampling__
+from .settings import Config, current, __config__
+
+# Parallel checks of one huge container (list, tuple or dict)
+# Elements are split into chunks of consecutive indices, scanned by a pool of
+# threads (for free-threaded builds) or processes. Workers only report the
+# index of the first failing element in their chunk, the failure is then
+# rebuilt from the lowest failing index, so paths match serial checks exactly.
+import os
+import sys
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
+from contextvars import copy_context
+from typing import Literal, Sequence
+
+
+class Parallel:
+    """Pool and chunking in effect within a `parallel()` context"""
+
+    def __init__(self, executor: Executor, chunk_size: int, min_size: int):
+        self.executor = executor
+        # Elements per task, process pools pickle one chunk per task
+        self.chunk_size = chunk_size
+        # Containers smaller than this are checked serially
+        self.min_size = min_size
+        # Process pools exist only once their module is imported, which pulls in multiprocessing
+        process = sys.modules.get("concurrent.futures.process", None)
+        self.processes = process is not None and isinstance(executor, process.ProcessPoolExecutor)
+
+    def run(self, checker: Checker, obj, chain: Chain) -> None | Failure:
+        """Checks obj in parallel, returns NotImplemented if it does not apply"""
+        if __sampling__.get() is not None:  # Sampled checks are cheap enough
+            return NotImplemented
+        if type(obj) not in (list, tuple, dict) or len(obj) < self.min_size:
+            return NotImplemented
+        if not isinstance(obj, checker.origin):
+            return NotImplemented
+        check = resolve_checker(checker.origin)
+        if check is sequence_check and isinstance(obj, (list, tuple)) and len(checker.args) == 1:
+            items = obj
+            checkers = (compile(checker.args[0]), None)
+        elif check is dict_check and isinstance(obj, dict) and len(checker.args) == 2:
+            items = list(obj.items())
+            checkers = tuple(map(compile, checker.args))
+        else:
+            return NotImplemented
+        if all(c is None or c.classes is not None for c in checkers):
+            # Plain isinstance() checks are bulk scanned faster than shipped
+            return NotImplemented
+        index = self.scan(items, checkers)
+        if index is None:
+            return
+        failure = __failure_at__(items, index, checkers, chain)
+        # Passes on second thought (e.g. mutated meanwhile), check serially
+        return NotImplemented if failure is None else failure
+
+    def scan(self, items: Sequence, checkers: tuple) -> int | None:
+        """Lowest index of a failing element, None if all pass"""
+        tasks = list[tuple[int, Future]]()
+        config = current()
+        for start in range(0, len(items), self.chunk_size):
+            stop = min(start + self.chunk_size, len(items))
+            if self.processes:
+                task = self.executor.submit(__scan__, items[start:stop], 0, stop - start, *checkers, config)
+            else:
+                task = self.executor.submit(copy_context().run, __scan__, items, start, stop, *checkers, config)
+            tasks.append((start, task))
+        try:
+            # Chunks are awaited in order, earlier chunks passed on failure
+            for start, task in tasks:
+                index = task.result()
+                if index is not None:
+                    return start + index if self.processes else index
+        finally:
+            for _, task in tasks:
+                task.cancel()
+
+
+def __scan__(items: Sequence, start: int, stop: int, key: Checker, value: Checker | None, config: Config) -> int | None:
+    # Runs in workers, only the index of the first failure is sent back
+    __config__.set(config)
+    __parallel__.set(None)  # Nested checks run serially
+    chain = Chain("")
+    for i in range(start, stop):
+        item = items[i]
+        if value is None:
+            failure = key.__check__(item, chain)
+        else:
+            failure = key.__check__(item[0], chain)
+            if failure is None:
+                failure = value.__check__(item[1], chain)
+        if failure is not None:
+            return i
+
+
+def __failure_at__(items: Sequence, index: int, checkers: tuple, chain: Chain) -> Failure | None:
+    # Same failure as reported by sequence_check() and dict_check()
+    key, value = checkers
+    item = items[index]
+    if value is None:
+        failure = key.__check__(item, chain)
+        return None if failure is None else failure.within(Chain.Key(index))
+    failure = key.__check__(item[0], chain)
+    if failure is not None:
+        return failure.within("<key>")
+    failure = value.__check__(item[1], chain)
+    return None if failure is None else failure.within(Chain.Key(item[0]))
+
+
+@contextmanager
+def parallel(
+    workers: int | None = None,
+    executor: Literal["thread", "process"] | Executor = "thread",
+    chunk_size: int = 10_000,
+    min_size: int | None = None,
+):
+    """
+    ## Check huge containers in parallel within the context
+
+    Top-level `list[T]`, `tuple[T]` and `dict[K, V]` checks with at least
+    `min_size` (default: 2 chunks) elements are split into chunks checked by
+    a pool of `workers` threads or processes. Threads only run in parallel on
+    free-threaded builds. Processes require picklable elements and type hints.
+    An existing executor may be passed instead, it is not shut down on exit.
+
+    ### Usage:
+
+    ```
+    with parallel(workers=8, executor="process"):
+        type_assert(rows, list[Record])
+    ```
+    """
+    owned = not isinstance(executor, Executor)
+    if executor == "thread":
+        from concurrent.futures import ThreadPoolExecutor
+
+        executor = ThreadPoolExecutor(workers or os.cpu_count())
+    elif executor == "process":
+        from concurrent.futures import ProcessPoolExecutor
+
+        executor = ProcessPoolExecutor(workers or os.cpu_count())
+    elif owned:
+        raise ValueError(f"Unknown executor {repr(executor)}")
+    token = __parallel__.set(Parallel(executor, chunk_size, min_size or 2 * chunk_size))
+    try:
+        yield executor
+    finally:
+        __parallel__.reset(token)
+        if owned:
+            executor.shutdown(cancel_futures=True)
@@ -0,0 +1,131 @@
+from contextvars import ContextVar
+from contextlib import contextmanager
+from itertools import islice
+from random import Random
+from typing import Iterable, Iterator
+
+
+class Policy:
+    """
+    Decides which elements of a homogeneous container (`list[T]`, `set[T]`,
+    `dict[K, V]`, ...) are checked. Subclasses implement `indices()`.
+    """
+
+    def indices(self, size: int) -> range | list[int]:
+        """Ascending indices of the elements to check, out of `size` elements"""
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        args = ", ".join(f"{k}={repr(v)}" for k, v in vars(self).items())
+        return f"{self.__class__.__name__}({args})"
+
+
+class Full(Policy):
+    """Check every element (default)"""
+
+    def indices(self, size: int) -> range:
+        return range(size)
+
+
+class First(Policy):
+    """Check the first n elements"""
+
+    def __init__(self, n: int):
+        self.n = n
+
+    def indices(self, size: int) -> range:
+        return range(min(self.n, size))
+
+
+class Last(Policy):
+    """Check the last n elements"""
+
+    def __init__(self, n: int):
+        self.n = n
+
+    def indices(self, size: int) -> range:
+        return range(max(size - self.n, 0), size)
+
+
+class Stride(Policy):
+    """Check every step-th element, starting from offset"""
+
+    def __init__(self, step: int, offset: int = 0):
+        self.step = step
+        self.offset = offset
+
+    def indices(self, size: int) -> range:
+        return range(min(self.offset, size), size, self.step)
+
+
+class RandomK(Policy):
+    """Check k randomly chosen elements, reproducible if seed is given"""
+
+    def __init__(self, k: int, seed: int | None = None):
+        self.k = k
+        self.seed = seed
+
+    def indices(self, size: int) -> range | list[int]:
+        if size <= self.k:
+            return range(size)
+        return sorted(Random(self.seed).sample(range(size), self.k))
+
+
+class Sampling:
+    """
+    Policy in effect for one check, records whether any element was skipped.
+    """
+
+    __slots__ = ("policy", "exhaustive")
+
+    def __init__(self, policy: Policy):
+        self.policy = policy
+        self.exhaustive = True
+
+    def select(self, size: int) -> range | list[int]:
+        indices = self.policy.indices(size)
+        if len(indices) < size:
+            self.exhaustive = False
+        return indices
+
+
+# None means every element is checked
+__sampling__ = ContextVar[Sampling | None]("sampling", default=None)
+
+
+@contextmanager
+def check_policy(policy: Policy | None):
+    """
+    ## Apply a check policy to all type checks within the context
+
+    ### Usage:
+
+    ```
+    with check_policy(RandomK(100, seed=0)) as sampling:
+        type_assert(rows, list[Record])
+    sampling.exhaustive  # False if any element was skipped
+    ```
+    """
+    if policy is None or isinstance(policy, Full):
+        token = __sampling__.set(None)
+    else:
+        token = __sampling__.set(Sampling(policy))
+    try:
+        yield __sampling__.get()
+    finally:
+        __sampling__.reset(token)
+
+
+def pick(iterable: Iterable, indices: range | list[int]) -> Iterator:
+    """Select elements at ascending indices from a non-indexable iterable"""
+    if isinstance(indices, range):
+        return islice(iterable, indices.start, indices.stop, indices.step)
+    return __pick__(iter(iterable), indices)
+
+
+def __pick__(iterator: Iterator, indices: list[int]) -> Iterator:
+    position = 0
+    for index in indices:
+        item = next(islice(iterator, index - position, None))
+        position = index + 1
+        yield item
@@ -1,5 +1,13 @@
 from dataclasses import dataclass
+from typing import Iterable, Literal
 from typing import _type_repr as type_repr
+from itertools import islice
+from weakref import ref
+import reprlib
+
+# Maximum length of a value's repr in error messages and result summaries,
+# longer reprs are truncated (containers are cut after a few items)
+REPR_BUDGET = 200
 
 
 class Chain:
@@ -7,13 +15,34 @@ class Chain:
         self.value = item
         self.parent = parent
 
-    def __call__(self, el: "str | Attr | Key"):
+    def __call__(self, el: "str | Attr | Key | Arg"):
         return self.__class__(el, parent=self)
     
     def __iter__(self):
-        if self.parent is not None:
-            yield from self.parent
-        yield self.value
+        # Iterative, chains of deeply nested data may exceed the recursion limit
+        items = list()
+        node = self
+        while node is not None:
+            items.append(node.value)
+            node = node.parent
+        return reversed(items)
+
+    def graft(self, anchor: "Chain", items: "Iterable[str | Chain.Attr | Chain.Key]") -> "Chain":
+        """
+        Rebuild this chain with items inserted right after anchor.
+        Falls back to the root of this chain if anchor is not an ancestor.
+        """
+        below = []
+        node = self
+        while node is not anchor and node.parent is not None:
+            below.append(node.value)
+            node = node.parent
+        chain = node
+        for item in items:
+            chain = chain(item)
+        for item in reversed(below):
+            chain = chain(item)
+        return chain
 
     @dataclass
     class Key:
@@ -29,35 +58,152 @@ class Chain:
         def __str__(self) -> str:
             return f".{str(self.attr)}"
 
+    @dataclass
+    class Arg:
+        arg: str
+
+        def __str__(self) -> str:
+            return f"({self.arg})"
+
 
 class TypeCheckError(TypeError):
     value: object
     type_to_check: type
 
     def __init__(self, chain: Chain, expected: list[type], got: object):
-        _exp = " | ".join((type_repr(t) for t in expected))
-        _got = f"{type(got).__name__}({repr(got)})"
-        if chain.parent is None:
-            super().__init__(f"{_got} is not {_exp}")
+        super().__init__()
+        self.chain = chain
+        # Keys and attributes passed through while unwinding, innermost first
+        self.trail = list[str | Chain.Attr | Chain.Key]()
+        self.expected = expected
+        self.got = got
+        # Rendered upon first use, see __str__()
+        self.message: str | None = None
+
+    def __message__(self) -> str:
+        exp = " | ".join((type_repr(t) for t in self.expected))
+        got = f"{type(self.got).__name__}({budget_repr(self.got)})"
+        if self.chain.parent is None:
+            return f"{got} is not {exp}"
         else:
-            desc = "".join(map(str, chain))
-            super().__init__(f"{desc} = {_got} is not {_exp}")
-    
+            desc = "".join(map(str, self.chain))
+            return f"{desc} = {got} is not {exp}"
+
+    def __str__(self) -> str:
+        if self.message is None:
+            self.message = self.__message__()
+        return self.message
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({repr(str(self))})"
+
+    @property
+    def args(self) -> tuple[str]:
+        return (str(self),)
+
+    def within(self, item: str | Chain.Attr | Chain.Key) -> "TypeCheckError":
+        """
+        Record the key or attribute this error passed through while unwinding.
+        Containers call this only on failure, so passing checks allocate no chain.
+        """
+        self.trail.append(item)
+        return self
+
+    def __locate__(self, anchor: Chain):
+        # Materialize recorded trail into the chain, right below anchor
+        if self.trail:
+            self.chain = self.chain.graft(anchor, reversed(self.trail))
+            self.trail.clear()
+            self.message = None
+
+    def error(self) -> "TypeCheckError":
+        return self
+
     @property
     def result(self):
-        return TypeCheckResult(self.value, self.type_to_check, False, str(self))
+        return TypeCheckResult(self.value, self.type_to_check, False, self)
+
+
+class Mismatch:
+    """
+    Failure returned (instead of raised) by compiled checks. Nothing is
+    formatted until it reaches the public boundary, where it is raised as a
+    TypeCheckError. Failures of union arms are thus cheap to discard.
+    """
+
+    __slots__ = ("chain", "expected", "got", "trail")
+
+    def __init__(self, chain: Chain, expected: list[type], got: object):
+        self.chain = chain
+        self.expected = expected
+        self.got = got
+        # Keys and attributes passed through while returning, innermost first
+        self.trail = list[str | Chain.Attr | Chain.Key]()
+
+    def within(self, item: str | Chain.Attr | Chain.Key) -> "Mismatch":
+        """Same as TypeCheckError.within()"""
+        self.trail.append(item)
+        return self
+
+    def error(self) -> TypeCheckError:
+        e = TypeCheckError(self.chain, self.expected, self.got)
+        e.trail.extend(self.trail)
+        return e
+
+
+# What a TypeCheckResult keeps of the checked value:
+# - "value": the value itself (default)
+# - "weak": a weak reference if supported, a summary otherwise
+# - "summary": type and truncated repr only
+Retain = Literal["value", "weak", "summary"]
 
 
-@dataclass
 class TypeCheckResult:
-    value: object
-    type_to_check: type
+    __slots__ = ("value", "type_to_check", "passed", "exhaustive", "limits", "__reason__")
 
-    passed: bool
-    reason: str | None
+    def __init__(
+        self,
+        value: object,
+        type_to_check: type,
+        passed: bool,
+        reason: str | TypeCheckError | None,
+        exhaustive: bool = True,
+        limits: tuple[str, ...] = (),
+    ):
+        self.value = value
+        self.type_to_check = type_to_check
+        self.passed = passed
+        # False if a check policy or a limit skipped some container elements
+        self.exhaustive = exhaustive
+        # Limits that cut the check short ("depth", "elements", "deadline")
+        self.limits = limits
+        # Failures are rendered upon first access, see reason
+        self.__reason__ = reason
+
+    @property
+    def partial(self) -> bool:
+        """True if check_limits() cut the check short"""
+        return len(self.limits) > 0
+
+    @property
+    def reason(self) -> str | None:
+        if isinstance(self.__reason__, TypeCheckError):
+            self.__reason__ = str(self.__reason__)
+        return self.__reason__
+
+    def retain(self, retain: Retain) -> "TypeCheckResult":
+        """Drop strong references to the checked value, see Retain"""
+        if retain != "value":
+            # The pending failure refers to (part of) the value as well
+            self.reason
+            self.value = Summary(self.value, weak=retain == "weak")
+        return self
 
     def __str__(self) -> str:
-        return f"{repr(self.value)} is {type_repr(self.type_to_check)} => {self.passed}"
+        result = f"{budget_repr(self.value)} is {type_repr(self.type_to_check)} => {self.passed}"
+        if self.partial:
+            return f"{result} (partial: {', '.join(self.limits)})"
+        return result if self.exhaustive else f"{result} (sampled)"
 
     def __repr__(self) -> str:
         return f"type_check({self})"
@@ -70,3 +216,74 @@ class TypeCheckResult:
 
     def __neq__(self, value):
         return bool(self) != value
+
+
+class Summary:
+    """
+    Stand-in for a value not retained by TypeCheckResult. Holds a weak
+    reference if requested and supported, a truncated repr otherwise.
+    """
+
+    __slots__ = ("type", "ref", "text")
+
+    def __init__(self, obj, weak: bool = False):
+        self.type = type(obj)
+        self.ref = None
+        self.text = None
+        if weak:
+            try:
+                self.ref = ref(obj)
+            except TypeError:  # Not weak referenceable (e.g. list, dict, int)
+                pass
+        if self.ref is None:
+            self.text = budget_repr(obj)
+
+    def get(self):
+        """The value if still alive, None otherwise"""
+        return None if self.ref is None else self.ref()
+
+    def __repr__(self) -> str:
+        if self.text is not None:
+            return self.text
+        obj = self.ref()
+        if obj is None:
+            return f"<{self.type.__name__} (released)>"
+        return budget_repr(obj)
+
+
+class BudgetRepr(reprlib.Repr):
+    """reprlib.Repr that keeps dict and set iteration order"""
+
+    def __init__(self, budget: int):
+        super().__init__()
+        self.maxlevel = 4
+        self.maxtuple = self.maxlist = self.maxarray = self.maxdeque = 16
+        self.maxset = self.maxfrozenset = self.maxdict = 16
+        self.maxstring = self.maxlong = self.maxother = budget
+
+    def repr_array(self, x, level):
+        return repr(x) if len(x) <= self.maxarray else super().repr_array(x, level)
+
+    def repr_set(self, x, level):
+        return self._repr_iterable(x, level, "{", "}", self.maxset) if x else "set()"
+
+    def repr_frozenset(self, x, level):
+        return self._repr_iterable(x, level, "frozenset({", "})", self.maxfrozenset) if x else "frozenset()"
+
+    def repr_dict(self, x, level):
+        if len(x) == 0:
+            return "{}"
+        if level <= 0:
+            return "{" + self.fillvalue + "}"
+        pieces = [f"{self.repr1(k, level - 1)}: {self.repr1(v, level - 1)}" for k, v in islice(x.items(), self.maxdict)]
+        if len(x) > self.maxdict:
+            pieces.append(self.fillvalue)
+        return "{" + ", ".join(pieces) + "}"
+
+
+def budget_repr(obj) -> str:
+    """repr(obj) truncated to REPR_BUDGET characters"""
+    text = BudgetRepr(REPR_BUDGET).repr(obj)
+    if len(text) > REPR_BUDGET:
+        text = text[: REPR_BUDGET - 3] + "..."
+    return text
@@ -0,0 +1,74 @@
+from contextvars import ContextVar
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from typing import Literal
+
+from .primitives import Retain
+
+# How nested data is walked:
+# - "recursive": one Python call per nesting level (fastest)
+# - "iterative": explicit work stack, checks data nested at any depth
+# - "auto": recursive, falls back to iterative upon hitting the recursion limit
+Engine = Literal["recursive", "iterative", "auto"]
+
+
+@dataclass(frozen=True)
+class Config:
+    # By default, raise TypeError (not TypeCheckError) upon encountering objects
+    # that do not support type check (e.g. frozenset, which would be consumed)
+    # Otherwise, type check will skip such objects
+    strict: bool = True
+    # If True, type check will raise TypeCheckError upon missing attribute
+    # i.e. an attribute declared in type hint but not present in object
+    check_missing_attr: bool = False
+    # What results of type_check() keep of the checked value, see Retain.
+    # Use "weak" or "summary" to avoid keeping large payloads alive.
+    retain: Retain = "value"
+    engine: Engine = "auto"
+
+
+# Process-wide defaults, see configure()
+__default__ = Config()
+
+# Configuration in effect for the current context, None means the defaults
+__config__ = ContextVar[Config | None]("config", default=None)
+
+
+def current() -> Config:
+    """Configuration in effect for the current context"""
+    config = __config__.get()
+    return __default__ if config is None else config
+
+
+@contextmanager
+def config(**options):
+    """
+    ## Override configuration within the context
+
+    Only affects the current thread or asyncio task (and tasks created
+    within the context), other threads and tasks keep their configuration.
+
+    ### Usage:
+
+    ```
+    with config(strict=False, check_missing_attr=True) as cfg:
+        type_check(payload, Payload)
+    ```
+    """
+    token = __config__.set(replace(current(), **options))
+    try:
+        yield __config__.get()
+    finally:
+        __config__.reset(token)
+
+
+def configure(**options) -> Config:
+    """
+    ## Change process-wide defaults, e.g. at startup
+
+    Applies to all threads and tasks, except within `config()` contexts
+    opened before the change.
+    """
+    global __default__
+    __default__ = replace(__default__, **options)
+    return __default__
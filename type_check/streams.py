@@ -0,0 +1,123 @@
+from .primitives import Chain
+from .core import register_checker, wrappers, compile, Checker, Failure, __failure__
+
+# Checkers for iterators and generators
+# One-shot iterators cannot be checked without consuming them. Only their type
+# is checked upon type_assert(), which then returns a wrapper that checks each
+# item as it is consumed, in constant memory.
+from typing import Any
+from collections.abc import Iterable, Iterator, Generator
+
+
+def iterable_check(obj: Iterable, typ: Checker | None = None, *, chain: Chain) -> None | Failure:
+    if typ is None or isinstance(obj, Iterator):
+        # Items are checked lazily, see wrap_iterator()
+        return
+    # Re-iterable container, items can be checked in place
+    check = typ.__check__
+    for i, el in enumerate(obj):
+        failure = check(el, chain)
+        if failure is not None:
+            return failure.within(Chain.Key(i))
+
+
+def stream_check(obj: Iterator, *args: Checker, chain: Chain) -> None:
+    # Items are checked lazily, see wrap_iterator() and wrap_generator()
+    return
+
+
+register_checker(Iterable, iterable_check)
+register_checker(Iterator, stream_check)
+register_checker(Generator, stream_check)
+
+
+class CheckedIterator(Iterator):
+    """
+    Iterator that checks each item as it is consumed. Failures are reported
+    with the index of the offending item, e.g. `generator[3] = ...`.
+    """
+
+    __slots__ = ("iterator", "item_type", "chain", "count")
+
+    def __init__(self, iterator: Iterator, item_type: Checker | None, chain: Chain):
+        self.iterator = iterator
+        self.item_type = item_type
+        self.chain = chain
+        # Number of items consumed so far
+        self.count = 0
+
+    def __next__(self):
+        return self.__item__(next(self.iterator))
+
+    def __item__(self, item):
+        i = self.count
+        self.count += 1
+        __check__(item, self.item_type, self.chain, Chain.Key(i))
+        return item
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({repr(self.iterator)})"
+
+
+class CheckedGenerator(CheckedIterator, Generator):
+    """
+    Generator that checks yielded items, values passed to `send()`, and the
+    return value (`Generator[Y, S, R]`).
+    """
+
+    __slots__ = ("send_type", "return_type")
+
+    def __init__(self, generator: Generator, item_type: Checker | None, send_type: Checker | None, return_type: Checker | None, chain: Chain):
+        super().__init__(generator, item_type, chain)
+        self.send_type = send_type
+        self.return_type = return_type
+
+    def __next__(self):
+        return self.__resume__(next, self.iterator)
+
+    def send(self, value):
+        __check__(value, self.send_type, self.chain, Chain.Attr("send"))
+        return self.__resume__(self.iterator.send, value)
+
+    def throw(self, *args):
+        return self.__resume__(self.iterator.throw, *args)
+
+    def close(self):
+        self.iterator.close()
+
+    def __resume__(self, resume, *args):
+        try:
+            item = resume(*args)
+        except StopIteration as stop:
+            __check__(stop.value, self.return_type, self.chain, Chain.Attr("return"))
+            raise
+        return self.__item__(item)
+
+
+def __check__(obj, typ: Checker | None, chain: Chain, key: Chain.Key | Chain.Attr):
+    if typ is None:
+        return
+    failure = typ.__check__(obj, chain)
+    if failure is not None:
+        raise __failure__(failure.within(key).error(), obj, typ.hint, chain)
+
+
+def __compile_arg__(hint) -> Checker | None:
+    return None if hint is Any else compile(hint)
+
+
+def wrap_iterator(obj, checker: Checker, chain: Chain):
+    if not isinstance(obj, Iterator) or len(checker.args) == 0:
+        return obj
+    return CheckedIterator(obj, __compile_arg__(checker.args[0]), chain)
+
+
+def wrap_generator(obj: Generator, checker: Checker, chain: Chain):
+    # Send and return types default to None, e.g. Generator[int] (Python 3.13+)
+    hints = (checker.args + (None, None, None))[:3] if len(checker.args) > 0 else (Any, Any, Any)
+    return CheckedGenerator(obj, *map(__compile_arg__, hints), chain)
+
+
+wrappers[Iterable] = wrap_iterator
+wrappers[Iterator] = wrap_iterator
+wrappers[Generator] = wrap_generator